@@ -17,14 +17,6 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
-try:
-    from wordcloud import WordCloud
-    WORDCLOUD_AVAILABLE = True
-except ImportError:
-    WORDCLOUD_AVAILABLE = False
-    WordCloud = None
 from collections import Counter
 
 # Get project root directory
@@ -32,13 +24,15 @@ PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 # Add project root to path so we can import src module
 sys.path.insert(0, PROJECT_ROOT)
 
-from src.config import DATA_PATH, DATA_TEST_SIZE, SENTIMENT_MAP, SENTIMENT_LABELS
-from src.data_processing import (
-    load_data, split_data, preprocess_data, encode_sentiments,
-    process_token_lengths, prepare_data_for_training
-)
+from src.config import DATA_PATH, SENTIMENT_MAP, SENTIMENT_LABELS
+from src.aggregates import dataset_version, frame_counts
+from src.token_index import word_cloud_frequencies
 from src.text_cleaning import clean_texts
-from src.models import train_naive_bayes
+from src.dashboard_data import (
+    load_frames, load_page_aggregates, load_token_index, load_length_histogram,
+    load_length_index, load_dashboard_model, current_model_version, wordcloud_stopwords,
+    show_word_cloud, length_box_figure, length_violin_figure
+)
 
 # Page configuration
 st.set_page_config(
@@ -274,32 +268,8 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Cache data loading
-@st.cache_data
-def load_and_preprocess_data():
-    """Load and preprocess data with caching."""
-    try:
-        # Load data from single CSV file
-        df = load_data(DATA_PATH)
-        
-        # Split into train and test sets
-        df_train, df_test = split_data(df, test_size=DATA_TEST_SIZE)
-        
-        # Preprocess
-        df_processed, df_test_processed = preprocess_data(df_train.copy(), df_test.copy())
-        df_processed, df_test_processed = encode_sentiments(df_processed, df_test_processed)
-        
-        return df_train, df_test, df_processed, df_test_processed
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return None, None, None, None
-
-# Load data
-df, df_test, df_processed, df_test_processed = load_and_preprocess_data()
-
-if df is None:
-    st.error("Tidak dapat memuat data. Pastikan file CSV ada di folder data/")
-    st.stop()
+# Pages read these small precomputed tables instead of the frames
+aggregates, summary, columns = load_page_aggregates()
 
 # Sidebar
 st.sidebar.markdown("""
@@ -346,7 +316,7 @@ if page == "Overview":
                     <i class="fas fa-database" style="color: #2563eb; font-size: 1.5rem; margin-right: 0.75rem;"></i>
                     <span style="font-weight: 600; color: #64748b;">Total Data Training</span>
                 </div>
-                <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{len(df):,}</div>
+                <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{summary.loc['train_raw', 'rows']:,}</div>
             </div>
         """, unsafe_allow_html=True)
     
@@ -357,7 +327,7 @@ if page == "Overview":
                     <i class="fas fa-vial" style="color: #10b981; font-size: 1.5rem; margin-right: 0.75rem;"></i>
                     <span style="font-weight: 600; color: #64748b;">Total Data Test</span>
                 </div>
-                <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{len(df_test):,}</div>
+                <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{summary.loc['test_raw', 'rows']:,}</div>
             </div>
         """, unsafe_allow_html=True)
     
@@ -368,7 +338,7 @@ if page == "Overview":
                     <i class="fas fa-spinner" style="color: #f59e0b; font-size: 1.5rem; margin-right: 0.75rem;"></i>
                     <span style="font-weight: 600; color: #64748b;">Data Setelah Preprocessing</span>
                 </div>
-                <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{len(df_processed):,}</div>
+                <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{summary.loc['train', 'rows']:,}</div>
             </div>
         """, unsafe_allow_html=True)
     
@@ -379,7 +349,7 @@ if page == "Overview":
                     <i class="fas fa-check-circle" style="color: #8b5cf6; font-size: 1.5rem; margin-right: 0.75rem;"></i>
                     <span style="font-weight: 600; color: #64748b;">Test Setelah Preprocessing</span>
                 </div>
-                <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{len(df_test_processed):,}</div>
+                <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{summary.loc['test', 'rows']:,}</div>
             </div>
         """, unsafe_allow_html=True)
     
@@ -395,6 +365,7 @@ if page == "Overview":
                 Preview Data Training
             </h3>
         """, unsafe_allow_html=True)
+        df, df_test, _, _ = load_frames()
         st.dataframe(df.head(10), width='stretch')
     
     with col2:
@@ -427,13 +398,13 @@ if page == "Overview":
         """, unsafe_allow_html=True)
         st.markdown(f"""
                 <ul style="list-style: none; padding: 0; line-height: 2;">
-                    <li><i class="fas fa-list-ol" style="color: #64748b; margin-right: 0.5rem;"></i> Jumlah baris: <strong>{len(df):,}</strong></li>
-                    <li><i class="fas fa-columns" style="color: #64748b; margin-right: 0.5rem;"></i> Jumlah kolom: <strong>{len(df.columns)}</strong></li>
-                    <li><i class="fas fa-tags" style="color: #64748b; margin-right: 0.5rem;"></i> Kolom: <strong>{', '.join(df.columns.tolist())}</strong></li>
+                    <li><i class="fas fa-list-ol" style="color: #64748b; margin-right: 0.5rem;"></i> Jumlah baris: <strong>{summary.loc['train_raw', 'rows']:,}</strong></li>
+                    <li><i class="fas fa-columns" style="color: #64748b; margin-right: 0.5rem;"></i> Jumlah kolom: <strong>{len(columns['train_raw'])}</strong></li>
+                    <li><i class="fas fa-tags" style="color: #64748b; margin-right: 0.5rem;"></i> Kolom: <strong>{', '.join(columns['train_raw'])}</strong></li>
         """, unsafe_allow_html=True)
-        if 'Date' in df.columns:
+        if 'Date' in columns['train_raw']:
             st.markdown(f"""
-                    <li><i class="fas fa-calendar-alt" style="color: #64748b; margin-right: 0.5rem;"></i> Rentang tanggal: <strong>{df['Date'].min()} hingga {df['Date'].max()}</strong></li>
+                    <li><i class="fas fa-calendar-alt" style="color: #64748b; margin-right: 0.5rem;"></i> Rentang tanggal: <strong>{summary.loc['train_raw', 'date_min']} hingga {summary.loc['train_raw', 'date_max']}</strong></li>
             """, unsafe_allow_html=True)
         st.markdown("</ul></div>", unsafe_allow_html=True)
     
@@ -446,9 +417,9 @@ if page == "Overview":
         """, unsafe_allow_html=True)
         st.markdown(f"""
                 <ul style="list-style: none; padding: 0; line-height: 2;">
-                    <li><i class="fas fa-list-ol" style="color: #64748b; margin-right: 0.5rem;"></i> Jumlah baris: <strong>{len(df_test):,}</strong></li>
-                    <li><i class="fas fa-columns" style="color: #64748b; margin-right: 0.5rem;"></i> Jumlah kolom: <strong>{len(df_test.columns)}</strong></li>
-                    <li><i class="fas fa-tags" style="color: #64748b; margin-right: 0.5rem;"></i> Kolom: <strong>{', '.join(df_test.columns.tolist())}</strong></li>
+                    <li><i class="fas fa-list-ol" style="color: #64748b; margin-right: 0.5rem;"></i> Jumlah baris: <strong>{summary.loc['test_raw', 'rows']:,}</strong></li>
+                    <li><i class="fas fa-columns" style="color: #64748b; margin-right: 0.5rem;"></i> Jumlah kolom: <strong>{len(columns['test_raw'])}</strong></li>
+                    <li><i class="fas fa-tags" style="color: #64748b; margin-right: 0.5rem;"></i> Kolom: <strong>{', '.join(columns['test_raw'])}</strong></li>
                 </ul>
             </div>
         """, unsafe_allow_html=True)
@@ -476,8 +447,8 @@ elif page == "Analisis Data":
     
     with col1:
         # Training data sentiment
-        if 'Sentiment' in df_processed.columns:
-            sentiment_counts = df_processed['Sentiment'].value_counts().sort_index()
+        if 'Sentiment' in columns['train']:
+            sentiment_counts = frame_counts(aggregates, 'sentiment_counts', 'train').set_index('Sentiment')['count']
             sentiment_labels = [SENTIMENT_LABELS[int(i)] for i in sentiment_counts.index]
             
             fig = px.pie(
@@ -494,8 +465,8 @@ elif page == "Analisis Data":
     
     with col2:
         # Test data sentiment
-        if 'Sentiment' in df_test_processed.columns:
-            sentiment_counts_test = df_test_processed['Sentiment'].value_counts().sort_index()
+        if 'Sentiment' in columns['test']:
+            sentiment_counts_test = frame_counts(aggregates, 'sentiment_counts', 'test').set_index('Sentiment')['count']
             sentiment_labels_test = [SENTIMENT_LABELS[int(i)] for i in sentiment_counts_test.index]
             
             fig = px.pie(
@@ -513,7 +484,7 @@ elif page == "Analisis Data":
     st.divider()
     
     # Tweets by date
-    if 'Date' in df.columns:
+    if 'Date' in columns['train_raw']:
         st.markdown("""
             <h3>
                 <i class="fas fa-calendar-day" style="color: #2563eb;"></i>
@@ -521,8 +492,7 @@ elif page == "Analisis Data":
             </h3>
         """, unsafe_allow_html=True)
         
-        df['Date'] = pd.to_datetime(df['Date'])
-        tweets_per_date = df['Date'].dt.strftime('%Y-%m-%d').value_counts().sort_index().reset_index()
+        tweets_per_date = aggregates['daily_counts'].copy()
         tweets_per_date.columns = ['Date', 'Count']
         
         fig = px.bar(
@@ -550,33 +520,37 @@ elif page == "Analisis Data":
     col1, col2 = st.columns(2)
     
     with col1:
-        if 'text_len' in df_processed.columns:
+        if 'text_len' in columns['train']:
             fig = px.histogram(
-                df_processed,
+                frame_counts(aggregates, 'text_len_counts', 'train'),
                 x='text_len',
+                y='count',
+                histfunc='sum',
                 nbins=30,
                 title="Distribusi Panjang Teks (Training)",
-                labels={'text_len': 'Panjang Teks (kata)', 'count': 'Jumlah'},
+                labels={'text_len': 'Panjang Teks (kata)'},
                 color_discrete_sequence=['#1f77b4']
             )
-            fig.update_layout(showlegend=False)
+            fig.update_layout(showlegend=False, yaxis_title='Jumlah')
             st.plotly_chart(fig, width='stretch')
     
     with col2:
-        if 'text_len' in df_test_processed.columns:
+        if 'text_len' in columns['test']:
             fig = px.histogram(
-                df_test_processed,
+                frame_counts(aggregates, 'text_len_counts', 'test'),
                 x='text_len',
+                y='count',
+                histfunc='sum',
                 nbins=30,
                 title="Distribusi Panjang Teks (Test)",
-                labels={'text_len': 'Panjang Teks (kata)', 'count': 'Jumlah'},
+                labels={'text_len': 'Panjang Teks (kata)'},
                 color_discrete_sequence=['#ff7f0e']
             )
-            fig.update_layout(showlegend=False)
+            fig.update_layout(showlegend=False, yaxis_title='Jumlah')
             st.plotly_chart(fig, width='stretch')
     
     # Statistics
-    if 'text_len' in df_processed.columns:
+    if 'text_len' in columns['train']:
         st.markdown("""
             <h3>
                 <i class="fas fa-chart-bar" style="color: #2563eb;"></i>
@@ -592,7 +566,7 @@ elif page == "Analisis Data":
                         <i class="fas fa-calculator" style="color: #2563eb; font-size: 1.2rem; margin-right: 0.5rem;"></i>
                         <span style="font-weight: 600; color: #64748b; font-size: 0.875rem;">Rata-rata (Training)</span>
                     </div>
-                    <div style="font-size: 1.5rem; font-weight: 700; color: #1e293b;">{df_processed['text_len'].mean():.1f} <small style="font-size: 0.875rem; color: #64748b;">kata</small></div>
+                    <div style="font-size: 1.5rem; font-weight: 700; color: #1e293b;">{summary.loc['train', 'text_len_mean']:.1f} <small style="font-size: 0.875rem; color: #64748b;">kata</small></div>
                 </div>
             """, unsafe_allow_html=True)
         with col2:
@@ -602,7 +576,7 @@ elif page == "Analisis Data":
                         <i class="fas fa-equals" style="color: #10b981; font-size: 1.2rem; margin-right: 0.5rem;"></i>
                         <span style="font-weight: 600; color: #64748b; font-size: 0.875rem;">Median (Training)</span>
                     </div>
-                    <div style="font-size: 1.5rem; font-weight: 700; color: #1e293b;">{df_processed['text_len'].median():.1f} <small style="font-size: 0.875rem; color: #64748b;">kata</small></div>
+                    <div style="font-size: 1.5rem; font-weight: 700; color: #1e293b;">{summary.loc['train', 'text_len_median']:.1f} <small style="font-size: 0.875rem; color: #64748b;">kata</small></div>
                 </div>
             """, unsafe_allow_html=True)
         with col3:
@@ -612,7 +586,7 @@ elif page == "Analisis Data":
                         <i class="fas fa-calculator" style="color: #f59e0b; font-size: 1.2rem; margin-right: 0.5rem;"></i>
                         <span style="font-weight: 600; color: #64748b; font-size: 0.875rem;">Rata-rata (Test)</span>
                     </div>
-                    <div style="font-size: 1.5rem; font-weight: 700; color: #1e293b;">{df_test_processed['text_len'].mean():.1f} <small style="font-size: 0.875rem; color: #64748b;">kata</small></div>
+                    <div style="font-size: 1.5rem; font-weight: 700; color: #1e293b;">{summary.loc['test', 'text_len_mean']:.1f} <small style="font-size: 0.875rem; color: #64748b;">kata</small></div>
                 </div>
             """, unsafe_allow_html=True)
         with col4:
@@ -622,7 +596,7 @@ elif page == "Analisis Data":
                         <i class="fas fa-equals" style="color: #8b5cf6; font-size: 1.2rem; margin-right: 0.5rem;"></i>
                         <span style="font-weight: 600; color: #64748b; font-size: 0.875rem;">Median (Test)</span>
                     </div>
-                    <div style="font-size: 1.5rem; font-weight: 700; color: #1e293b;">{df_test_processed['text_len'].median():.1f} <small style="font-size: 0.875rem; color: #64748b;">kata</small></div>
+                    <div style="font-size: 1.5rem; font-weight: 700; color: #1e293b;">{summary.loc['test', 'text_len_median']:.1f} <small style="font-size: 0.875rem; color: #64748b;">kata</small></div>
                 </div>
             """, unsafe_allow_html=True)
 
@@ -645,9 +619,9 @@ elif page == "Analisis Sentimen":
         </h3>
     """, unsafe_allow_html=True)
     
-    if 'Sentiment' in df_processed.columns and 'Sentiment' in df_test_processed.columns:
-        train_sentiment = df_processed['Sentiment'].value_counts().sort_index()
-        test_sentiment = df_test_processed['Sentiment'].value_counts().sort_index()
+    if 'Sentiment' in columns['train'] and 'Sentiment' in columns['test']:
+        train_sentiment = frame_counts(aggregates, 'sentiment_counts', 'train').set_index('Sentiment')['count']
+        test_sentiment = frame_counts(aggregates, 'sentiment_counts', 'test').set_index('Sentiment')['count']
         
         comparison_df = pd.DataFrame({
             'Sentiment': [SENTIMENT_LABELS[int(i)] for i in train_sentiment.index],
@@ -695,6 +669,7 @@ elif page == "Analisis Sentimen":
             ["All", "Negative", "Neutral", "Positive"]
         )
     
+    _, _, df_processed, _ = load_frames()
     if sentiment_filter != "All":
         sentiment_value = SENTIMENT_LABELS.index(sentiment_filter)
         filtered_df = df_processed[df_processed['Sentiment'] == sentiment_value]
@@ -757,7 +732,7 @@ elif page == "Analisis Sentimen":
     st.divider()
     
     # Word Cloud (if text_clean exists)
-    if 'text_clean' in df_processed.columns:
+    if 'text_clean' in columns['train']:
         st.markdown("""
             <h3>
                 <i class="fas fa-cloud" style="color: #2563eb;"></i>
@@ -771,30 +746,15 @@ elif page == "Analisis Sentimen":
             key="wc_sentiment"
         )
         
-        if sentiment_for_wc != "All":
-            sentiment_value_wc = SENTIMENT_LABELS.index(sentiment_for_wc)
-            texts_for_wc = df_processed[df_processed['Sentiment'] == sentiment_value_wc]['text_clean'].str.cat(sep=' ')
-        else:
-            texts_for_wc = df_processed['text_clean'].str.cat(sep=' ')
+        # Top words from the precomputed token index (no re-tokenizing per rerun)
+        sentiment_value_wc = SENTIMENT_LABELS.index(sentiment_for_wc) if sentiment_for_wc != "All" else None
+        frequencies_for_wc = word_cloud_frequencies(
+            load_token_index(dataset_version(DATA_PATH)), sentiment_value_wc,
+            max_words=100, stopwords=wordcloud_stopwords()
+        )
         
-        if texts_for_wc and len(texts_for_wc) > 0:
-            if WORDCLOUD_AVAILABLE:
-                try:
-                    wordcloud = WordCloud(
-                        width=800,
-                        height=400,
-                        background_color='white',
-                        max_words=100
-                    ).generate(texts_for_wc)
-                    
-                    fig, ax = plt.subplots(figsize=(10, 5))
-                    ax.imshow(wordcloud, interpolation='bilinear')
-                    ax.axis('off')
-                    st.pyplot(fig)
-                except Exception as e:
-                    st.warning(f"Tidak dapat membuat word cloud: {str(e)}")
-            else:
-                st.info("⚠️ WordCloud tidak tersedia. Install dengan: `pip install wordcloud`")
+        if frequencies_for_wc:
+            show_word_cloud(frequencies_for_wc)
 
 # ============================================================================
 # PAGE 4: EVALUASI MODEL
@@ -807,43 +767,13 @@ elif page == "Evaluasi Model":
         </div>
     """, unsafe_allow_html=True)
     
-    # Cache model training
-    @st.cache_data
-    def train_and_evaluate_model():
-        """Train model and return metrics."""
-        try:
-            # Prepare data for training
-            df_train_prep = df_processed.copy()
-            df_test_prep = df_test_processed.copy()
-            
-            # Process token lengths
-            from src.config import MAX_TOKEN_LENGTH
-            df_train_prep, df_test_prep = process_token_lengths(
-                df_train_prep, df_test_prep, max_length=MAX_TOKEN_LENGTH
-            )
-            
-            # Prepare data
-            (X_train, X_valid, X_test, y_train, y_valid, y_test,
-             y_train_le, y_valid_le, y_test_le) = prepare_data_for_training(
-                df_train_prep, df_test_prep
-            )
-            
-            # Train model
-            nb_model, vectorizer, tf_transformer, metrics = train_naive_bayes(
-                X_train, y_train_le, X_test, y_test_le
-            )
-            
-            return metrics, nb_model, vectorizer, tf_transformer
-        except Exception as e:
-            st.error(f"Error training model: {str(e)}")
-            return None, None, None, None
-    
-    # Train model
-    with st.spinner("Training model... Ini mungkin memakan waktu beberapa saat."):
-        metrics, model, vectorizer, tf_transformer = train_and_evaluate_model()
-    
-    if metrics is None:
-        st.error("Gagal melatih model. Silakan cek error di atas.")
+    # Model bundle for the current data + config (trained in the background when missing)
+    version = current_model_version()
+
+    try:
+        metrics = load_dashboard_model(version).metrics
+    except Exception as e:
+        st.error(f"Gagal memuat model v{version}: {str(e)}")
         st.stop()
     
     # Overall Accuracy
@@ -1149,11 +1079,9 @@ elif page == "Visualisasi Detail":
             label_visibility="collapsed"
         )
     
-    # Filter data
-    filtered_df = df_processed[
-        (df_processed['text_len'] >= min_length) & 
-        (df_processed['text_len'] <= max_length)
-    ]
+    # Filter data with the sorted text_len index (prefix sums, no full scan)
+    length_index = load_length_index(dataset_version(DATA_PATH))
+    filtered_count = length_index.count(min_length, max_length)
     
     st.markdown(f"""
         <div class="metric-card" style="margin-top: 1rem;">
@@ -1161,13 +1089,14 @@ elif page == "Visualisasi Detail":
                 <i class="fas fa-database" style="color: #2563eb; font-size: 1.5rem; margin-right: 0.75rem;"></i>
                 <span style="font-weight: 600; color: #64748b;">Jumlah Data Setelah Filter</span>
             </div>
-            <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{len(filtered_df):,}</div>
+            <div style="font-size: 2rem; font-weight: 700; color: #1e293b;">{filtered_count:,}</div>
         </div>
     """, unsafe_allow_html=True)
     
     st.divider()
     
-    # Detailed charts
+    # Detailed charts, from the precomputed length counts per sentiment
+    length_histogram = load_length_histogram(dataset_version(DATA_PATH))
     col1, col2 = st.columns(2)
     
     with col1:
@@ -1177,29 +1106,8 @@ elif page == "Visualisasi Detail":
                 Box Plot Panjang Teks
             </h3>
         """, unsafe_allow_html=True)
-        if 'text_len' in filtered_df.columns and 'Sentiment' in filtered_df.columns:
-            fig = px.box(
-                filtered_df,
-                x='Sentiment',
-                y='text_len',
-                color='Sentiment',
-                title="Box Plot Panjang Teks per Sentimen",
-                labels={
-                    'text_len': 'Panjang Teks (kata)',
-                    'Sentiment': 'Sentimen'
-                },
-                color_discrete_map={
-                    '0': '#FF6B6B',
-                    '1': '#FFD93D',
-                    '2': '#6BCF7F'
-                }
-            )
-            # Update x-axis labels
-            fig.update_xaxes(
-                tickmode='array',
-                tickvals=[0, 1, 2],
-                ticktext=SENTIMENT_LABELS
-            )
+        if 'text_len' in columns['train'] and 'Sentiment' in columns['train']:
+            fig = length_box_figure(length_histogram, min_length, max_length)
             st.plotly_chart(fig, width='stretch')
     
     with col2:
@@ -1209,28 +1117,8 @@ elif page == "Visualisasi Detail":
                 Violin Plot
             </h3>
         """, unsafe_allow_html=True)
-        if 'text_len' in filtered_df.columns and 'Sentiment' in filtered_df.columns:
-            fig = px.violin(
-                filtered_df,
-                x='Sentiment',
-                y='text_len',
-                color='Sentiment',
-                title="Violin Plot Panjang Teks per Sentimen",
-                labels={
-                    'text_len': 'Panjang Teks (kata)',
-                    'Sentiment': 'Sentimen'
-                },
-                color_discrete_map={
-                    '0': '#FF6B6B',
-                    '1': '#FFD93D',
-                    '2': '#6BCF7F'
-                }
-            )
-            fig.update_xaxes(
-                tickmode='array',
-                tickvals=[0, 1, 2],
-                ticktext=SENTIMENT_LABELS
-            )
+        if 'text_len' in columns['train'] and 'Sentiment' in columns['train']:
+            fig = length_violin_figure(length_histogram, min_length, max_length)
             st.plotly_chart(fig, width='stretch')
     
     st.divider()
@@ -1242,8 +1130,9 @@ elif page == "Visualisasi Detail":
             Data Detail
         </h3>
     """, unsafe_allow_html=True)
+    _, _, df_processed, _ = load_frames()
     st.dataframe(
-        filtered_df[['Text', 'text_clean', 'text_len', 'Sentiment']].head(100),
+        df_processed.iloc[length_index.head(min_length, max_length, 100)][['Text', 'text_clean', 'text_len', 'Sentiment']],
         width='stretch'
     )
 
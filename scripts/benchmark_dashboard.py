@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Script untuk mengukur waktu filter slider panjang teks di halaman
+"Visualisasi Detail" dashboard
+Membandingkan filter boolean mask (scan semua baris) dengan TextLengthIndex
+(binary search + prefix sum) pada data sintetis berukuran besar, lalu mengukur
+satu rerun halaman secara utuh dengan loader src/dashboard_data yang
+sebenarnya: agregat halaman, index, histogram, grafik box/violin, dan tabel
+100 baris. Sebagai pembanding, satu hit loader agregat lama (st.cache_data,
+menyalin semua tabel termasuk token_counts)
+
+Jalankan dari root project:
+    python scripts/benchmark_dashboard.py
+    python scripts/benchmark_dashboard.py --rows 10000000 --tokens 2000000
+"""
+
+import sys
+import os
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.logger import set_log_level
+
+# Get project root directory (parent of scripts folder)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src import config
+from src.config import SEED, SENTIMENT_LABELS
+from src.length_stats import TextLengthIndex
+
+# The cached loaders run outside `streamlit run`; silence the bare mode warnings
+set_log_level('error')
+
+# (min, max) slider positions to query
+SLIDER_RANGES = ((1, 200), (10, 20), (30, 30), (1, 5), (45, 50))
+
+# Slider interactions must stay below this (ms)
+BUDGET_MS = 50
+
+# Columns of the "Data Detail" table
+TABLE_COLUMNS = ['Text', 'text_clean', 'text_len', 'Sentiment']
+
+
+def mask_filter(df: pd.DataFrame, min_length: int, max_length: int):
+    """The old page logic: boolean mask over every row."""
+    filtered_df = df[(df['text_len'] >= min_length) & (df['text_len'] <= max_length)]
+    return len(filtered_df), filtered_df.head(100)
+
+
+def index_filter(df: pd.DataFrame, index: TextLengthIndex, min_length: int, max_length: int):
+    """The new page logic: count from prefix sums, table rows from the sorted index."""
+    return index.count(min_length, max_length), df.iloc[index.head(min_length, max_length, 100)]
+
+
+def synthetic_frames(rows: int) -> dict:
+    """Frames keyed by SNAPSHOT_TABLES names (test frames a quarter of the size)."""
+    rng = np.random.default_rng(SEED)
+    texts = np.array([f'contoh tweet nomor {i}' for i in range(1000)], dtype=object)
+    dates = pd.date_range('2024-01-01', periods=60, tz='UTC').strftime('%a %b %d %H:%M:%S %z %Y').values.astype(object)
+    frames = {}
+    for name, size in (('train', rows), ('test', rows // 4)):
+        frames[name + '_raw'] = pd.DataFrame({
+            'Date': dates[rng.integers(0, len(dates), size)],
+            'Text': texts[rng.integers(0, len(texts), size)],
+            'Sentiment': np.array(SENTIMENT_LABELS, dtype=object)[rng.integers(0, len(SENTIMENT_LABELS), size)],
+        })
+        frames[name] = pd.DataFrame({
+            'Text': frames[name + '_raw']['Text'].values,
+            'text_clean': texts[rng.integers(0, len(texts), size)],
+            'text_len': np.clip(rng.poisson(15, size), 1, None),
+            'Sentiment': rng.integers(0, len(SENTIMENT_LABELS), size),
+        })
+    return frames
+
+
+def synthetic_token_counts(tokens: int) -> pd.DataFrame:
+    """A token_counts table with `tokens` rows (vocabulary-sized)."""
+    rng = np.random.default_rng(SEED)
+    return pd.DataFrame({
+        'Sentiment': rng.integers(-1, len(SENTIMENT_LABELS), tokens),
+        'token': [f'kata{i}' for i in range(tokens)],
+        'count': rng.integers(1, 1000, tokens),
+    })
+
+
+def page_rerun(min_length: int, max_length: int):
+    """
+    One slider rerun of "Visualisasi Detail" with the dashboard's loaders:
+    page aggregates (read by every page), length index, count, histogram,
+    box/violin figures and the 100-row table.
+    """
+    from src.aggregates import dataset_version
+    from src.dashboard_data import (
+        load_page_aggregates, load_length_index, load_length_histogram, load_frames,
+        length_box_figure, length_violin_figure
+    )
+
+    _, _, columns = load_page_aggregates()
+    length_index = load_length_index(dataset_version(config.DATA_PATH))
+    filtered_count = length_index.count(min_length, max_length)
+    length_histogram = load_length_histogram(dataset_version(config.DATA_PATH))
+    if 'text_len' in columns['train'] and 'Sentiment' in columns['train']:
+        length_box_figure(length_histogram, min_length, max_length)
+        length_violin_figure(length_histogram, min_length, max_length)
+    _, _, df_processed, _ = load_frames()
+    table = df_processed.iloc[length_index.head(min_length, max_length, 100)][TABLE_COLUMNS]
+    return filtered_count, table
+
+
+@st.cache_data
+def load_aggregates_copied(version):
+    """The old aggregates loader: every cache hit unpickles a copy of all tables."""
+    from src.aggregates import AGGREGATE_TABLES, load_aggregates
+    return load_aggregates(config.DATA_PATH, dict, tables=AGGREGATE_TABLES)
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark filter panjang teks dashboard")
+    parser.add_argument('--rows', type=int, default=10_000_000, help="Jumlah baris data sintetis")
+    parser.add_argument('--tokens', type=int, default=2_000_000,
+                        help="Jumlah baris tabel token_counts sintetis")
+    args = parser.parse_args()
+
+    frames = synthetic_frames(args.rows)
+    df = frames['train']
+
+    print("=" * 60)
+    print(f"BENCHMARK FILTER SLIDER ({args.rows:,} baris)")
+    print("=" * 60)
+    start = time.perf_counter()
+    index = TextLengthIndex(df['text_len'].values, df['Sentiment'].values)
+    print(f"   Membangun index (sekali per versi data): {time.perf_counter() - start:.2f} detik")
+
+    slowest = 0.0
+    for min_length, max_length in SLIDER_RANGES:
+        start = time.perf_counter()
+        old_count, old_rows = mask_filter(df, min_length, max_length)
+        mask_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        new_count, new_rows = index_filter(df, index, min_length, max_length)
+        index_ms = (time.perf_counter() - start) * 1000
+        slowest = max(slowest, index_ms)
+
+        same = old_count == new_count and old_rows.equals(new_rows)
+        print(f"   [{min_length:>3}, {max_length:>3}] {new_count:>12,} baris  "
+              f"mask {mask_ms:8.1f} ms  index {index_ms:6.2f} ms  {'identik' if same else 'BERBEDA'}")
+
+    with tempfile.TemporaryDirectory() as aggregates_dir:
+        # The dashboard loaders read the synthetic frames and aggregates for the
+        # current dataset version: frames in place of the snapshot, aggregates
+        # from a temporary store
+        from src import dashboard_data
+        from src.aggregates import build_aggregates, dataset_version, write_aggregates
+        from src.token_index import TokenFrequencyIndex
+
+        os.environ[config.ENV_PREFIX + 'AGGREGATES_DIR'] = aggregates_dir
+        os.environ[config.ENV_PREFIX + 'USE_SNAPSHOT'] = 'true'
+        config.settings.reset()
+        dashboard_data.load_snapshot = lambda data_path: frames
+        tables = build_aggregates(frames, TokenFrequencyIndex())
+        tables['token_counts'] = synthetic_token_counts(args.tokens)
+        write_aggregates(tables, dataset_version(config.DATA_PATH))
+
+        print("\nRerun halaman utuh (agregat + index + histogram + grafik + tabel 100 baris):")
+        start = time.perf_counter()
+        page_rerun(1, 200)
+        print(f"   Rerun pertama (memuat agregat, membangun index): {time.perf_counter() - start:.2f} detik")
+        for min_length, max_length in SLIDER_RANGES:
+            start = time.perf_counter()
+            page_count, page_rows = page_rerun(min_length, max_length)
+            page_ms = (time.perf_counter() - start) * 1000
+            slowest = max(slowest, page_ms)
+            old_count, old_rows = mask_filter(df, min_length, max_length)
+            same = page_count == old_count and page_rows.equals(old_rows[TABLE_COLUMNS])
+            print(f"   [{min_length:>3}, {max_length:>3}] {page_count:>12,} baris  "
+                  f"rerun {page_ms:6.2f} ms  {'identik' if same else 'BERBEDA'}")
+
+        version = dataset_version(config.DATA_PATH)
+        load_aggregates_copied(version)
+        start = time.perf_counter()
+        load_aggregates_copied(version)
+        print(f"   Pembanding: satu hit loader agregat lama (st.cache_data, {args.tokens:,} baris token) "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms per rerun")
+
+    print("\n" + "=" * 60)
+    if slowest > BUDGET_MS:
+        print(f"❌ Filter terlambat: {slowest:.1f} ms > {BUDGET_MS} ms")
+        sys.exit(1)
+    print(f"✅ Semua filter di bawah {BUDGET_MS} ms (terlambat: {slowest:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Script untuk mengukur latency dan throughput prediksi sentimen
+Memerlukan bundle model (jalankan main.py terlebih dahulu)
+
+Jalankan dari root project:
+    python scripts/benchmark_predict.py
+"""
+
+import sys
+import os
+
+# Get project root directory (parent of scripts folder)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.config import DATA_PATH
+from src.data_processing import load_data
+from src.inference import get_predictor, benchmark_predictor
+
+
+def main():
+    """Main function."""
+    predictor = get_predictor()
+    texts = load_data(DATA_PATH)['Text'].tolist()
+
+    print("=" * 60)
+    print(f"BENCHMARK PREDIKSI (bundle v{predictor.bundle.version})")
+    print("=" * 60)
+    results = benchmark_predictor(predictor, texts)
+    print(f"   Latency 1 tweet (p50): {results['single_latency_ms_p50']:.3f} ms")
+    print(f"   Latency 1 tweet (p99): {results['single_latency_ms_p99']:.3f} ms")
+    print(f"   Throughput (batch {results['batch_size']}): "
+          f"{results['throughput_tweets_per_s']:,.0f} tweet/detik")
+
+
+if __name__ == "__main__":
+    main()
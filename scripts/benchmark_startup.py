@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Script untuk mengukur waktu import (startup) setiap entry point dengan
+`python -X importtime` dan menjaga agar tetap di bawah anggaran
+
+Jalankan dari root project:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --repeat 5
+
+Keluar dengan kode 1 jika ada entry point yang melebihi anggaran waktu
+atau mengimpor dependency berat saat startup.
+"""
+
+import sys
+import os
+import argparse
+import re
+import subprocess
+
+# Get project root directory (parent of scripts folder)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Startup budget (ms of import time) per entry point
+ENTRY_POINTS = {
+    'main.py': 1500,
+    'scripts/main.py': 1500,
+    'src/main.py': 1500,
+    # Streamlit scripts run top to bottom (in bare mode, without a server);
+    # streamlit and pandas alone take about 1 s
+    'dashboard.py': 2000,
+    'scripts/dashboard.py': 2000,
+    'scripts/ingest.py': 1500,
+    'scripts/update_model.py': 1500,
+    'scripts/generate_presentasi.py': 1500,
+    'scripts/benchmark_predict.py': 1500,
+    'scripts/benchmark_training.py': 1500,
+    'scripts/benchmark_dashboard.py': 1500,
+    'scripts/load_test.py': 1500,
+    'scripts/serve.py': 1000,
+}
+
+# Packages that may only be imported by the functions that need them
+# (google.colab, not google: streamlit imports google.protobuf)
+LAZY_PACKAGES = ('matplotlib', 'seaborn', 'sklearn', 'imblearn', 'transformers', 'torch', 'google.colab')
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)')
+
+
+def profile_imports(entry_point: str):
+    """
+    Import an entry point (its top level only, main() is not run) under -X importtime.
+
+    Returns:
+        tuple: (total import time in ms, {module: cumulative ms} for top-level
+        imports, set of imported module names)
+    """
+    code = f"import runpy; runpy.run_path({entry_point!r}, run_name='__startup__')"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=PROJECT_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {entry_point} failed:\n{result.stderr[-2000:]}")
+
+    total_us = 0
+    top_level = {}
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        total_us += int(self_us)
+        modules.add(module)
+        if len(indent) == 1:
+            top_level[module] = int(cumulative_us) / 1000
+    return total_us / 1000, top_level, modules
+
+
+def eager_packages(modules) -> list:
+    """LAZY_PACKAGES among the imported modules (a package or any of its submodules)."""
+    return sorted(package for package in LAZY_PACKAGES
+                  if any(module == package or module.startswith(package + '.') for module in modules))
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark waktu startup entry point")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Jumlah pengukuran per entry point (diambil yang tercepat)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("BENCHMARK STARTUP (python -X importtime)")
+    print("=" * 60)
+
+    failures = []
+    for entry_point, budget_ms in ENTRY_POINTS.items():
+        runs = [profile_imports(entry_point) for _ in range(args.repeat)]
+        total_ms, top_level, modules = min(runs, key=lambda run: run[0])
+        eager = eager_packages(modules)
+
+        status = "OK" if total_ms <= budget_ms and not eager else "GAGAL"
+        print(f"\n{entry_point}: {total_ms:.0f} ms (anggaran {budget_ms} ms) [{status}]")
+        for module, ms in sorted(top_level.items(), key=lambda item: -item[1])[:5]:
+            print(f"   {ms:8.1f} ms  {module}")
+        if total_ms > budget_ms:
+            failures.append(f"{entry_point}: {total_ms:.0f} ms > {budget_ms} ms")
+        if eager:
+            failures.append(f"{entry_point}: mengimpor {', '.join(eager)} saat startup")
+
+    print("\n" + "=" * 60)
+    if failures:
+        print("❌ Anggaran startup terlampaui:")
+        for failure in failures:
+            print(f"   - {failure}")
+        sys.exit(1)
+    print("✅ Semua entry point di bawah anggaran startup")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,14 +17,6 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
-try:
-    from wordcloud import WordCloud
-    WORDCLOUD_AVAILABLE = True
-except ImportError:
-    WORDCLOUD_AVAILABLE = False
-    WordCloud = None
 from collections import Counter
 
 # Get project root directory (parent of scripts folder)
@@ -32,13 +24,15 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # Add project root to path so we can import src module
 sys.path.insert(0, PROJECT_ROOT)
 
-from src.config import DATA_PATH, DATA_TEST_SIZE, SENTIMENT_MAP, SENTIMENT_LABELS
-from src.data_processing import (
-    load_data, split_data, preprocess_data, encode_sentiments,
-    process_token_lengths, prepare_data_for_training
-)
+from src.config import DATA_PATH, SENTIMENT_MAP, SENTIMENT_LABELS
+from src.aggregates import dataset_version, frame_counts
+from src.token_index import word_cloud_frequencies
 from src.text_cleaning import clean_texts
-from src.models import train_naive_bayes
+from src.dashboard_data import (
+    load_frames, load_page_aggregates, load_token_index, load_length_histogram,
+    load_length_index, load_dashboard_model, current_model_version, wordcloud_stopwords,
+    show_word_cloud, length_box_figure, length_violin_figure
+)
 
 # Page configuration
 st.set_page_config(
@@ -67,32 +61,8 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Cache data loading
-@st.cache_data
-def load_and_preprocess_data():
-    """Load and preprocess data with caching."""
-    try:
-        # Load data from single CSV file
-        df = load_data(DATA_PATH)
-        
-        # Split into train and test sets
-        df_train, df_test = split_data(df, test_size=DATA_TEST_SIZE)
-        
-        # Preprocess
-        df_processed, df_test_processed = preprocess_data(df_train.copy(), df_test.copy())
-        df_processed, df_test_processed = encode_sentiments(df_processed, df_test_processed)
-        
-        return df_train, df_test, df_processed, df_test_processed
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return None, None, None, None
-
-# Load data
-df, df_test, df_processed, df_test_processed = load_and_preprocess_data()
-
-if df is None:
-    st.error("Tidak dapat memuat data. Pastikan file CSV ada di folder data/")
-    st.stop()
+# Pages read these small precomputed tables instead of the frames
+aggregates, summary, columns = load_page_aggregates()
 
 # Sidebar
 st.sidebar.title("📊 Navigasi Dashboard")
@@ -114,16 +84,16 @@ if page == "🏠 Overview":
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Data Training", f"{len(df):,}")
+        st.metric("Total Data Training", f"{summary.loc['train_raw', 'rows']:,}")
     
     with col2:
-        st.metric("Total Data Test", f"{len(df_test):,}")
+        st.metric("Total Data Test", f"{summary.loc['test_raw', 'rows']:,}")
     
     with col3:
-        st.metric("Data Setelah Preprocessing", f"{len(df_processed):,}")
+        st.metric("Data Setelah Preprocessing", f"{summary.loc['train', 'rows']:,}")
     
     with col4:
-        st.metric("Data Test Setelah Preprocessing", f"{len(df_test_processed):,}")
+        st.metric("Data Test Setelah Preprocessing", f"{summary.loc['test', 'rows']:,}")
     
     st.divider()
     
@@ -132,6 +102,7 @@ if page == "🏠 Overview":
     
     with col1:
         st.subheader("📄 Preview Data Training")
+        df, df_test, _, _ = load_frames()
         st.dataframe(df.head(10), width='stretch')
     
     with col2:
@@ -147,17 +118,17 @@ if page == "🏠 Overview":
     
     with col1:
         st.write("**Data Training:**")
-        st.write(f"- Jumlah baris: {len(df):,}")
-        st.write(f"- Jumlah kolom: {len(df.columns)}")
-        st.write(f"- Kolom: {', '.join(df.columns.tolist())}")
-        if 'Date' in df.columns:
-            st.write(f"- Rentang tanggal: {df['Date'].min()} hingga {df['Date'].max()}")
+        st.write(f"- Jumlah baris: {summary.loc['train_raw', 'rows']:,}")
+        st.write(f"- Jumlah kolom: {len(columns['train_raw'])}")
+        st.write(f"- Kolom: {', '.join(columns['train_raw'])}")
+        if 'Date' in columns['train_raw']:
+            st.write(f"- Rentang tanggal: {summary.loc['train_raw', 'date_min']} hingga {summary.loc['train_raw', 'date_max']}")
     
     with col2:
         st.write("**Data Test:**")
-        st.write(f"- Jumlah baris: {len(df_test):,}")
-        st.write(f"- Jumlah kolom: {len(df_test.columns)}")
-        st.write(f"- Kolom: {', '.join(df_test.columns.tolist())}")
+        st.write(f"- Jumlah baris: {summary.loc['test_raw', 'rows']:,}")
+        st.write(f"- Jumlah kolom: {len(columns['test_raw'])}")
+        st.write(f"- Kolom: {', '.join(columns['test_raw'])}")
 
 # ============================================================================
 # PAGE 2: ANALISIS DATA
@@ -172,8 +143,8 @@ elif page == "📈 Analisis Data":
     
     with col1:
         # Training data sentiment
-        if 'Sentiment' in df_processed.columns:
-            sentiment_counts = df_processed['Sentiment'].value_counts().sort_index()
+        if 'Sentiment' in columns['train']:
+            sentiment_counts = frame_counts(aggregates, 'sentiment_counts', 'train').set_index('Sentiment')['count']
             sentiment_labels = [SENTIMENT_LABELS[int(i)] for i in sentiment_counts.index]
             
             fig = px.pie(
@@ -190,8 +161,8 @@ elif page == "📈 Analisis Data":
     
     with col2:
         # Test data sentiment
-        if 'Sentiment' in df_test_processed.columns:
-            sentiment_counts_test = df_test_processed['Sentiment'].value_counts().sort_index()
+        if 'Sentiment' in columns['test']:
+            sentiment_counts_test = frame_counts(aggregates, 'sentiment_counts', 'test').set_index('Sentiment')['count']
             sentiment_labels_test = [SENTIMENT_LABELS[int(i)] for i in sentiment_counts_test.index]
             
             fig = px.pie(
@@ -209,11 +180,10 @@ elif page == "📈 Analisis Data":
     st.divider()
     
     # Tweets by date
-    if 'Date' in df.columns:
+    if 'Date' in columns['train_raw']:
         st.subheader("📅 Jumlah Tweet per Tanggal")
         
-        df['Date'] = pd.to_datetime(df['Date'])
-        tweets_per_date = df['Date'].dt.strftime('%Y-%m-%d').value_counts().sort_index().reset_index()
+        tweets_per_date = aggregates['daily_counts'].copy()
         tweets_per_date.columns = ['Date', 'Count']
         
         fig = px.bar(
@@ -236,44 +206,48 @@ elif page == "📈 Analisis Data":
     col1, col2 = st.columns(2)
     
     with col1:
-        if 'text_len' in df_processed.columns:
+        if 'text_len' in columns['train']:
             fig = px.histogram(
-                df_processed,
+                frame_counts(aggregates, 'text_len_counts', 'train'),
                 x='text_len',
+                y='count',
+                histfunc='sum',
                 nbins=30,
                 title="Distribusi Panjang Teks (Training)",
-                labels={'text_len': 'Panjang Teks (kata)', 'count': 'Jumlah'},
+                labels={'text_len': 'Panjang Teks (kata)'},
                 color_discrete_sequence=['#1f77b4']
             )
-            fig.update_layout(showlegend=False)
+            fig.update_layout(showlegend=False, yaxis_title='Jumlah')
             st.plotly_chart(fig, width='stretch')
     
     with col2:
-        if 'text_len' in df_test_processed.columns:
+        if 'text_len' in columns['test']:
             fig = px.histogram(
-                df_test_processed,
+                frame_counts(aggregates, 'text_len_counts', 'test'),
                 x='text_len',
+                y='count',
+                histfunc='sum',
                 nbins=30,
                 title="Distribusi Panjang Teks (Test)",
-                labels={'text_len': 'Panjang Teks (kata)', 'count': 'Jumlah'},
+                labels={'text_len': 'Panjang Teks (kata)'},
                 color_discrete_sequence=['#ff7f0e']
             )
-            fig.update_layout(showlegend=False)
+            fig.update_layout(showlegend=False, yaxis_title='Jumlah')
             st.plotly_chart(fig, width='stretch')
     
     # Statistics
-    if 'text_len' in df_processed.columns:
+    if 'text_len' in columns['train']:
         st.subheader("📊 Statistik Panjang Teks")
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Rata-rata (Training)", f"{df_processed['text_len'].mean():.1f} kata")
+            st.metric("Rata-rata (Training)", f"{summary.loc['train', 'text_len_mean']:.1f} kata")
         with col2:
-            st.metric("Median (Training)", f"{df_processed['text_len'].median():.1f} kata")
+            st.metric("Median (Training)", f"{summary.loc['train', 'text_len_median']:.1f} kata")
         with col3:
-            st.metric("Rata-rata (Test)", f"{df_test_processed['text_len'].mean():.1f} kata")
+            st.metric("Rata-rata (Test)", f"{summary.loc['test', 'text_len_mean']:.1f} kata")
         with col4:
-            st.metric("Median (Test)", f"{df_test_processed['text_len'].median():.1f} kata")
+            st.metric("Median (Test)", f"{summary.loc['test', 'text_len_median']:.1f} kata")
 
 # ============================================================================
 # PAGE 3: ANALISIS SENTIMEN
@@ -284,9 +258,9 @@ elif page == "💬 Analisis Sentimen":
     # Sentiment comparison
     st.subheader("📊 Perbandingan Sentimen")
     
-    if 'Sentiment' in df_processed.columns and 'Sentiment' in df_test_processed.columns:
-        train_sentiment = df_processed['Sentiment'].value_counts().sort_index()
-        test_sentiment = df_test_processed['Sentiment'].value_counts().sort_index()
+    if 'Sentiment' in columns['train'] and 'Sentiment' in columns['test']:
+        train_sentiment = frame_counts(aggregates, 'sentiment_counts', 'train').set_index('Sentiment')['count']
+        test_sentiment = frame_counts(aggregates, 'sentiment_counts', 'test').set_index('Sentiment')['count']
         
         comparison_df = pd.DataFrame({
             'Sentiment': [SENTIMENT_LABELS[int(i)] for i in train_sentiment.index],
@@ -327,6 +301,7 @@ elif page == "💬 Analisis Sentimen":
         ["All", "Negative", "Neutral", "Positive"]
     )
     
+    _, _, df_processed, _ = load_frames()
     if sentiment_filter != "All":
         sentiment_value = SENTIMENT_LABELS.index(sentiment_filter)
         filtered_df = df_processed[df_processed['Sentiment'] == sentiment_value]
@@ -356,7 +331,7 @@ elif page == "💬 Analisis Sentimen":
     st.divider()
     
     # Word Cloud (if text_clean exists)
-    if 'text_clean' in df_processed.columns:
+    if 'text_clean' in columns['train']:
         st.subheader("☁️ Word Cloud")
         
         sentiment_for_wc = st.selectbox(
@@ -365,30 +340,15 @@ elif page == "💬 Analisis Sentimen":
             key="wc_sentiment"
         )
         
-        if sentiment_for_wc != "All":
-            sentiment_value_wc = SENTIMENT_LABELS.index(sentiment_for_wc)
-            texts_for_wc = df_processed[df_processed['Sentiment'] == sentiment_value_wc]['text_clean'].str.cat(sep=' ')
-        else:
-            texts_for_wc = df_processed['text_clean'].str.cat(sep=' ')
+        # Top words from the precomputed token index (no re-tokenizing per rerun)
+        sentiment_value_wc = SENTIMENT_LABELS.index(sentiment_for_wc) if sentiment_for_wc != "All" else None
+        frequencies_for_wc = word_cloud_frequencies(
+            load_token_index(dataset_version(DATA_PATH)), sentiment_value_wc,
+            max_words=100, stopwords=wordcloud_stopwords()
+        )
         
-        if texts_for_wc and len(texts_for_wc) > 0:
-            if WORDCLOUD_AVAILABLE:
-                try:
-                    wordcloud = WordCloud(
-                        width=800,
-                        height=400,
-                        background_color='white',
-                        max_words=100
-                    ).generate(texts_for_wc)
-                    
-                    fig, ax = plt.subplots(figsize=(10, 5))
-                    ax.imshow(wordcloud, interpolation='bilinear')
-                    ax.axis('off')
-                    st.pyplot(fig)
-                except Exception as e:
-                    st.warning(f"Tidak dapat membuat word cloud: {str(e)}")
-            else:
-                st.info("⚠️ WordCloud tidak tersedia. Install dengan: `pip install wordcloud`")
+        if frequencies_for_wc:
+            show_word_cloud(frequencies_for_wc)
 
 # ============================================================================
 # PAGE 4: EVALUASI MODEL
@@ -396,43 +356,13 @@ elif page == "💬 Analisis Sentimen":
 elif page == "🏆 Evaluasi Model":
     st.header("🏆 Evaluasi Model Naive Bayes")
     
-    # Cache model training
-    @st.cache_data
-    def train_and_evaluate_model():
-        """Train model and return metrics."""
-        try:
-            # Prepare data for training
-            df_train_prep = df_processed.copy()
-            df_test_prep = df_test_processed.copy()
-            
-            # Process token lengths
-            from src.config import MAX_TOKEN_LENGTH
-            df_train_prep, df_test_prep = process_token_lengths(
-                df_train_prep, df_test_prep, max_length=MAX_TOKEN_LENGTH
-            )
-            
-            # Prepare data
-            (X_train, X_valid, X_test, y_train, y_valid, y_test,
-             y_train_le, y_valid_le, y_test_le) = prepare_data_for_training(
-                df_train_prep, df_test_prep
-            )
-            
-            # Train model
-            nb_model, vectorizer, tf_transformer, metrics = train_naive_bayes(
-                X_train, y_train_le, X_test, y_test_le
-            )
-            
-            return metrics, nb_model, vectorizer, tf_transformer
-        except Exception as e:
-            st.error(f"Error training model: {str(e)}")
-            return None, None, None, None
-    
-    # Train model
-    with st.spinner("Training model... Ini mungkin memakan waktu beberapa saat."):
-        metrics, model, vectorizer, tf_transformer = train_and_evaluate_model()
-    
-    if metrics is None:
-        st.error("Gagal melatih model. Silakan cek error di atas.")
+    # Model bundle for the current data + config (trained in the background when missing)
+    version = current_model_version()
+
+    try:
+        metrics = load_dashboard_model(version).metrics
+    except Exception as e:
+        st.error(f"Gagal memuat model v{version}: {str(e)}")
         st.stop()
     
     # Overall Accuracy
@@ -657,78 +587,37 @@ elif page == "📊 Visualisasi Detail":
             key="max_len"
         )
     
-    # Filter data
-    filtered_df = df_processed[
-        (df_processed['text_len'] >= min_length) & 
-        (df_processed['text_len'] <= max_length)
-    ]
+    # Filter data with the sorted text_len index (prefix sums, no full scan)
+    length_index = load_length_index(dataset_version(DATA_PATH))
+    filtered_count = length_index.count(min_length, max_length)
     
-    st.metric("Jumlah Data Setelah Filter", len(filtered_df))
+    st.metric("Jumlah Data Setelah Filter", filtered_count)
     
     st.divider()
     
-    # Detailed charts
+    # Detailed charts, from the precomputed length counts per sentiment
+    length_histogram = load_length_histogram(dataset_version(DATA_PATH))
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("📊 Box Plot Panjang Teks")
-        if 'text_len' in filtered_df.columns and 'Sentiment' in filtered_df.columns:
-            fig = px.box(
-                filtered_df,
-                x='Sentiment',
-                y='text_len',
-                color='Sentiment',
-                title="Box Plot Panjang Teks per Sentimen",
-                labels={
-                    'text_len': 'Panjang Teks (kata)',
-                    'Sentiment': 'Sentimen'
-                },
-                color_discrete_map={
-                    '0': '#FF6B6B',
-                    '1': '#FFD93D',
-                    '2': '#6BCF7F'
-                }
-            )
-            # Update x-axis labels
-            fig.update_xaxes(
-                tickmode='array',
-                tickvals=[0, 1, 2],
-                ticktext=SENTIMENT_LABELS
-            )
+        if 'text_len' in columns['train'] and 'Sentiment' in columns['train']:
+            fig = length_box_figure(length_histogram, min_length, max_length)
             st.plotly_chart(fig, width='stretch')
     
     with col2:
         st.subheader("📈 Violin Plot")
-        if 'text_len' in filtered_df.columns and 'Sentiment' in filtered_df.columns:
-            fig = px.violin(
-                filtered_df,
-                x='Sentiment',
-                y='text_len',
-                color='Sentiment',
-                title="Violin Plot Panjang Teks per Sentimen",
-                labels={
-                    'text_len': 'Panjang Teks (kata)',
-                    'Sentiment': 'Sentimen'
-                },
-                color_discrete_map={
-                    '0': '#FF6B6B',
-                    '1': '#FFD93D',
-                    '2': '#6BCF7F'
-                }
-            )
-            fig.update_xaxes(
-                tickmode='array',
-                tickvals=[0, 1, 2],
-                ticktext=SENTIMENT_LABELS
-            )
+        if 'text_len' in columns['train'] and 'Sentiment' in columns['train']:
+            fig = length_violin_figure(length_histogram, min_length, max_length)
             st.plotly_chart(fig, width='stretch')
     
     st.divider()
     
     # Data table
     st.subheader("📋 Data Detail")
+    _, _, df_processed, _ = load_frames()
     st.dataframe(
-        filtered_df[['Text', 'text_clean', 'text_len', 'Sentiment']].head(100),
+        df_processed.iloc[length_index.head(min_length, max_length, 100)][['Text', 'text_clean', 'text_len', 'Sentiment']],
         width='stretch'
     )
 
@@ -14,17 +14,18 @@ from pathlib import Path
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 
-from src.config import DATA_PATH, DATA_TEST_SIZE, SENTIMENT_LABELS
+from src.config import DATA_PATH, DATA_TEST_SIZE, SENTIMENT_LABELS, USE_SNAPSHOT
 from src.data_processing import (
     load_data,
     split_data,
     preprocess_data,
     process_token_lengths,
+    filter_token_lengths,
     encode_sentiments,
     prepare_data_for_training
 )
 from src.models import train_naive_bayes
-from sklearn.metrics import classification_report, accuracy_score, confusion_matrix
+from src.snapshot import load_snapshot
 
 
 def collect_results():
@@ -33,32 +34,40 @@ def collect_results():
     print("MENGUMPULKAN HASIL ANALISIS DATA")
     print("=" * 60)
     
-    # Load data
-    print("\n1. Loading data...")
-    df = load_data(DATA_PATH)
-    print(f"   ✓ Total data: {len(df):,} rows")
+    # Use the preprocessed snapshot (scripts/ingest.py) when it is up to date
+    frames = load_snapshot(DATA_PATH) if USE_SNAPSHOT else None
+    if frames is None:
+        # Load data
+        print("\n1. Loading data...")
+        df = load_data(DATA_PATH)
+        print(f"   ✓ Total data: {len(df):,} rows")
     
-    # Split data into train and test sets
-    print("\n2. Splitting data into train and test sets...")
-    df_train, df_test = split_data(df, test_size=DATA_TEST_SIZE)
-    print(f"   ✓ Training data: {len(df_train):,} rows")
-    print(f"   ✓ Test data: {len(df_test):,} rows")
+        # Split data into train and test sets
+        print("\n2. Splitting data into train and test sets...")
+        df_train, df_test = split_data(df, test_size=DATA_TEST_SIZE)
+        print(f"   ✓ Training data: {len(df_train):,} rows")
+        print(f"   ✓ Test data: {len(df_test):,} rows")
     
-    # Preprocess
-    print("\n3. Preprocessing data...")
-    df_processed, df_test_processed = preprocess_data(df_train.copy(), df_test.copy())
-    print(f"   ✓ Training setelah preprocessing: {len(df_processed):,} rows")
-    print(f"   ✓ Test setelah preprocessing: {len(df_test_processed):,} rows")
+        # Preprocess
+        print("\n3. Preprocessing data...")
+        df_processed, df_test_processed = preprocess_data(df_train.copy(), df_test.copy())
+        print(f"   ✓ Training setelah preprocessing: {len(df_processed):,} rows")
+        print(f"   ✓ Test setelah preprocessing: {len(df_test_processed):,} rows")
     
-    # Process token lengths
-    print("\n4. Processing token lengths...")
-    df_processed, df_test_processed = process_token_lengths(df_processed, df_test_processed)
-    print(f"   ✓ Training setelah filtering: {len(df_processed):,} rows")
-    print(f"   ✓ Test setelah filtering: {len(df_test_processed):,} rows")
-    
-    # Encode sentiments
-    df_processed, df_test_processed = encode_sentiments(df_processed, df_test_processed)
+        # Process token lengths
+        print("\n4. Processing token lengths...")
+        df_processed, df_test_processed = process_token_lengths(df_processed, df_test_processed)
+        print(f"   ✓ Training setelah filtering: {len(df_processed):,} rows")
+        print(f"   ✓ Test setelah filtering: {len(df_test_processed):,} rows")
     
+        # Encode sentiments
+        df_processed, df_test_processed = encode_sentiments(df_processed, df_test_processed)
+    else:
+        print("\n1. Loading preprocessed snapshot...")
+        df_train, df_test = frames['train_raw'], frames['test_raw']
+        df_processed, df_test_processed = filter_token_lengths(frames['train'], frames['test'])
+        print(f"   ✓ Training: {len(df_processed):,} rows, Test: {len(df_test_processed):,} rows")
+
     # Get sentiment distribution before oversampling
     sentiment_dist_before = df_processed['Sentiment'].value_counts().sort_index()
     
@@ -79,9 +88,7 @@ def collect_results():
     # Use metrics from training function
     accuracy = metrics['accuracy']
     report = metrics['classification_report']
-    cm = confusion_matrix(y_test_le, nb_model.predict(
-        tf_transformer.transform(vectorizer.transform(X_test))
-    ))
+    cm = metrics['confusion_matrix']
     
     # Calculate text length statistics
     text_len_stats = {
@@ -122,7 +129,7 @@ def collect_results():
         'model_performance': {
             'accuracy': accuracy,
             'classification_report': report,
-            'confusion_matrix': cm.tolist()
+            'confusion_matrix': cm
         }
     }
     
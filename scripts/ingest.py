@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Script untuk membuat snapshot data yang sudah dipreprocessing (ingest sekali)
+Hasilnya dipakai main.py dan dashboard agar tidak perlu preprocessing ulang
+Sekaligus membangun agregat dashboard (jumlah sentimen, tweet per hari,
+statistik dan histogram panjang teks, indeks kata untuk word cloud) untuk
+versi data ini
+
+Jalankan dari root project:
+    python scripts/ingest.py
+"""
+
+import sys
+import os
+
+# Get project root directory (parent of scripts folder)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.config import DATA_PATH, DATA_CHUNKSIZE, SNAPSHOT_DIR, AGGREGATES_DIR
+from src.snapshot import build_snapshot
+from src.aggregates import build_aggregates, dataset_version, write_aggregates
+from src.token_index import TokenFrequencyIndex
+
+
+def build_token_index(df_train):
+    """Word cloud index of the processed training frame, fed chunk by chunk through add."""
+    token_index = TokenFrequencyIndex()
+    for start in range(0, len(df_train), DATA_CHUNKSIZE):
+        chunk = df_train.iloc[start:start + DATA_CHUNKSIZE]
+        token_index.add(chunk['text_clean'].values, chunk['Sentiment'].values)
+        print(f"   ✓ {start + len(chunk):,}/{len(df_train):,} teks")
+    return token_index
+
+
+def main():
+    """Main function."""
+    print("=" * 60)
+    print("MEMBUAT SNAPSHOT DATA")
+    print("=" * 60)
+    frames = build_snapshot(DATA_PATH, SNAPSHOT_DIR)
+    for name, frame in frames.items():
+        print(f"   ✓ {name}: {len(frame):,} rows")
+
+    print("\nMembangun indeks kata (word cloud)...")
+    token_index = build_token_index(frames['train'])
+
+    print("\nMembangun agregat dashboard...")
+    version = dataset_version(DATA_PATH)
+    tables = build_aggregates(frames, token_index)
+    write_aggregates(tables, version, AGGREGATES_DIR)
+    for name, table in tables.items():
+        print(f"   ✓ {name}: {len(table):,} rows")
+    print(f"   Disimpan di {os.path.join(AGGREGATES_DIR, version)}")
+
+
+if __name__ == "__main__":
+    main()
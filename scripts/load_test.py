@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Script load test untuk layanan prediksi (scripts/serve.py)
+Mengirim request satu tweet secara paralel dan mengukur latency/throughput
+
+Jalankan dari root project (server harus sudah berjalan):
+    python scripts/load_test.py
+    python scripts/load_test.py --concurrency 64 --requests 20000
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+
+# Get project root directory (parent of scripts folder)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.config import DATA_PATH, SERVE_HOST, SERVE_PORT
+from src.data_processing import load_data
+
+
+async def _request(reader, writer, host, method, path, payload=None):
+    """Send one keep-alive HTTP request and return (status, decoded JSON body)."""
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                  ).encode('latin-1') + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _client(host, port, texts, counter, n_requests, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] < n_requests:
+            i = counter[0]
+            counter[0] += 1
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, host, 'POST', '/predict',
+                                       {'text': texts[i % len(texts)]})
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors[0] += 1
+    finally:
+        writer.close()
+
+
+async def run_load_test(host, port, concurrency, n_requests):
+    texts = load_data(DATA_PATH)['Text'].tolist()
+    latencies, errors, counter = [], [0], [0]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, texts, counter, n_requests, latencies, errors)
+                           for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, server_metrics = await _request(reader, writer, host, 'GET', '/metrics')
+    writer.close()
+
+    latencies = np.array(latencies) * 1000
+    print("=" * 60)
+    print(f"LOAD TEST: {n_requests:,} request, concurrency {concurrency}")
+    print("=" * 60)
+    print(f"   Throughput: {n_requests / elapsed:,.0f} request/detik")
+    print(f"   Latency client p50: {np.percentile(latencies, 50):.2f} ms")
+    print(f"   Latency client p99: {np.percentile(latencies, 99):.2f} ms")
+    print(f"   Error: {errors[0]}")
+    print("\nMetrik server:")
+    for key, value in server_metrics.items():
+        print(f"   {key}: {value}")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Load test for scripts/serve.py")
+    parser.add_argument('--host', default=SERVE_HOST)
+    parser.add_argument('--port', type=int, default=SERVE_PORT)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=10000)
+    args = parser.parse_args()
+    asyncio.run(run_load_test(args.host, args.port, args.concurrency, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Script untuk menjalankan layanan HTTP prediksi sentimen (micro-batching)
+Memerlukan bundle model (jalankan main.py terlebih dahulu)
+
+Jalankan dari root project:
+    python scripts/serve.py
+    python scripts/serve.py --port 8000 --max-batch-size 64 --max-wait-ms 2
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+
+# Get project root directory (parent of scripts folder)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.config import SERVE_HOST, SERVE_PORT, SERVE_MAX_BATCH_SIZE, SERVE_MAX_WAIT_MS
+from src.server import serve
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Sentiment scoring service")
+    parser.add_argument('--host', default=SERVE_HOST)
+    parser.add_argument('--port', type=int, default=SERVE_PORT)
+    parser.add_argument('--max-batch-size', type=int, default=SERVE_MAX_BATCH_SIZE)
+    parser.add_argument('--max-wait-ms', type=float, default=SERVE_MAX_WAIT_MS)
+    parser.add_argument('--model-version', type=int, default=None,
+                        help="Model bundle version (default: latest)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_batch_size, args.max_wait_ms,
+                          args.model_version))
+    except KeyboardInterrupt:
+        print("\nServer stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Script untuk memperbarui model dengan tweet berlabel baru (tanpa training ulang)
+Memerlukan bundle model (jalankan main.py terlebih dahulu)
+
+Jalankan dari root project:
+    python scripts/update_model.py data/tweets_baru.csv
+    python scripts/update_model.py data/tweets_baru.csv --compare
+"""
+
+import sys
+import os
+import argparse
+import time
+
+import pandas as pd
+
+# Get project root directory (parent of scripts folder)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.config import DATA_PATH, DATA_CHUNKSIZE, FEATURE_MODE
+from src.data_processing import load_data, prepare_data_for_training
+from src.models import train_naive_bayes, train_naive_bayes_hashed, iter_array_chunks
+from src.model_store import load_model_bundle
+from src.online import update, preprocess_new_rows
+from src.snapshot import load_training_frames
+from src.tokenizer_registry import get_tokenizer
+
+
+def full_retrain(df_train, df_test):
+    """Train from scratch the way main.py does; returns seconds taken."""
+    start = time.perf_counter()
+    (X_train, X_valid, X_test, y_train, y_valid, y_test,
+     y_train_le, y_valid_le, y_test_le) = prepare_data_for_training(df_train, df_test)
+    if FEATURE_MODE == 'hashing':
+        # The frames are already in memory here (the update needs them), so
+        # the chunks are cut from the arrays instead of streamed from the CSV
+        train_naive_bayes_hashed(
+            lambda: iter_array_chunks(X_train, y_train_le, DATA_CHUNKSIZE),
+            lambda: iter_array_chunks(X_test, y_test_le, DATA_CHUNKSIZE)
+        )
+    else:
+        train_naive_bayes(X_train, y_train_le, X_test, y_test_le)
+    return time.perf_counter() - start
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Perbarui model dengan tweet berlabel baru")
+    parser.add_argument('new_data', help="CSV tweet baru (kolom Text dan Sentiment)")
+    parser.add_argument('--version', type=int, default=None,
+                        help="Versi bundle awal (default: terbaru)")
+    parser.add_argument('--compare', action='store_true',
+                        help="Bandingkan waktu update dengan training ulang penuh")
+    args = parser.parse_args()
+
+    bundle = load_model_bundle(args.version)
+    new_df = load_data(args.new_data)
+    df_train, df_test = load_training_frames(DATA_PATH)
+    get_tokenizer()  # one-time load, not part of the update itself
+
+    print("=" * 60)
+    print(f"UPDATE MODEL (bundle v{bundle.version}, {len(new_df):,} tweet baru)")
+    print("=" * 60)
+    start = time.perf_counter()
+    updated = update(bundle, new_df, df_test['text_clean'].values, df_test['Sentiment'].values)
+    update_time = time.perf_counter() - start
+    print(f"\n✅ Bundle baru: v{updated.version} ({update_time:.2f} detik)")
+
+    if args.compare:
+        print("\n" + "=" * 60)
+        print("TRAINING ULANG PENUH (pembanding)")
+        print("=" * 60)
+        new_rows = preprocess_new_rows(new_df)
+        retrain_time = full_retrain(pd.concat([df_train, new_rows], ignore_index=True), df_test)
+        print(f"\n⏱️  Update: {update_time:.2f} detik")
+        print(f"⏱️  Training ulang penuh: {retrain_time:.2f} detik")
+        print(f"   Update {retrain_time / update_time:.1f}x lebih cepat")
+
+
+if __name__ == "__main__":
+    main()
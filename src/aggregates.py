@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Aggregates module
+Dashboard summaries (sentiment counts, tweets per day, text length
+statistics and histograms, token frequencies) computed once per dataset version and stored as
+small Arrow tables, so pages never scan the full corpus on a rerun
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from . import config
+from .snapshot import SNAPSHOT_TABLES, pipeline_settings, source_file_hash
+
+# Bump whenever the set of tables, their columns or their contents change
+AGGREGATES_SCHEMA_VERSION = 5
+
+# summary: one row per frame (rows, columns, text_len_mean, text_len_median, date_min, date_max);
+#   columns is the frame's column names joined with ','
+# sentiment_counts: frame, Sentiment, count (processed frames, sorted by Sentiment)
+# daily_counts: Date, counts (tweets per day of the raw training frame)
+# text_len_counts: frame, text_len, count (one row per distinct length, sorted)
+# text_len_by_sentiment: Sentiment, text_len, count of the processed training
+#   frame (length_stats.histogram_to_table)
+# token_counts: Sentiment, token, count of the processed training frame: words
+#   and word pairs per sentiment and of all texts (TokenFrequencyIndex.to_table)
+AGGREGATE_TABLES = ('summary', 'sentiment_counts', 'daily_counts', 'text_len_counts',
+                    'text_len_by_sentiment', 'token_counts')
+
+# Processed frames (SNAPSHOT_TABLES names) that have Sentiment and text_len
+PROCESSED_FRAMES = ('train', 'test')
+
+
+def dataset_version(data_path: str) -> str:
+    """Short hash of the source data, the pipeline settings and the aggregates schema."""
+    h = hashlib.sha256(source_file_hash(data_path).encode())
+    h.update(json.dumps(pipeline_settings(), sort_keys=True).encode())
+    h.update(str(AGGREGATES_SCHEMA_VERSION).encode())
+    return h.hexdigest()[:16]
+
+
+def _frame_summary(name: str, df: pd.DataFrame) -> Dict[str, object]:
+    lengths = df['text_len'] if 'text_len' in df.columns else None
+    dates = df['Date'] if 'Date' in df.columns else None
+    return {
+        'frame': name,
+        'rows': len(df),
+        'columns': ','.join(map(str, df.columns)),
+        'text_len_mean': float(lengths.mean()) if lengths is not None else np.nan,
+        'text_len_median': float(lengths.median()) if lengths is not None else np.nan,
+        'date_min': str(dates.min()) if dates is not None else None,
+        'date_max': str(dates.max()) if dates is not None else None,
+    }
+
+
+def _counts(name: str, values: pd.Series, column: str) -> pd.DataFrame:
+    counts = values.value_counts().sort_index()
+    return pd.DataFrame({'frame': name, column: counts.index.astype(np.int64),
+                         'count': counts.values.astype(np.int64)})
+
+
+def build_aggregates(frames: Dict[str, pd.DataFrame],
+                     token_index: Optional['TokenFrequencyIndex'] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Compute every dashboard summary from the full frames in one pass each.
+
+    Args:
+        frames: DataFrames keyed by SNAPSHOT_TABLES names
+        token_index: TokenFrequencyIndex of the processed training frame, if
+            the caller already built it (default: built from frames['train'])
+
+    Returns:
+        Dict of small DataFrames keyed by AGGREGATE_TABLES names
+    """
+    from .data_processing import daily_counts
+    from .length_stats import histogram_to_table, length_histogram
+    from .token_index import TokenFrequencyIndex
+
+    processed = [frames[name] for name in PROCESSED_FRAMES]
+    df_raw = frames['train_raw']
+    return {
+        'summary': pd.DataFrame([_frame_summary(name, frames[name]) for name in SNAPSHOT_TABLES]),
+        'sentiment_counts': pd.concat(
+            [_counts(name, df['Sentiment'], 'Sentiment') for name, df in zip(PROCESSED_FRAMES, processed)],
+            ignore_index=True),
+        'daily_counts': (daily_counts(df_raw) if 'Date' in df_raw.columns
+                         else pd.DataFrame({'Date': pd.Series(dtype=str), 'counts': pd.Series(dtype=np.int64)})),
+        'text_len_counts': pd.concat(
+            [_counts(name, df['text_len'], 'text_len') for name, df in zip(PROCESSED_FRAMES, processed)],
+            ignore_index=True),
+        'text_len_by_sentiment': histogram_to_table(
+            length_histogram(frames['train']['text_len'].values, frames['train']['Sentiment'].values)),
+        'token_counts': (token_index or TokenFrequencyIndex.from_frame(frames['train'])).to_table(),
+    }
+
+
+def _table_path(aggregates_dir: str, version: str, name: str) -> str:
+    return os.path.join(aggregates_dir, version, f'{name}.arrow')
+
+
+def write_aggregates(tables: Dict[str, pd.DataFrame], version: str,
+                     aggregates_dir: Optional[str] = None):
+    """Write the aggregate tables of one dataset version as Arrow IPC files (default: AGGREGATES_DIR)."""
+    import pyarrow as pa
+
+    aggregates_dir = aggregates_dir or config.AGGREGATES_DIR
+    os.makedirs(os.path.join(aggregates_dir, version), exist_ok=True)
+    for name in AGGREGATE_TABLES:
+        table = pa.Table.from_pandas(tables[name], preserve_index=False)
+        path = _table_path(aggregates_dir, version, name)
+        tmp_path = path + '.tmp'
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+
+def read_aggregates(version: str, aggregates_dir: Optional[str] = None,
+                    tables: Sequence[str] = AGGREGATE_TABLES) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Aggregate tables of a dataset version, or None if they were not built yet.
+
+    Args:
+        version: Dataset version (dataset_version)
+        aggregates_dir: Root directory of the aggregate store (default: AGGREGATES_DIR)
+        tables: AGGREGATE_TABLES names to read; the others stay on disk
+    """
+    aggregates_dir = aggregates_dir or config.AGGREGATES_DIR
+    paths = {name: _table_path(aggregates_dir, version, name) for name in AGGREGATE_TABLES}
+    if not all(os.path.isfile(path) for path in paths.values()):
+        return None
+
+    import pyarrow as pa
+    result = {}
+    for name in tables:
+        path = paths[name]
+        with pa.memory_map(path) as source:
+            result[name] = pa.ipc.open_file(source).read_all().to_pandas()
+    return result
+
+
+def load_aggregates(data_path: str, load_frames: Callable[[], Dict[str, pd.DataFrame]],
+                    aggregates_dir: Optional[str] = None,
+                    tables: Sequence[str] = AGGREGATE_TABLES) -> Dict[str, pd.DataFrame]:
+    """
+    Aggregate tables for the current dataset version, building them on first use.
+
+    Args:
+        data_path: Source CSV (identifies the dataset version)
+        load_frames: Returns the frames keyed by SNAPSHOT_TABLES names; only
+            called when the aggregates have to be built
+        aggregates_dir: Root directory of the aggregate store (default: AGGREGATES_DIR)
+        tables: AGGREGATE_TABLES names to return (all of them are built and written)
+    """
+    aggregates_dir = aggregates_dir or config.AGGREGATES_DIR
+    version = dataset_version(data_path)
+    result = read_aggregates(version, aggregates_dir, tables)
+    if result is None:
+        built = build_aggregates(load_frames())
+        write_aggregates(built, version, aggregates_dir)
+        print(f"Aggregates written to {os.path.join(aggregates_dir, version)}")
+        result = {name: built[name] for name in tables}
+    return result
+
+
+def frame_counts(tables: Dict[str, pd.DataFrame], table: str, frame: str) -> pd.DataFrame:
+    """Rows of sentiment_counts or text_len_counts for one frame."""
+    counts = tables[table]
+    return counts[counts['frame'] == frame].drop(columns='frame').reset_index(drop=True)
+
+
+def frame_columns(tables: Dict[str, pd.DataFrame], frame: str) -> List[str]:
+    """Column names of one frame, from the summary table."""
+    summary = tables['summary'].set_index('frame')
+    columns = summary.loc[frame, 'columns']
+    return columns.split(',') if columns else []
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Cache module
+Persistent, content-addressed cache of cleaned texts stored in SQLite
+"""
+
+import hashlib
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+from . import config
+from .text_cleaning import CLEANING_VERSION, clean_texts
+
+# Keep IN (...) lists below SQLite's bound-parameter limit
+_QUERY_BATCH = 900
+
+
+def text_key(text: str, version: str = CLEANING_VERSION) -> bytes:
+    """Hash a raw text together with the cleaning rules version."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(version.encode('utf-8'))
+    h.update(b'\x00')
+    h.update(text.encode('utf-8', 'surrogatepass'))
+    return h.digest()
+
+
+class CleanCache:
+    """
+    On-disk cache mapping hash(cleaning version + raw text) -> cleaned text.
+
+    Only texts missing from the cache are cleaned; hit and miss counts of the
+    most recent call are kept in `hits` and `misses`.
+    """
+
+    def __init__(self, path: Optional[str] = None, version: str = CLEANING_VERSION):
+        if path is None:
+            path = config.CLEAN_CACHE_PATH
+        self.path = path
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS clean_cache ("
+            "key BLOB PRIMARY KEY, cleaned TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, str]:
+        """Look up cleaned texts for the given keys; missing keys are omitted."""
+        keys = list(keys)
+        found = {}
+        for i in range(0, len(keys), _QUERY_BATCH):
+            batch = keys[i:i + _QUERY_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, cleaned FROM clean_cache WHERE key IN ({placeholders})", batch
+            )
+            found.update(rows)
+        return found
+
+    def put_many(self, items: Dict[bytes, str]):
+        """Store cleaned texts by key."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO clean_cache (key, cleaned) VALUES (?, ?)",
+                items.items()
+            )
+
+    def clean_texts(self, texts: List[str], n_jobs: Optional[int] = None,
+                    chunksize: Optional[int] = None) -> List[str]:
+        """Clean texts, reusing cached results and cleaning only new/changed ones."""
+        keys = [text_key(text, self.version) for text in texts]
+        found = self.get_many(set(keys))
+
+        # Clean each missing distinct text once
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        if missing:
+            cleaned = clean_texts(list(missing.values()), n_jobs=n_jobs, chunksize=chunksize)
+            new_items = dict(zip(missing.keys(), cleaned))
+            self.put_many(new_items)
+            found.update(new_items)
+
+        self.misses = sum(1 for key in keys if key in missing)
+        self.hits = len(keys) - self.misses
+        return [found[key] for key in keys]
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def clean_texts_cached(texts: List[str], cache_path: Optional[str] = None,
+                       n_jobs: Optional[int] = None,
+                       chunksize: Optional[int] = None) -> List[str]:
+    """Clean texts through the on-disk cache (default: CLEAN_CACHE_PATH) and report hit/miss counts."""
+    with CleanCache(cache_path) as cache:
+        cleaned = cache.clean_texts(texts, n_jobs=n_jobs, chunksize=chunksize)
+        print(f"Clean cache: {cache.hits} hits, {cache.misses} misses")
+    return cleaned
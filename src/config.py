@@ -2,10 +2,15 @@
 """
 Configuration file for sentiment analysis project
 Contains all constants and configuration settings
+
+The values below are defaults. Each one can be overridden without editing
+this file, by an environment variable SENTIMEN_<NAME> or by a JSON config
+file (path in SENTIMEN_CONFIG, default: config.json in the project root).
+Settings are resolved lazily on first access, so importing this module has
+no side effects and costs microseconds, also in worker subprocesses.
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 
 # ============================================================================
 # MODEL CONFIGURATION
@@ -14,6 +19,21 @@ SEED = 42
 MAX_TOKEN_LENGTH = 80
 MIN_TEXT_LENGTH = 4
 TEST_SIZE = 0.1  # For train/validation split
+TOKENIZE_BATCH_SIZE = 1024  # Texts per batch when computing token lengths
+DATA_CHUNKSIZE = 100000  # Rows per chunk when streaming the CSV
+
+# Feature extraction: 'count' (CountVectorizer, vocabulary grows with the corpus)
+# or 'hashing' (HashingVectorizer with a fixed number of features, trained
+# out-of-core with MultinomialNB.partial_fit on chunks streamed from the CSV)
+FEATURE_MODE = 'count'
+HASHING_N_FEATURES = 2 ** 18
+
+# ============================================================================
+# TEXT CLEANING CONFIGURATION
+# ============================================================================
+CLEAN_N_JOBS = -1  # Number of worker processes for clean_texts (-1 = all cores)
+CLEAN_CHUNKSIZE = None  # Texts per worker task (None = split evenly across workers)
+CLEAN_PARALLEL_MIN_TEXTS = 20000  # Below this, clean serially (pool startup costs more)
 
 # ============================================================================
 # SENTIMENT MAPPING
@@ -21,45 +41,184 @@ TEST_SIZE = 0.1  # For train/validation split
 SENTIMENT_MAP = {'Negative': 0, 'Neutral': 1, 'Positive': 2}
 SENTIMENT_LABELS = ['Negative', 'Neutral', 'Positive']
 
+# Columns the pipeline actually uses (read when streaming the CSV)
+PIPELINE_COLUMNS = ['Date', 'Text', 'Sentiment']
+
 # ============================================================================
-# FILE PATHS CONFIGURATION
+# SCORING SERVICE CONFIGURATION
 # ============================================================================
-# Set USE_COLAB to False if not using Google Colab
-USE_COLAB = True
+SERVE_HOST = '127.0.0.1'
+SERVE_PORT = 8000
+SERVE_MAX_BATCH_SIZE = 64  # Max requests coalesced into one prediction batch
+SERVE_MAX_WAIT_MS = 2.0  # Max time the first request of a batch waits for others
 
-import os
+# ============================================================================
+# FILE PATHS CONFIGURATION
+# ============================================================================
+# Read the data from Google Drive: True, False, or None to detect a Colab
+# runtime. The drive is only mounted when DATA_PATH is first used.
+USE_COLAB = None
 
 # Get the project root directory (parent of src folder)
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
+CACHE_DIR = os.path.join(PROJECT_ROOT, 'cache')
+MODELS_DIR = os.path.join(PROJECT_ROOT, 'models')
+
+# Tokenizer is loaded from TOKENIZER_DIR when present, otherwise downloaded once
+# from the Hugging Face hub and saved there for offline use
+TOKENIZER_NAME = 'bert-base-uncased'
+TOKENIZER_DIR = None  # None: MODELS_DIR/TOKENIZER_NAME
+
+# Versioned Naive Bayes bundles (models/naive_bayes/v0001, v0002, ...)
+MODEL_BUNDLE_DIR = None  # None: MODELS_DIR/naive_bayes
+
+# On-disk cache of cleaned texts, keyed by raw text hash + cleaning rules version
+USE_CLEAN_CACHE = True
+CLEAN_CACHE_PATH = None  # None: CACHE_DIR/clean_cache.sqlite
+
+# Preprocessed Arrow snapshot written by scripts/ingest.py; used instead of
+# re-running preprocessing when it matches the current data and settings
+USE_SNAPSHOT = True
+SNAPSHOT_DIR = None  # None: CACHE_DIR/snapshot
+
+# Dashboard aggregates (counts, text length statistics), one directory per
+# dataset version; built by scripts/ingest.py or on the dashboard's first run
+AGGREGATES_DIR = None  # None: CACHE_DIR/aggregates
+
+# Figures: 'interactive' (plt.show), 'save' (PNG files in PLOT_DIR) or 'off'
+# (figures are not built at all, e.g. on headless batch nodes)
+PLOT_MODE = 'interactive'
+PLOT_DIR = None  # None: PROJECT_ROOT/outputs/figures
 
 # Test size for splitting data into train and test sets
 DATA_TEST_SIZE = 0.2  # 20% for testing, 80% for training
 
-if USE_COLAB:
-    try:
-        from google.colab import drive
-        drive.mount('/content/drive')
-        DATA_PATH = '/content/drive/My Drive/tugas/Sentiment1.csv'
-    except ImportError:
-        print("Warning: google.colab not available, using local paths")
-        DATA_PATH = os.path.join(DATA_DIR, 'Sentiment1.csv')
-else:
-    DATA_PATH = os.path.join(DATA_DIR, 'Sentiment1.csv')
+# Data file; None means derive it from USE_COLAB (see _default_data_path)
+DATA_PATH = None
+COLAB_DATA_PATH = '/content/drive/My Drive/tugas/Sentiment1.csv'
 
 # Keep TRAIN_PATH and TEST_PATH for backward compatibility (will be set after splitting)
 TRAIN_PATH = None
 TEST_PATH = None
 
 # ============================================================================
-# VISUALIZATION STYLE CONFIGURATION
+# LAZY SETTINGS
 # ============================================================================
-def setup_plot_style():
-    """Configure matplotlib and seaborn styles."""
-    sns.set_style("whitegrid")
-    plt.rc("figure", autolayout=True)
-    plt.rc("axes", labelweight="bold", labelsize="large", titleweight="bold", titlepad=10)
+ENV_PREFIX = 'SENTIMEN_'
+CONFIG_FILE_ENV = ENV_PREFIX + 'CONFIG'
+DEFAULT_CONFIG_FILE = os.path.join(PROJECT_ROOT, 'config.json')
+
+
+def _parse_env(value: str, default):
+    """Convert an environment variable string to the type of the default."""
+    if isinstance(default, bool):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    if isinstance(default, (int, float)):
+        return type(default)(value)
+    if isinstance(default, str):
+        return value
+    # None, lists and dicts: JSON, falling back to the raw string
+    import json
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _default_data_path(settings) -> str:
+    """Local data file, or the Google Drive copy (mounting the drive) on Colab."""
+    use_colab = settings.USE_COLAB
+    if use_colab is None:
+        use_colab = 'COLAB_RELEASE_TAG' in os.environ
+    if use_colab:
+        try:
+            from google.colab import drive
+            drive.mount('/content/drive')
+            return settings.COLAB_DATA_PATH
+        except ImportError:
+            print("Warning: google.colab not available, using local paths")
+    return os.path.join(settings.DATA_DIR, 'Sentiment1.csv')
+
+
+# Settings whose default is computed from other settings on first use, so
+# overriding e.g. SENTIMEN_CACHE_DIR also moves everything stored under it
+_COMPUTED = {
+    'DATA_PATH': _default_data_path,
+    'TOKENIZER_DIR': lambda settings: os.path.join(settings.MODELS_DIR, settings.TOKENIZER_NAME),
+    'MODEL_BUNDLE_DIR': lambda settings: os.path.join(settings.MODELS_DIR, 'naive_bayes'),
+    'CLEAN_CACHE_PATH': lambda settings: os.path.join(settings.CACHE_DIR, 'clean_cache.sqlite'),
+    'SNAPSHOT_DIR': lambda settings: os.path.join(settings.CACHE_DIR, 'snapshot'),
+    'AGGREGATES_DIR': lambda settings: os.path.join(settings.CACHE_DIR, 'aggregates'),
+    'PLOT_DIR': lambda settings: os.path.join(settings.PROJECT_ROOT, 'outputs', 'figures'),
+}
+
+
+class Settings:
+    """
+    Lazily resolved configuration.
+
+    A setting is looked up on first attribute access: environment variable
+    SENTIMEN_<NAME>, then the JSON config file, then the default defined in
+    this module. Resolved values are cached; reset() forgets them.
+    """
+
+    def __init__(self, defaults: dict):
+        self._defaults = defaults
+        self._file_values = None
+
+    def _config_file(self) -> dict:
+        if self._file_values is None:
+            path = os.environ.get(CONFIG_FILE_ENV, DEFAULT_CONFIG_FILE)
+            self._file_values = {}
+            if os.path.isfile(path):
+                import json
+                with open(path, encoding='utf-8') as f:
+                    self._file_values = json.load(f)
+        return self._file_values
+
+    def __getattr__(self, name: str):
+        if name.startswith('_') or name not in self._defaults:
+            raise AttributeError(f"Unknown setting {name!r}")
+        default = self._defaults[name]
+        if ENV_PREFIX + name in os.environ:
+            value = _parse_env(os.environ[ENV_PREFIX + name], default)
+        elif name in self._config_file():
+            value = self._config_file()[name]
+        elif default is None and name in _COMPUTED:
+            value = _COMPUTED[name](self)
+        else:
+            value = default
+        setattr(self, name, value)
+        return value
+
+    def reset(self):
+        """Forget resolved values (e.g. after changing environment variables)."""
+        for name in list(vars(self)):
+            if not name.startswith('_'):
+                delattr(self, name)
+        self._file_values = None
+
+
+# The constants above become the defaults of `settings`; they are removed from
+# the module namespace so `from src.config import X` goes through __getattr__
+# below and picks up overrides.
+_DEFAULTS = {name: value for name, value in globals().items()
+             if name.isupper() and not name.startswith('_')
+             and name not in ('ENV_PREFIX', 'CONFIG_FILE_ENV', 'DEFAULT_CONFIG_FILE')}
+for _name in _DEFAULTS:
+    del globals()[_name]
+del _name
+
+settings = Settings(_DEFAULTS)
+
+
+def __getattr__(name: str):
+    try:
+        return getattr(settings, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-# Initialize plot style
-setup_plot_style()
 
+def __dir__():
+    return sorted(set(globals()) | set(_DEFAULTS))
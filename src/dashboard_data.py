@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+Dashboard data module
+Cached loaders, chart builders and page helpers shared by the two Streamlit
+entry points (dashboard.py and scripts/dashboard.py), which only differ in
+their layout and styling
+"""
+
+import importlib.util
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from . import config
+from .config import SENTIMENT_LABELS
+from .data_processing import load_data, split_data, preprocess_data, encode_sentiments
+from .aggregates import dataset_version, frame_columns, load_aggregates
+from .token_index import TokenFrequencyIndex
+from .length_stats import TextLengthIndex, box_stats, histogram_from_table, violin_density
+from .model_cache import BackgroundTrainer, find_bundle_version, source_fingerprint
+from .model_store import latest_version, load_model_bundle
+from .snapshot import load_snapshot
+
+# wordcloud (and the matplotlib it pulls in) is only imported on the word cloud page
+WORDCLOUD_AVAILABLE = importlib.util.find_spec('wordcloud') is not None
+
+# Aggregate tables read on every rerun; token_counts (vocabulary-sized) is only
+# loaded by the word cloud page through load_token_index
+PAGE_TABLES = ('summary', 'sentiment_counts', 'daily_counts', 'text_len_counts', 'text_len_by_sentiment')
+
+SENTIMENT_COLORS = {'Negative': '#FF6B6B', 'Neutral': '#FFD93D', 'Positive': '#6BCF7F'}
+
+
+def wordcloud_stopwords():
+    """WordCloud's stopword list (empty when wordcloud is not installed)."""
+    if not WORDCLOUD_AVAILABLE:
+        return set()
+    from wordcloud import STOPWORDS
+    return STOPWORDS
+
+
+@st.cache_resource
+def load_and_preprocess_data():
+    """Load and preprocess data once; the frames are shared by all sessions (do not modify)."""
+    try:
+        # Use the preprocessed snapshot (scripts/ingest.py) when it is up to date
+        frames = load_snapshot(config.DATA_PATH) if config.USE_SNAPSHOT else None
+        if frames is not None:
+            return frames['train_raw'], frames['test_raw'], frames['train'], frames['test']
+
+        # Load data from single CSV file
+        df = load_data(config.DATA_PATH)
+
+        # Split into train and test sets
+        df_train, df_test = split_data(df, test_size=config.DATA_TEST_SIZE)
+
+        # Preprocess
+        df_processed, df_test_processed = preprocess_data(df_train.copy(), df_test.copy())
+        df_processed, df_test_processed = encode_sentiments(df_processed, df_test_processed)
+
+        return df_train, df_test, df_processed, df_test_processed
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        return None, None, None, None
+
+
+def _snapshot_frames():
+    """Frames keyed by SNAPSHOT_TABLES names, for building the aggregates."""
+    df, df_test, df_processed, df_test_processed = load_and_preprocess_data()
+    return {'train_raw': df, 'test_raw': df_test, 'train': df_processed, 'test': df_test_processed}
+
+
+@st.cache_resource
+def load_dashboard_aggregates(version):
+    """PAGE_TABLES of a dataset version (built once, afterwards read from disk); shared, do not modify."""
+    return load_aggregates(config.DATA_PATH, _snapshot_frames, tables=PAGE_TABLES)
+
+
+@st.cache_resource
+def load_token_index(version):
+    """Per-sentiment token frequencies of a dataset version, shared by all sessions."""
+    tables = load_aggregates(config.DATA_PATH, _snapshot_frames, tables=('token_counts',))
+    return TokenFrequencyIndex.from_table(tables['token_counts'])
+
+
+@st.cache_resource
+def load_length_histogram(version):
+    """(sentiment, text_len) row counts of a dataset version, shared by all sessions."""
+    return histogram_from_table(load_dashboard_aggregates(version)['text_len_by_sentiment'])
+
+
+@st.cache_resource
+def load_length_index(version):
+    """text_len range index of the processed training data, shared by all sessions."""
+    _, _, df_processed, _ = load_and_preprocess_data()
+    return TextLengthIndex(df_processed['text_len'].values, df_processed['Sentiment'].values)
+
+
+@st.cache_resource
+def get_model_trainer():
+    """Background model trainer shared by all sessions."""
+    return BackgroundTrainer()
+
+
+@st.cache_resource
+def load_dashboard_model(version):
+    """Model bundle loaded once (memory-mapped) and shared by all sessions."""
+    return load_model_bundle(version)
+
+
+def load_frames():
+    """Row-level frames, only for pages that show rows."""
+    frames = load_and_preprocess_data()
+    if frames[0] is None:
+        st.error("Tidak dapat memuat data. Pastikan file CSV ada di folder data/")
+        st.stop()
+    return frames
+
+
+def load_page_aggregates():
+    """
+    Precomputed tables read by every page instead of the frames; stops the
+    script with an error message when the data cannot be loaded.
+
+    Returns:
+        tuple: (aggregates, summary indexed by frame, {frame: column names})
+    """
+    try:
+        aggregates = load_dashboard_aggregates(dataset_version(config.DATA_PATH))
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        st.error("Tidak dapat memuat data. Pastikan file CSV ada di folder data/")
+        st.stop()
+    summary = aggregates['summary'].set_index('frame')
+    columns = {frame: frame_columns(aggregates, frame) for frame in summary.index}
+    return aggregates, summary, columns
+
+
+def current_model_version():
+    """
+    Model bundle version for the current data + config. When there is none yet
+    it is trained in the background while the last good bundle is shown; stops
+    the script when no bundle exists at all.
+    """
+    fingerprint = source_fingerprint(config.DATA_PATH)
+    trainer = get_model_trainer()
+    version = find_bundle_version(fingerprint)
+    if version is None:
+        if trainer.status == 'failed' and st.button("Latih ulang model"):
+            trainer.retry(config.DATA_PATH, fingerprint)
+        trainer.start(config.DATA_PATH, fingerprint)
+        if trainer.status == 'failed':
+            st.error(f"Gagal melatih model: {trainer.error}")
+        else:
+            st.info("Model untuk data & konfigurasi saat ini sedang dilatih di latar belakang. "
+                    "Tekan \"Muat ulang\" untuk memeriksa hasilnya.")
+            st.button("Muat ulang")
+        version = latest_version()
+        if version is None:
+            st.stop()
+        st.caption(f"Menampilkan model terakhir yang tersedia (v{version}).")
+    return version
+
+
+def show_word_cloud(frequencies):
+    """Render a word cloud of {token: count} (or a hint when wordcloud is not installed)."""
+    if not WORDCLOUD_AVAILABLE:
+        st.info("⚠️ WordCloud tidak tersedia. Install dengan: `pip install wordcloud`")
+        return
+    try:
+        import matplotlib.pyplot as plt
+        from wordcloud import WordCloud
+
+        wordcloud = WordCloud(
+            width=800,
+            height=400,
+            background_color='white',
+            max_words=100
+        ).generate_from_frequencies(frequencies)
+
+        fig, ax = plt.subplots(figsize=(10, 5))
+        ax.imshow(wordcloud, interpolation='bilinear')
+        ax.axis('off')
+        st.pyplot(fig)
+    except Exception as e:
+        st.warning(f"Tidak dapat membuat word cloud: {str(e)}")
+
+
+def length_box_figure(histogram, min_length, max_length):
+    """Box plot per sentiment from precomputed statistics (no per-row data sent)."""
+    fig = go.Figure()
+    for sentiment, label in enumerate(SENTIMENT_LABELS):
+        stats = box_stats(histogram[sentiment], min_length, max_length)
+        if stats is None:
+            continue
+        color = SENTIMENT_COLORS[label]
+        fig.add_trace(go.Box(
+            x=[sentiment], q1=[stats['q1']], median=[stats['median']], q3=[stats['q3']],
+            lowerfence=[stats['lowerfence']], upperfence=[stats['upperfence']], mean=[stats['mean']],
+            name=label, marker_color=color, boxpoints=False
+        ))
+        if len(stats['outliers']):
+            # One marker per distinct outlier length, with its tweet count on hover
+            fig.add_trace(go.Scatter(
+                x=np.full(len(stats['outliers']), sentiment), y=stats['outliers'],
+                mode='markers', marker_color=color, name=label, showlegend=False,
+                customdata=stats['outlier_counts'],
+                hovertemplate='%{y} kata: %{customdata} tweet<extra></extra>'
+            ))
+    fig.update_layout(
+        title="Box Plot Panjang Teks per Sentimen",
+        xaxis_title="Sentimen",
+        yaxis_title="Panjang Teks (kata)"
+    )
+    fig.update_xaxes(tickmode='array', tickvals=[0, 1, 2], ticktext=SENTIMENT_LABELS)
+    return fig
+
+
+def length_violin_figure(histogram, min_length, max_length):
+    """Violin plot per sentiment from a precomputed kernel density (no per-row data sent)."""
+    fig = go.Figure()
+    for sentiment, label in enumerate(SENTIMENT_LABELS):
+        grid, density = violin_density(histogram[sentiment], min_length, max_length)
+        if not len(grid):
+            continue
+        half_width = 0.4 * density / density.max()
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([sentiment - half_width, (sentiment + half_width)[::-1]]).astype(np.float32),
+            y=np.concatenate([grid, grid[::-1]]).astype(np.float32),
+            fill='toself', mode='lines', line_color=SENTIMENT_COLORS[label],
+            name=label, hoverinfo='name'
+        ))
+    fig.update_layout(
+        title="Violin Plot Panjang Teks per Sentimen",
+        xaxis_title="Sentimen",
+        yaxis_title="Panjang Teks (kata)"
+    )
+    fig.update_xaxes(tickmode='array', tickvals=[0, 1, 2], ticktext=SENTIMENT_LABELS)
+    return fig
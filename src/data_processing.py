@@ -4,37 +4,147 @@ Data processing module
 Contains functions for loading, preprocessing, and preparing data
 """
 
+import copy
+import hashlib
+
 import numpy as np
 import pandas as pd
-from typing import Tuple
-
-from sklearn import preprocessing
-from sklearn.model_selection import train_test_split
-from imblearn.over_sampling import RandomOverSampler
-from transformers import BertTokenizerFast
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from .config import SEED, MAX_TOKEN_LENGTH, MIN_TEXT_LENGTH, TEST_SIZE, SENTIMENT_MAP
+from . import config
+from .config import SENTIMENT_MAP, SENTIMENT_LABELS, PIPELINE_COLUMNS
 from .text_cleaning import clean_texts
+from .cache import clean_texts_cached, text_key
+from .tokenizer_registry import get_tokenizer
+
+
+# Compact dtypes used when streaming the CSV
+CSV_DTYPES = {
+    'Sentiment': pd.CategoricalDtype(SENTIMENT_LABELS),
+    'Username': 'category',
+    'Length_Text': 'Int32',
+}
+
+
+def load_data(data_path: str, chunksize: Optional[int] = None,
+              usecols: Optional[List[str]] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Load data from CSV file.
 
+    Args:
+        data_path: Path to the CSV file
+        chunksize: If given, stream the file in chunks of this many rows
+            (see iter_data) instead of reading it all at once
+        usecols: Columns to read (streaming default: PIPELINE_COLUMNS)
 
-def load_data(data_path: str) -> pd.DataFrame:
-    """Load data from CSV file."""
-    df = pd.read_csv(data_path, encoding='ISO-8859-1')
+    Returns:
+        DataFrame, or an iterator of DataFrame chunks when chunksize is given
+    """
+    if chunksize is not None:
+        return iter_data(data_path, chunksize=chunksize, usecols=usecols or PIPELINE_COLUMNS)
+    df = pd.read_csv(data_path, encoding='ISO-8859-1', usecols=usecols)
     return df
 
 
-def split_data(df: pd.DataFrame, test_size: float = 0.2, random_state: int = SEED) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def iter_data(data_path: str, chunksize: Optional[int] = None,
+              usecols: Optional[List[str]] = PIPELINE_COLUMNS) -> Iterator[pd.DataFrame]:
+    """
+    Stream the CSV file in fixed-size DataFrame chunks (default: DATA_CHUNKSIZE rows).
+
+    Only usecols are parsed, with compact dtypes (categorical Sentiment and
+    Username, nullable Int32 Length_Text), so memory stays bounded by the
+    chunk size rather than the corpus size. Each chunk has its own Username
+    categories; combine chunks with concat_chunks, not pd.concat.
+    """
+    if chunksize is None:
+        chunksize = config.DATA_CHUNKSIZE
+    dtype = {col: col_dtype for col, col_dtype in CSV_DTYPES.items()
+             if usecols is None or col in usecols}
+    with pd.read_csv(data_path, encoding='ISO-8859-1', usecols=usecols,
+                     dtype=dtype, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+def concat_chunks(chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate iter_data chunks into one DataFrame.
+
+    pd.concat falls back to object dtype for categorical columns whose
+    categories differ between chunks (Username); here those columns are
+    combined with union_categoricals and stay categorical.
+    """
+    from pandas.api.types import union_categoricals
+
+    chunks = list(chunks)
+    if not chunks:
+        return pd.DataFrame()
+    categorical = [col for col in chunks[0].columns
+                   if isinstance(chunks[0][col].dtype, pd.CategoricalDtype)]
+    df = pd.concat([chunk.drop(columns=categorical) for chunk in chunks], ignore_index=True)
+    for col in categorical:
+        df[col] = union_categoricals([chunk[col] for chunk in chunks])
+    return df[chunks[0].columns]
+
+
+# Twitter date strings, e.g. "Wed Dec 13 23:47:11 +0000 2023"
+TWITTER_DATE_FORMAT = '%a %b %d %H:%M:%S %z %Y'
+
+
+def parse_twitter_dates(dates: pd.Series) -> pd.Series:
+    """
+    Parse Twitter-format date strings into datetime64[ns, UTC].
+
+    Uses an explicit format so pandas parses the whole column in its
+    vectorized path instead of inferring the format per element. Columns
+    that are already parsed are returned as-is (converted to UTC).
+    """
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        return dates.dt.tz_convert('UTC').astype('datetime64[ns, UTC]')
+    if pd.api.types.is_datetime64_dtype(dates.dtype):
+        return dates.dt.tz_localize('UTC').astype('datetime64[ns, UTC]')
+    return pd.to_datetime(dates, format=TWITTER_DATE_FORMAT, utc=True).astype('datetime64[ns, UTC]')
+
+
+def ensure_parsed_dates(df: pd.DataFrame, column: str = 'Date') -> pd.DataFrame:
+    """Parse df[column] in place (once; later calls are no-ops) and return df."""
+    if df[column].dtype != 'datetime64[ns, UTC]':
+        df[column] = parse_twitter_dates(df[column])
+    return df
+
+
+def daily_counts(df: pd.DataFrame, column: str = 'Date') -> pd.DataFrame:
+    """
+    Count rows per UTC day.
+
+    Returns:
+        DataFrame with 'Date' ('%Y-%m-%d' strings, sorted) and 'counts' columns
+    """
+    counts = parse_twitter_dates(df[column]).dt.floor('D').value_counts().sort_index()
+    return pd.DataFrame({
+        'Date': counts.index.strftime('%Y-%m-%d'),
+        'counts': counts.values
+    })
+
+
+def split_data(df: pd.DataFrame, test_size: float = 0.2,
+               random_state: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Split data into training and testing sets with stratification.
     
     Args:
         df: DataFrame containing the data
         test_size: Proportion of data to use for testing (default: 0.2)
-        random_state: Random seed for reproducibility
+        random_state: Random seed for reproducibility (default: SEED)
     
     Returns:
         Tuple of (train_df, test_df)
     """
+    from sklearn.model_selection import train_test_split
+
+    if random_state is None:
+        random_state = config.SEED
+
     # Check if Sentiment column exists
     if 'Sentiment' not in df.columns:
         raise ValueError("DataFrame must contain 'Sentiment' column for stratified splitting")
@@ -62,8 +172,11 @@ def split_data(df: pd.DataFrame, test_size: float = 0.2, random_state: int = SEE
     return train_df, test_df
 
 
-def preprocess_data(df: pd.DataFrame, df_test: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """Preprocess data: clean, remove duplicates, filter by length."""
+def preprocess_data(df: pd.DataFrame, df_test: pd.DataFrame,
+                    use_cache: Optional[bool] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Preprocess data: clean, remove duplicates, filter by length (use_cache default: USE_CLEAN_CACHE)."""
+    if use_cache is None:
+        use_cache = config.USE_CLEAN_CACHE
     # Select relevant columns
     df = df[['Text', 'Sentiment']].copy()
     df_test = df_test[['Text', 'Sentiment']].copy()
@@ -71,12 +184,13 @@ def preprocess_data(df: pd.DataFrame, df_test: pd.DataFrame) -> Tuple[pd.DataFra
     # Remove duplicates
     df.drop_duplicates(subset='Text', inplace=True)
 
-    # Clean texts
+    # Clean texts (through the on-disk cache so unchanged tweets are not re-cleaned)
+    clean = clean_texts_cached if use_cache else clean_texts
     print("Cleaning training texts...")
-    df['text_clean'] = clean_texts(df['Text'].tolist())
+    df['text_clean'] = clean(df['Text'].tolist())
     
     print("Cleaning test texts...")
-    df_test['text_clean'] = clean_texts(df_test['Text'].tolist())
+    df_test['text_clean'] = clean(df_test['Text'].tolist())
 
     # Calculate text lengths
     df['text_len'] = df['text_clean'].apply(lambda x: len(x.split()))
@@ -84,57 +198,205 @@ def preprocess_data(df: pd.DataFrame, df_test: pd.DataFrame) -> Tuple[pd.DataFra
 
     # Filter by minimum text length
     print(f"Before filtering: Train={df.shape[0]}, Test={df_test.shape[0]}")
-    df = df[df['text_len'] > MIN_TEXT_LENGTH].copy()
-    df_test = df_test[df_test['text_len'] > MIN_TEXT_LENGTH].copy()
+    min_text_length = config.MIN_TEXT_LENGTH
+    df = df[df['text_len'] > min_text_length].copy()
+    df_test = df_test[df_test['text_len'] > min_text_length].copy()
     print(f"After filtering: Train={df.shape[0]}, Test={df_test.shape[0]}")
 
     return df, df_test
 
 
-def process_token_lengths(df: pd.DataFrame, df_test: pd.DataFrame, 
-                         max_length: int = MAX_TOKEN_LENGTH) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """Process and filter data based on token lengths."""
-    tokenizer = BertTokenizerFast.from_pretrained('bert-base-uncased')
+def compute_token_lengths(tokenizer, texts: Sequence[str], batch_size: Optional[int] = None,
+                          truncation_length: int = 512) -> np.ndarray:
+    """
+    Compute token lengths (special tokens included) in batches.
 
-    # Process training data
-    print("Processing training token lengths...")
-    token_lens = []
-    for txt in df['text_clean'].values:
-        tokens = tokenizer.encode(txt, max_length=512, truncation=True)
-        token_lens.append(len(tokens))
+    Equivalent to len(tokenizer.encode(txt, max_length=truncation_length, truncation=True))
+    for each text, but fast tokenizers encode each batch in Rust and only the
+    lengths are read back, without building id lists in Python.
+
+    Args:
+        tokenizer: Hugging Face tokenizer (fast tokenizers use the Rust batch path)
+        texts: Texts to measure
+        batch_size: Number of texts per batch (default: TOKENIZE_BATCH_SIZE)
+        truncation_length: Lengths are truncated to this many tokens
+
+    Returns:
+        NumPy int array of token lengths, aligned with texts
+    """
+    if batch_size is None:
+        batch_size = config.TOKENIZE_BATCH_SIZE
+    texts = list(texts)
+    token_lens = np.empty(len(texts), dtype=np.int64)
+    backend = getattr(tokenizer, 'backend_tokenizer', None)
+    if backend is not None and (backend.truncation is not None or backend.padding is not None):
+        # An earlier tokenizer(..., truncation=True) call leaves its settings on
+        # the shared Rust tokenizer; measure with an unmodified copy instead
+        backend = copy.deepcopy(backend)
+        backend.no_truncation()
+        backend.no_padding()
+
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        if backend is not None:
+            # Truncating a single sequence keeps the special tokens, so the
+            # truncated length is simply capped at truncation_length
+            encodings = backend.encode_batch(batch, add_special_tokens=True)
+            lens = [min(len(encoding), truncation_length) for encoding in encodings]
+        else:
+            lens = tokenizer(batch, max_length=truncation_length, truncation=True,
+                             return_attention_mask=False, return_token_type_ids=False,
+                             return_length=True)['length']
+        token_lens[start:start + len(batch)] = lens
+
+    return token_lens
+
+
+def preprocess_chunks(chunks: Iterable[pd.DataFrame],
+                      use_cache: Optional[bool] = None) -> Iterator[pd.DataFrame]:
+    """
+    Streaming counterpart of preprocess_data for a single set of chunks.
+
+    Each chunk is cleaned, deduplicated on 'Text' (across chunks, by keeping
+    only a hash of every text already seen) and filtered by MIN_TEXT_LENGTH.
+    Empty chunks are skipped. use_cache defaults to USE_CLEAN_CACHE.
+    """
+    if use_cache is None:
+        use_cache = config.USE_CLEAN_CACHE
+    clean = clean_texts_cached if use_cache else clean_texts
+    min_text_length = config.MIN_TEXT_LENGTH
+    seen = set()
+
+    for chunk in chunks:
+        keys = [text_key(text) for text in chunk['Text']]
+        keep = np.zeros(len(keys), dtype=bool)
+        for i, key in enumerate(keys):
+            if key not in seen:
+                seen.add(key)
+                keep[i] = True
+        chunk = chunk[keep].copy()
+
+        chunk['text_clean'] = clean(chunk['Text'].tolist())
+        chunk['text_len'] = chunk['text_clean'].str.split().str.len()
+        chunk = chunk[chunk['text_len'] > min_text_length]
+        if len(chunk) > 0:
+            yield chunk
+
+
+def in_test_split(texts: Iterable[str], test_size: Optional[float] = None,
+                    random_state: Optional[int] = None) -> np.ndarray:
+    """
+    Rows that belong to the test split when the data is streamed.
+
+    A row is a test row when a keyed hash of its text falls in the lowest
+    test_size fraction of the hash range, so the assignment does not depend
+    on chunk boundaries or on which pass over the file is running, and equal
+    texts always land in the same split. test_size and random_state default
+    to DATA_TEST_SIZE and SEED.
+    """
+    if test_size is None:
+        test_size = config.DATA_TEST_SIZE
+    if random_state is None:
+        random_state = config.SEED
+    key = str(random_state).encode('ascii')
+    threshold = min(int(test_size * 2 ** 64), 2 ** 64 - 1)
+    buckets = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=8,
+                                        key=key).digest(), 'little') for text in texts),
+        dtype=np.uint64)
+    return buckets < np.uint64(threshold)
+
+
+def iter_training_chunks(data_path: str, split: str = 'train', chunksize: Optional[int] = None,
+                         test_size: Optional[float] = None, max_length: Optional[int] = None,
+                         tokenizer=None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Stream (texts, labels) chunks of one split of the CSV, out of core.
 
-    df['token_lens'] = token_lens
-    max_len = np.max(token_lens)
-    print(f"MAX TOKENIZED SENTENCE LENGTH (train): {max_len}")
+    Runs the pipeline chunk by chunk: iter_data (Text and Sentiment only),
+    preprocess_chunks (cleaning, deduplication, MIN_TEXT_LENGTH), the
+    in_test_split split, the max_length token filter and sentiment
+    encoding. Only one chunk is in memory at a time.
+
+    Args:
+        data_path: Path to the CSV file
+        split: 'train' or 'test'
+        chunksize: Rows read per chunk (default: DATA_CHUNKSIZE)
+        test_size: Fraction of rows in the test split (default: DATA_TEST_SIZE)
+        max_length: Rows with more tokens are dropped, as process_token_lengths
+            (default: MAX_TOKEN_LENGTH)
+        tokenizer: Tokenizer for the token lengths (default: get_tokenizer())
+
+    Yields:
+        Tuples of (cleaned texts as an object array, label encoded int64 array)
+    """
+    if split not in ('train', 'test'):
+        raise ValueError(f"split must be 'train' or 'test', got {split!r}")
+    if max_length is None:
+        max_length = config.MAX_TOKEN_LENGTH
+    if tokenizer is None:
+        tokenizer = get_tokenizer()
+
+    chunks = preprocess_chunks(iter_data(data_path, chunksize=chunksize, usecols=['Text', 'Sentiment']))
+    for chunk in chunks:
+        # Split on the cleaned text, so tweets that clean to the same text
+        # never end up on both sides
+        in_test = in_test_split(chunk['text_clean'], test_size)
+        chunk = chunk[in_test if split == 'test' else ~in_test]
+        labels = chunk['Sentiment'].astype(object).map(SENTIMENT_MAP)
+        texts = chunk['text_clean'].to_numpy(dtype=object)[labels.notna().values]
+        labels = labels.dropna().to_numpy(dtype=np.int64)
+        keep = compute_token_lengths(tokenizer, texts) <= max_length
+        if keep.any():
+            yield texts[keep], labels[keep]
+
+
+_SPLIT_NAMES = {'train': 'training', 'test': 'test'}
+
+
+def _remove_token_outliers(df: pd.DataFrame, max_length: int, split: str) -> pd.DataFrame:
+    """Drop rows whose token_lens exceed max_length, then shuffle."""
+    max_len = np.max(df['token_lens'].values)
+    print(f"MAX TOKENIZED SENTENCE LENGTH ({split}): {max_len}")
 
     # Find and remove outliers
     df = df.sort_values(by='token_lens', ascending=False)
     outliers = df[df['token_lens'] > max_length]
     if len(outliers) > 0:
-        print(f"Removing {len(outliers)} outliers from training data")
+        print(f"Removing {len(outliers)} outliers from {_SPLIT_NAMES[split]} data")
         df = df[df['token_lens'] <= max_length].copy()
-    
-    df = df.sample(frac=1, random_state=SEED).reset_index(drop=True)
 
-    # Process test data
-    print("Processing test token lengths...")
-    token_lens_test = []
-    for txt in df_test['text_clean'].values:
-        tokens = tokenizer.encode(txt, max_length=512, truncation=True)
-        token_lens_test.append(len(tokens))
+    return df.sample(frac=1, random_state=config.SEED).reset_index(drop=True)
 
-    df_test['token_lens'] = token_lens_test
-    max_len_test = np.max(token_lens_test)
-    print(f"MAX TOKENIZED SENTENCE LENGTH (test): {max_len_test}")
 
-    # Find and remove outliers
-    df_test = df_test.sort_values(by='token_lens', ascending=False)
-    outliers_test = df_test[df_test['token_lens'] > max_length]
-    if len(outliers_test) > 0:
-        print(f"Removing {len(outliers_test)} outliers from test data")
-        df_test = df_test[df_test['token_lens'] <= max_length].copy()
-    
-    df_test = df_test.sample(frac=1, random_state=SEED).reset_index(drop=True)
+def filter_token_lengths(df: pd.DataFrame, df_test: pd.DataFrame,
+                         max_length: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Filter data that already has a 'token_lens' column (e.g. from a snapshot)."""
+    if max_length is None:
+        max_length = config.MAX_TOKEN_LENGTH
+    return (_remove_token_outliers(df, max_length, 'train'),
+            _remove_token_outliers(df_test, max_length, 'test'))
+
+
+def process_token_lengths(df: pd.DataFrame, df_test: pd.DataFrame, 
+                         max_length: Optional[int] = None,
+                         batch_size: Optional[int] = None,
+                         tokenizer=None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Process and filter data based on token lengths (default: MAX_TOKEN_LENGTH)."""
+    if max_length is None:
+        max_length = config.MAX_TOKEN_LENGTH
+    if tokenizer is None:
+        tokenizer = get_tokenizer()
+
+    # Process training data
+    print("Processing training token lengths...")
+    df['token_lens'] = compute_token_lengths(tokenizer, df['text_clean'].values, batch_size)
+    df = _remove_token_outliers(df, max_length, 'train')
+
+    # Process test data
+    print("Processing test token lengths...")
+    df_test['token_lens'] = compute_token_lengths(tokenizer, df_test['text_clean'].values, batch_size)
+    df_test = _remove_token_outliers(df_test, max_length, 'test')
 
     return df, df_test
 
@@ -146,25 +408,105 @@ def encode_sentiments(df: pd.DataFrame, df_test: pd.DataFrame) -> Tuple[pd.DataF
     return df, df_test
 
 
-def prepare_data_for_training(df: pd.DataFrame, df_test: pd.DataFrame) -> Tuple:
-    """Prepare data for training with oversampling and train/validation split."""
-    # Oversample training data
-    ros = RandomOverSampler(random_state=SEED)
-    train_x, train_y = ros.fit_resample(
-        np.array(df['text_clean']).reshape(-1, 1),
-        np.array(df['Sentiment']).reshape(-1, 1)
-    )
-    train_os = pd.DataFrame(
-        list(zip([x[0] for x in train_x], train_y)),
-        columns=['text_clean', 'Sentiment']
-    )
+_ENCODERS = {}
+
+
+def _one_hot_encoder(n_classes: int) -> np.ndarray:
+    """Shared identity matrix whose rows are the one-hot codes."""
+    if n_classes not in _ENCODERS:
+        _ENCODERS[n_classes] = np.eye(n_classes, dtype=np.uint8)
+    return _ENCODERS[n_classes]
+
+
+def one_hot(labels: np.ndarray, n_classes: int = len(SENTIMENT_LABELS)) -> np.ndarray:
+    """One-hot encode labels 0..n_classes-1 as a compact uint8 matrix."""
+    return _one_hot_encoder(n_classes)[np.asarray(labels, dtype=np.intp)]
+
+
+class LazyOneHot:
+    """
+    One-hot view of label-encoded targets, computed on first use.
 
-    # Split into train and validation
-    X = train_os['text_clean'].values
-    y = train_os['Sentiment'].values
-    X_train, X_valid, y_train, y_valid = train_test_split(
-        X, y, test_size=TEST_SIZE, stratify=y, random_state=SEED
+    Behaves as the (n_samples, n_classes) uint8 array for np.asarray,
+    indexing, len and shape; callers that only use the label-encoded
+    arrays never pay for the encoding.
+    """
+
+    def __init__(self, labels: np.ndarray, n_classes: int = len(SENTIMENT_LABELS)):
+        self.labels = labels
+        self.n_classes = n_classes
+        self._array = None
+
+    def toarray(self) -> np.ndarray:
+        if self._array is None:
+            self._array = one_hot(self.labels, self.n_classes)
+        return self._array
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.toarray()
+        return array if dtype is None else array.astype(dtype)
+
+    def __getitem__(self, key):
+        return self.toarray()[key]
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (len(self.labels), self.n_classes)
+
+    @property
+    def dtype(self):
+        return np.dtype(np.uint8)
+
+
+def oversample_indices(y: np.ndarray, random_state: Optional[int] = None) -> np.ndarray:
+    """
+    Row indices of a randomly oversampled (class balanced) version of the data.
+
+    RandomOverSampler picks rows from the labels and random state alone, so
+    resampling row numbers instead of the texts selects exactly the same rows
+    without copying any text.
+    """
+    from imblearn.over_sampling import RandomOverSampler
+
+    ros = RandomOverSampler(random_state=config.SEED if random_state is None else random_state)
+    ros.fit_resample(np.arange(len(y)).reshape(-1, 1), y)
+    return ros.sample_indices_
+
+
+def training_indices(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Oversample and split df into train/validation, as row indices into df.
+
+    Returns:
+        Tuple of (train_idx, valid_idx); select texts with
+        df['text_clean'].values[train_idx] or matrix rows with X[train_idx]
+    """
+    from sklearn.model_selection import train_test_split
+
+    y = df['Sentiment'].values
+    indices = oversample_indices(y)
+    train_idx, valid_idx = train_test_split(
+        indices, test_size=config.TEST_SIZE, stratify=y[indices], random_state=config.SEED
     )
+    return train_idx, valid_idx
+
+
+def prepare_data_for_training(df: pd.DataFrame, df_test: pd.DataFrame) -> Tuple:
+    """
+    Prepare data for training with oversampling and train/validation split.
+
+    y_train, y_valid and y_test are LazyOneHot views of the label-encoded
+    y_*_le arrays; the one-hot matrices are only built when accessed.
+    """
+    # Oversample and split by row index; texts are only selected at the end
+    train_idx, valid_idx = training_indices(df)
+    texts = df['text_clean'].to_numpy(dtype=object)
+    labels = df['Sentiment'].to_numpy()
+    X_train, X_valid = texts[train_idx], texts[valid_idx]
+    y_train, y_valid = labels[train_idx], labels[valid_idx]
 
     # Prepare test data
     X_test = df_test['text_clean'].values
@@ -175,11 +517,10 @@ def prepare_data_for_training(df: pd.DataFrame, df_test: pd.DataFrame) -> Tuple:
     y_valid_le = y_valid.copy()
     y_test_le = y_test.copy()
 
-    # One-hot encode
-    ohe = preprocessing.OneHotEncoder()
-    y_train = ohe.fit_transform(np.array(y_train).reshape(-1, 1)).toarray()
-    y_valid = ohe.fit_transform(np.array(y_valid).reshape(-1, 1)).toarray()
-    y_test = ohe.fit_transform(np.array(y_test).reshape(-1, 1)).toarray()
+    # One-hot encode lazily, with one shared encoder
+    y_train = LazyOneHot(y_train_le)
+    y_valid = LazyOneHot(y_valid_le)
+    y_test = LazyOneHot(y_test_le)
 
     print(f"TRAINING DATA: {X_train.shape[0]}")
     print(f"VALIDATION DATA: {X_valid.shape[0]}")
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Inference module
+Low-latency sentiment prediction on top of a saved Naive Bayes bundle
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+from .config import SENTIMENT_LABELS
+from .model_store import ModelBundle, load_model_bundle
+from .text_cleaning import clean_texts
+
+
+class SentimentPredictor:
+    """
+    clean_text -> CountVectorizer -> TfidfTransformer -> MultinomialNB, fused.
+
+    Gives the same results as chaining the fitted estimators' transform and
+    predict calls, but builds the sparse matrix and applies TF-IDF and the
+    Naive Bayes log-likelihood directly, skipping sklearn's per-call input
+    validation that dominates single-tweet latency.
+    """
+
+    def __init__(self, bundle: ModelBundle):
+        self.bundle = bundle
+        vectorizer, tf_transformer, model = bundle.vectorizer, bundle.tf_transformer, bundle.model
+
+        # Hashed features are stateless; only CountVectorizer needs the vocabulary lookup
+        self._hashing = not hasattr(vectorizer, 'vocabulary_')
+        self._vectorizer = vectorizer
+        self._analyzer = vectorizer.build_analyzer()
+        self._vocabulary = None if self._hashing else vectorizer.vocabulary_
+        self._binary = vectorizer.binary
+        self._n_features = len(tf_transformer.idf_) if self._hashing else len(self._vocabulary)
+        self._idf = np.asarray(tf_transformer.idf_) if tf_transformer.use_idf else None
+        self._sublinear_tf = tf_transformer.sublinear_tf
+        self._norm = tf_transformer.norm
+
+        # Reorder classes so probability columns follow SENTIMENT_LABELS
+        order = np.argsort(np.asarray(model.classes_))
+        self._weights = np.ascontiguousarray(np.asarray(model.feature_log_prob_)[order].T)
+        self._prior = np.asarray(model.class_log_prior_)[order]
+        self.labels = [SENTIMENT_LABELS[int(c)] for c in np.asarray(model.classes_)[order]]
+
+    def _count_features(self, cleaned: List[str]) -> sp.csr_matrix:
+        """Term counts of already cleaned texts, as CountVectorizer.transform."""
+        vocabulary = self._vocabulary
+        indptr = [0]
+        indices = []
+        data = []
+        for text in cleaned:
+            counts = {}
+            for term in self._analyzer(text):
+                index = vocabulary.get(term)
+                if index is not None:
+                    counts[index] = counts.get(index, 0) + 1
+            indices.extend(counts.keys())
+            data.extend(counts.values())
+            indptr.append(len(indices))
+
+        return sp.csr_matrix((np.asarray(data, dtype=np.float64),
+                              np.asarray(indices, dtype=np.int32),
+                              np.asarray(indptr, dtype=np.int32)),
+                             shape=(len(cleaned), self._n_features))
+
+    def _features(self, cleaned: List[str]) -> sp.csr_matrix:
+        """TF-IDF features of already cleaned texts."""
+        if self._hashing:
+            X = self._vectorizer.transform(cleaned).astype(np.float64)
+        else:
+            X = self._count_features(cleaned)
+        if self._binary:
+            X.data.fill(1)
+        if self._sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1
+        if self._idf is not None:
+            X.data *= self._idf[X.indices]
+        if self._norm is not None and X.nnz:
+            rows = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+            if self._norm == 'l2':
+                row_norms = np.sqrt(np.bincount(rows, weights=X.data ** 2, minlength=X.shape[0]))
+            else:
+                row_norms = np.bincount(rows, weights=np.abs(X.data), minlength=X.shape[0])
+            row_norms[row_norms == 0] = 1.0
+            X.data /= row_norms[rows]
+        return X
+
+    def _joint_log_likelihood(self, texts: Iterable[str]) -> np.ndarray:
+        if isinstance(texts, str):
+            raise ValueError("Iterable over raw texts expected, string object received.")
+        texts = list(texts)
+        if not texts:
+            # HashingVectorizer.transform([]) raises instead of returning an empty matrix
+            return np.empty((0, len(self.labels)))
+        X = self._features(clean_texts(texts, n_jobs=1))
+        return np.asarray(X @ self._weights) + self._prior
+
+    def predict(self, texts: Iterable[str]) -> List[str]:
+        """Predict a sentiment label (from SENTIMENT_LABELS) for each raw text."""
+        jll = self._joint_log_likelihood(texts)
+        return [self.labels[i] for i in jll.argmax(axis=1)]
+
+    def predict_proba(self, texts: Iterable[str]) -> np.ndarray:
+        """Class probabilities for each raw text; columns follow self.labels."""
+        jll = self._joint_log_likelihood(texts)
+        jll -= jll.max(axis=1, keepdims=True)
+        proba = np.exp(jll)
+        proba /= proba.sum(axis=1, keepdims=True)
+        return proba
+
+
+_predictor = None
+_lock = threading.Lock()
+
+
+def get_predictor(version: Optional[int] = None) -> SentimentPredictor:
+    """Shared predictor for a bundle version (default: latest), loaded on first use."""
+    global _predictor
+    with _lock:
+        if _predictor is None or (version is not None and _predictor.bundle.version != version):
+            _predictor = SentimentPredictor(load_model_bundle(version))
+        return _predictor
+
+
+def predict(texts: Iterable[str]) -> List[str]:
+    """Predict sentiment labels for raw texts with the latest model bundle."""
+    return get_predictor().predict(texts)
+
+
+def predict_proba(texts: Iterable[str]) -> np.ndarray:
+    """Predict class probabilities (columns: SENTIMENT_LABELS) with the latest model bundle."""
+    return get_predictor().predict_proba(texts)
+
+
+def benchmark_predictor(predictor: SentimentPredictor, texts: List[str],
+                        batch_size: int = 1000, n_single: int = 1000) -> Dict[str, float]:
+    """
+    Measure single-tweet latency and batch throughput.
+
+    Returns:
+        dict with single-tweet latency percentiles (ms) and batch
+        throughput (tweets per second)
+    """
+    texts = list(texts)
+    predictor.predict(texts[:10])  # warm up
+
+    latencies = []
+    for i in range(n_single):
+        start = time.perf_counter()
+        predictor.predict([texts[i % len(texts)]])
+        latencies.append(time.perf_counter() - start)
+    latencies = np.array(latencies) * 1000
+
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        predictor.predict(texts[i:i + batch_size])
+    elapsed = time.perf_counter() - start
+
+    return {
+        'single_latency_ms_p50': float(np.percentile(latencies, 50)),
+        'single_latency_ms_p99': float(np.percentile(latencies, 99)),
+        'batch_size': batch_size,
+        'throughput_tweets_per_s': len(texts) / elapsed,
+    }
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Length statistics module
+Text length distributions per sentiment as count tables (one np.bincount
+pass), with box plot and violin statistics derived from the counts, so
+charts never need the per-row text_len values
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import SENTIMENT_LABELS
+
+
+def length_histogram(text_len, sentiments, n_classes: int = len(SENTIMENT_LABELS)) -> np.ndarray:
+    """
+    Row counts per (sentiment, text_len) in a single np.bincount pass.
+
+    Returns:
+        int64 array of shape (n_classes, max_len + 1); [s, n] is the number
+        of rows of sentiment s with text_len n
+    """
+    text_len = np.asarray(text_len, dtype=np.int64)
+    sentiments = np.asarray(sentiments, dtype=np.int64)
+    width = int(text_len.max()) + 1 if len(text_len) else 1
+    return np.bincount(sentiments * width + text_len,
+                       minlength=n_classes * width).reshape(n_classes, width)
+
+
+def histogram_to_table(histogram: np.ndarray) -> pd.DataFrame:
+    """Sentiment, text_len, count rows for the non-zero cells of a length_histogram."""
+    sentiments, lengths = np.nonzero(histogram)
+    return pd.DataFrame({'Sentiment': sentiments.astype(np.int64), 'text_len': lengths.astype(np.int64),
+                         'count': histogram[sentiments, lengths]})
+
+
+def histogram_from_table(table: pd.DataFrame, n_classes: int = len(SENTIMENT_LABELS)) -> np.ndarray:
+    """Inverse of histogram_to_table."""
+    width = int(table['text_len'].max()) + 1 if len(table) else 1
+    histogram = np.zeros((n_classes, width), dtype=np.int64)
+    histogram[table['Sentiment'].values, table['text_len'].values] = table['count'].values
+    return histogram
+
+
+def _value_at(values: np.ndarray, cumulative: np.ndarray, rank: int) -> float:
+    """rank-th (0-based) element of the sorted data described by values/cumulative counts."""
+    return float(values[np.searchsorted(cumulative, rank, side='right')])
+
+
+def quantile(values: np.ndarray, counts: np.ndarray, q: float) -> float:
+    """
+    q-quantile of data given as distinct sorted values and their counts.
+
+    Uses Plotly's default ('linear') quartile method, so box plots drawn from
+    these statistics match box plots drawn from the raw data.
+    """
+    cumulative = np.cumsum(counts)
+    n = int(cumulative[-1])
+    position = q * n - 0.5
+    if position <= 0:
+        return _value_at(values, cumulative, 0)
+    if position >= n - 1:
+        return _value_at(values, cumulative, n - 1)
+    lower = int(np.floor(position))
+    fraction = position - lower
+    low = _value_at(values, cumulative, lower)
+    high = _value_at(values, cumulative, lower + 1)
+    return low + (high - low) * fraction
+
+
+def _distribution(counts: np.ndarray, min_length: int, max_length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct lengths in [min_length, max_length] that occur, and their counts."""
+    start = max(min_length, 0)
+    window = counts[start:max_length + 1]
+    values = np.nonzero(window)[0]
+    return values + start, window[values]
+
+
+def box_stats(counts: np.ndarray, min_length: int = 0, max_length: int = np.iinfo(np.int64).max) -> Dict:
+    """
+    Box plot statistics of one sentiment's length counts within a length range.
+
+    Returns:
+        dict with n, mean, q1, median, q3, lowerfence, upperfence (Tukey 1.5
+        IQR fences snapped to data values, as Plotly draws them) and
+        outliers/outlier_counts (distinct values outside the fences); None
+        when no rows are in the range
+    """
+    values, value_counts = _distribution(counts, min_length, max_length)
+    if not len(values):
+        return None
+    q1, median, q3 = (quantile(values, value_counts, q) for q in (0.25, 0.5, 0.75))
+    iqr = q3 - q1
+    inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+    lowerfence = min(q1, float(values[inside][0])) if inside.any() else q1
+    upperfence = max(q3, float(values[inside][-1])) if inside.any() else q3
+    outside = (values < lowerfence) | (values > upperfence)
+    return {
+        'n': int(value_counts.sum()),
+        'mean': float(np.average(values, weights=value_counts)),
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'lowerfence': lowerfence,
+        'upperfence': upperfence,
+        'outliers': values[outside].astype(float),
+        'outlier_counts': value_counts[outside],
+    }
+
+
+def violin_density(counts: np.ndarray, min_length: int = 0, max_length: int = np.iinfo(np.int64).max,
+                   points: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gaussian kernel density of one sentiment's lengths within a length range.
+
+    Uses Plotly's violin defaults (Silverman-style bandwidth, 'soft' span of
+    two bandwidths past the data). The density is evaluated from the distinct
+    lengths weighted by their counts, so the cost depends on the number of
+    distinct lengths, not on the number of rows.
+
+    Returns:
+        (grid, density) arrays of `points` values; empty arrays when no rows
+        are in the range
+    """
+    values, value_counts = _distribution(counts, min_length, max_length)
+    if not len(values):
+        return np.empty(0), np.empty(0)
+    n = int(value_counts.sum())
+    values = values.astype(np.float64)
+    data_range = values[-1] - values[0]
+    if data_range == 0:
+        return values[:1], np.ones(1)
+
+    mean = np.average(values, weights=value_counts)
+    std = np.sqrt(np.sum(value_counts * (values - mean) ** 2) / max(n - 1, 1))
+    iqr = quantile(values, value_counts, 0.75) - quantile(values, value_counts, 0.25)
+    bandwidth = max(1.059 * min(std, iqr / 1.349) * n ** -0.2, data_range / 100)
+
+    grid = np.linspace(values[0] - 2 * bandwidth, values[-1] + 2 * bandwidth, points)
+    z = (grid[:, None] - values[None, :]) / bandwidth
+    density = (np.exp(-0.5 * z * z) * value_counts).sum(axis=1) / (n * bandwidth * np.sqrt(2 * np.pi))
+    return grid, density
+
+
+class TextLengthIndex:
+    """
+    Rows ordered by text_len, for range queries without scanning the frame.
+
+    Keeps a stable argsort of text_len (rows of equal length stay in their
+    original order), the start offset of every length in it, and cumulative
+    counts per sentiment, so min/max length filters are answered with prefix
+    sums and slices instead of a boolean mask over all rows.
+    """
+
+    def __init__(self, text_len, sentiments, n_classes: int = len(SENTIMENT_LABELS)):
+        text_len = np.asarray(text_len, dtype=np.int64)
+        order = np.argsort(text_len, kind='stable')
+        self.order = order.astype(np.int32) if len(order) < np.iinfo(np.int32).max else order
+        self.histogram = length_histogram(text_len, sentiments, n_classes)
+        # cumulative[s, n]: rows of sentiment s with text_len < n
+        self.cumulative = np.zeros((n_classes, self.histogram.shape[1] + 1), dtype=np.int64)
+        np.cumsum(self.histogram, axis=1, out=self.cumulative[:, 1:])
+        # offsets[n]: position in order of the first row with text_len >= n
+        self.offsets = self.cumulative.sum(axis=0)
+
+    def _bounds(self, min_length: int, max_length: int) -> Tuple[int, int]:
+        """[min_length, max_length] as a half-open range of cumulative columns."""
+        width = self.histogram.shape[1]
+        start = min(max(int(min_length), 0), width)
+        stop = min(max(int(max_length) + 1, start), width)
+        return start, stop
+
+    def counts_by_sentiment(self, min_length: int, max_length: int) -> np.ndarray:
+        """Rows per sentiment with min_length <= text_len <= max_length."""
+        start, stop = self._bounds(min_length, max_length)
+        return self.cumulative[:, stop] - self.cumulative[:, start]
+
+    def count(self, min_length: int, max_length: int) -> int:
+        """Rows with min_length <= text_len <= max_length."""
+        start, stop = self._bounds(min_length, max_length)
+        return int(self.offsets[stop] - self.offsets[start])
+
+    def rows(self, min_length: int, max_length: int) -> np.ndarray:
+        """Positions of the rows in the range, ordered by text_len (a view, no copy)."""
+        start, stop = self._bounds(min_length, max_length)
+        return self.order[self.offsets[start]:self.offsets[stop]]
+
+    def head(self, min_length: int, max_length: int, n: int = 100) -> np.ndarray:
+        """
+        Positions of the first n rows in the range, in original row order.
+
+        Same rows as df[(df.text_len >= min_length) & (df.text_len <= max_length)].head(n),
+        found by merging the first n positions of each length instead of
+        scanning every row.
+        """
+        start, stop = self._bounds(min_length, max_length)
+        firsts = [self.order[self.offsets[length]:min(self.offsets[length] + n, self.offsets[length + 1])]
+                  for length in range(start, stop) if self.offsets[length + 1] > self.offsets[length]]
+        if not firsts:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(firsts))[:n]
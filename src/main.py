@@ -12,22 +12,26 @@ Atau jika ingin menjalankan file ini langsung, pastikan dijalankan dari root:
 
 import sys
 import os
-import pandas as pd
 
 # Handle both relative and absolute imports
 try:
     # Try relative imports first (when run as module)
-    from .config import DATA_PATH, DATA_TEST_SIZE
+    from .config import DATA_PATH, DATA_TEST_SIZE, DATA_CHUNKSIZE, FEATURE_MODE, USE_SNAPSHOT
     from .data_processing import (
         load_data,
         split_data,
+        ensure_parsed_dates,
         preprocess_data,
         process_token_lengths,
+        filter_token_lengths,
         encode_sentiments,
         prepare_data_for_training
     )
-    from .visualization import plot_tweets_by_date, plot_text_length_distribution
-    from .models import train_naive_bayes
+    from .visualization import plot_tweets_by_date, plot_text_length_distribution, plot_confusion_matrix
+    from .models import train_naive_bayes, train_naive_bayes_streaming
+    from .snapshot import load_snapshot
+    from .model_store import save_model_bundle, data_fingerprint
+    from .model_cache import source_fingerprint
 except ImportError:
     # Fall back to absolute imports (when run directly)
     # Add parent directory to path
@@ -36,70 +40,105 @@ except ImportError:
     if parent_dir not in sys.path:
         sys.path.insert(0, parent_dir)
     
-    from src.config import DATA_PATH, DATA_TEST_SIZE
+    from src.config import DATA_PATH, DATA_TEST_SIZE, DATA_CHUNKSIZE, FEATURE_MODE, USE_SNAPSHOT
     from src.data_processing import (
         load_data,
         split_data,
+        ensure_parsed_dates,
         preprocess_data,
         process_token_lengths,
+        filter_token_lengths,
         encode_sentiments,
         prepare_data_for_training
     )
-    from src.visualization import plot_tweets_by_date, plot_text_length_distribution
-    from src.models import train_naive_bayes
-
-
-def main():
-    """Main execution function."""
-    # Load data
-    print("Loading data...")
-    df = load_data(DATA_PATH)
-    print(f"Total data shape: {df.shape}")
+    from src.visualization import plot_tweets_by_date, plot_text_length_distribution, plot_confusion_matrix
+    from src.models import train_naive_bayes, train_naive_bayes_streaming
+    from src.snapshot import load_snapshot
+    from src.model_store import save_model_bundle, data_fingerprint
+    from src.model_cache import source_fingerprint
+
+
+def load_training_data():
+    """Preprocessed train/test frames (from the snapshot when up to date), plotting the data on the way."""
+    # Use the preprocessed snapshot (scripts/ingest.py) when it is up to date
+    frames = load_snapshot(DATA_PATH) if USE_SNAPSHOT else None
+    if frames is None:
+        # Load data
+        print("Loading data...")
+        df = load_data(DATA_PATH)
+        print(f"Total data shape: {df.shape}")
     
-    # Display basic info
-    print("\nFirst few rows of data:")
-    print(df.head())
-    print("\nDataFrame info:")
-    df.info()
+        # Display basic info
+        print("\nFirst few rows of data:")
+        print(df.head())
+        print("\nDataFrame info:")
+        df.info()
     
-    # Display sentiment distribution before splitting
-    print("\nSentiment distribution (before splitting):")
-    print(df['Sentiment'].value_counts())
+        # Display sentiment distribution before splitting
+        print("\nSentiment distribution (before splitting):")
+        print(df['Sentiment'].value_counts())
 
-    # Split data into training and testing sets
-    print("\n" + "="*50)
-    print("Splitting data into training and testing sets...")
-    print("="*50)
-    df_train, df_test = split_data(df, test_size=DATA_TEST_SIZE)
+        # Split data into training and testing sets
+        print("\n" + "="*50)
+        print("Splitting data into training and testing sets...")
+        print("="*50)
+        df_train_raw, df_test_raw = split_data(df, test_size=DATA_TEST_SIZE)
 
-    # Plot tweets by date (if Date column exists)
-    if 'Date' in df_train.columns:
-        df_train['Date'] = pd.to_datetime(df_train['Date'])
-        plot_tweets_by_date(df_train)
+        # Preprocess data
+        df_processed, df_test_processed = preprocess_data(df_train_raw, df_test_raw)
 
-    # Preprocess data
-    df_train, df_test = preprocess_data(df_train, df_test)
+        # Process token lengths
+        df_train, df_test = process_token_lengths(df_processed, df_test_processed)
 
-    # Visualize text length distribution
-    plot_text_length_distribution(df_train, 'Training tweets with less than 10 words')
-    plot_text_length_distribution(df_test, 'Test tweets with less than 10 words')
+        # Encode sentiments
+        df_train, df_test = encode_sentiments(df_train, df_test)
+    else:
+        df_train_raw = frames['train_raw']
+        df_processed, df_test_processed = frames['train'], frames['test']
+        df_train, df_test = filter_token_lengths(frames['train'], frames['test'])
 
-    # Process token lengths
-    df_train, df_test = process_token_lengths(df_train, df_test)
+    # Plot tweets by date (if Date column exists)
+    if 'Date' in df_train_raw.columns:
+        ensure_parsed_dates(df_train_raw)
+        plot_tweets_by_date(df_train_raw)
 
-    # Encode sentiments
-    df_train, df_test = encode_sentiments(df_train, df_test)
-    print("\nTraining set sentiment distribution (after encoding):")
-    print(df_train['Sentiment'].value_counts())
+    # Visualize text length distribution
+    plot_text_length_distribution(df_processed, 'Training tweets with less than 10 words')
+    plot_text_length_distribution(df_test_processed, 'Test tweets with less than 10 words')
 
-    # Prepare data for training
-    (X_train, X_valid, X_test, y_train, y_valid, y_test,
-     y_train_le, y_valid_le, y_test_le) = prepare_data_for_training(df_train, df_test)
+    return df_train, df_test
 
-    # Train Naive Bayes
-    nb_model, vectorizer, tf_transformer, metrics = train_naive_bayes(
-        X_train, y_train_le, X_test, y_test_le
-    )
+
+def main():
+    """Main execution function."""
+    if FEATURE_MODE == 'hashing':
+        # Out of core: the CSV is streamed chunk by chunk and never loaded
+        # whole, so the data plots of load_training_data are skipped
+        nb_model, vectorizer, tf_transformer, metrics, fingerprint = train_naive_bayes_streaming(
+            DATA_PATH, DATA_CHUNKSIZE
+        )
+    else:
+        df_train, df_test = load_training_data()
+
+        print("\nTraining set sentiment distribution (after encoding):")
+        print(df_train['Sentiment'].value_counts())
+
+        # Prepare data for training
+        (X_train, X_valid, X_test, y_train, y_valid, y_test,
+         y_train_le, y_valid_le, y_test_le) = prepare_data_for_training(df_train, df_test)
+
+        # Train Naive Bayes
+        nb_model, vectorizer, tf_transformer, metrics = train_naive_bayes(
+            X_train, y_train_le, X_test, y_test_le
+        )
+        fingerprint = data_fingerprint(X_train, y_train_le)
+
+    # Save the trained pipeline as a new model bundle version
+    save_model_bundle(nb_model, vectorizer, tf_transformer, metrics, fingerprint,
+                      source_fingerprint=source_fingerprint(DATA_PATH))
+
+    # Plot after training so plotting never counts towards training time
+    plot_confusion_matrix(title="Naive Bayes Confusion Matrix", cm=metrics['confusion_matrix'])
 
     # Display summary
     print("\n" + "="*60)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Metrics module
+Classification metrics derived from a single confusion matrix
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .config import SENTIMENT_LABELS
+
+# Column names of sklearn's classification_report
+_REPORT_HEADERS = ('precision', 'recall', 'f1-score', 'support')
+
+
+def confusion_matrix_counts(y_true, y_pred, n_classes: int = len(SENTIMENT_LABELS)) -> np.ndarray:
+    """
+    Confusion matrix (rows: true class, columns: predicted class) in one pass.
+
+    Labels must be encoded as 0..n_classes-1. Unlike sklearn's
+    confusion_matrix the shape is always (n_classes, n_classes), even when a
+    class never occurs.
+    """
+    y_true = np.asarray(y_true, dtype=np.int64)
+    y_pred = np.asarray(y_pred, dtype=np.int64)
+    return np.bincount(y_true * n_classes + y_pred,
+                       minlength=n_classes * n_classes).reshape(n_classes, n_classes)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator, 0 where the denominator is 0 (zero_division=0)."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def metrics_from_confusion_matrix(cm: np.ndarray,
+                                  labels: Sequence[str] = SENTIMENT_LABELS) -> Dict:
+    """
+    Every evaluation metric of train_naive_bayes, derived from one confusion matrix.
+
+    Matches sklearn's accuracy_score, precision/recall/f1_score (average=None,
+    'macro' and 'weighted', zero_division=0) and classification_report(output_dict=True).
+
+    Returns:
+        dict: accuracy, precision, recall, f1_score (each with per_class,
+        macro and weighted), confusion_matrix, classification_report
+    """
+    cm = np.asarray(cm)
+    tp = np.diag(cm).astype(np.float64)
+    support = cm.sum(axis=1)
+    predicted = cm.sum(axis=0)
+    total = support.sum()
+
+    accuracy = float(_safe_divide(tp.sum(), total))
+    scores = {
+        'precision': _safe_divide(tp, predicted),
+        'recall': _safe_divide(tp, support),
+        'f1_score': _safe_divide(2 * tp, support + predicted),
+    }
+    metrics = {'accuracy': accuracy}
+    averages = {}
+    # Like sklearn, macro averages only cover classes that occur in y_true or y_pred
+    present = (support + predicted) > 0
+    for name, per_class in scores.items():
+        macro = per_class[present].mean() if present.any() else 0.0
+        weighted = np.average(per_class, weights=support) if total else 0.0
+        averages[name] = (float(macro), float(weighted))
+        metrics[name] = {
+            'per_class': {label: float(per_class[i]) for i, label in enumerate(labels)},
+            'macro': averages[name][0],
+            'weighted': averages[name][1],
+        }
+    metrics['confusion_matrix'] = cm.tolist()
+
+    report = {}
+    for i, label in enumerate(labels):
+        report[label] = dict(zip(_REPORT_HEADERS, (float(scores['precision'][i]),
+                                                   float(scores['recall'][i]),
+                                                   float(scores['f1_score'][i]),
+                                                   float(support[i]))))
+    report['accuracy'] = accuracy
+    for heading, k in (('macro avg', 0), ('weighted avg', 1)):
+        report[heading] = dict(zip(_REPORT_HEADERS, (averages['precision'][k],
+                                                     averages['recall'][k],
+                                                     averages['f1_score'][k],
+                                                     float(total))))
+    metrics['classification_report'] = report
+
+    return metrics
+
+
+def format_classification_report(report: Dict, labels: List[str] = SENTIMENT_LABELS,
+                                 digits: int = 2) -> str:
+    """Text layout of sklearn's classification_report, from its output_dict form."""
+    width = max(max(len(label) for label in labels), len('weighted avg'), digits)
+    row_fmt = "{:>{width}s} " + " {:>9.{digits}f}" * 3 + " {:>9}\n"
+
+    text = ("{:>{width}s} " + " {:>9}" * len(_REPORT_HEADERS)).format(
+        "", *_REPORT_HEADERS, width=width)
+    text += "\n\n"
+    for label in labels:
+        row = report[label]
+        text += row_fmt.format(label, row['precision'], row['recall'], row['f1-score'],
+                               int(row['support']), width=width, digits=digits)
+    text += "\n"
+
+    total = int(report['macro avg']['support'])
+    text += ("{:>{width}s} " + " {:>9.{digits}}" * 2 + " {:>9.{digits}f}" + " {:>9}\n").format(
+        'accuracy', "", "", report['accuracy'], total, width=width, digits=digits)
+    for heading in ('macro avg', 'weighted avg'):
+        row = report[heading]
+        text += row_fmt.format(heading, row['precision'], row['recall'], row['f1-score'],
+                               total, width=width, digits=digits)
+    return text
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Model cache module
+Model bundles keyed by a fingerprint of the source data and configuration,
+trained in a background thread so the dashboard can keep serving the last
+good bundle in the meantime
+"""
+
+import hashlib
+import json
+import os
+import threading
+import traceback
+from typing import Dict, Optional
+
+from . import config
+from .model_store import ModelBundle, list_versions, load_model_bundle, read_manifest
+from .snapshot import pipeline_settings, source_file_hash
+
+
+def training_settings() -> Dict[str, object]:
+    """Settings that change the trained model besides the source data."""
+    settings = pipeline_settings()
+    settings.update({
+        'max_token_length': config.MAX_TOKEN_LENGTH,
+        'test_size': config.TEST_SIZE,
+        'feature_mode': config.FEATURE_MODE,
+        'hashing_n_features': config.HASHING_N_FEATURES,
+    })
+    return settings
+
+
+def source_fingerprint(data_path: str) -> str:
+    """
+    SHA-256 over the source file contents and training_settings().
+
+    The file is only re-hashed when its modification time or size changes,
+    so this is cheap to call on every dashboard rerun.
+    """
+    h = hashlib.sha256(source_file_hash(data_path).encode())
+    h.update(json.dumps(training_settings(), sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def find_bundle_version(fingerprint: str, bundle_dir: Optional[str] = None) -> Optional[int]:
+    """Newest bundle version trained for source fingerprint, or None (default dir: MODEL_BUNDLE_DIR)."""
+    for version in reversed(list_versions(bundle_dir)):
+        if read_manifest(version, bundle_dir).get('source_fingerprint') == fingerprint:
+            return version
+    return None
+
+
+def train_bundle(data_path: str, bundle_dir: Optional[str] = None) -> ModelBundle:
+    """
+    Train the Naive Bayes pipeline the way main.py does and save it as a bundle.
+
+    The bundle records the source fingerprint, so find_bundle_version can
+    find it again without retraining.
+    """
+    from .data_processing import prepare_data_for_training
+    from .models import train_naive_bayes, train_naive_bayes_streaming
+    from .model_store import data_fingerprint, save_model_bundle
+    from .snapshot import load_training_frames
+
+    fingerprint = source_fingerprint(data_path)
+    if config.FEATURE_MODE == 'hashing':
+        # Streamed from the CSV chunk by chunk, as main.py does
+        nb_model, vectorizer, tf_transformer, metrics, data_fp = train_naive_bayes_streaming(
+            data_path, config.DATA_CHUNKSIZE
+        )
+    else:
+        df_train, df_test = load_training_frames(data_path)
+        (X_train, X_valid, X_test, y_train, y_valid, y_test,
+         y_train_le, y_valid_le, y_test_le) = prepare_data_for_training(df_train, df_test)
+        nb_model, vectorizer, tf_transformer, metrics = train_naive_bayes(
+            X_train, y_train_le, X_test, y_test_le
+        )
+        data_fp = data_fingerprint(X_train, y_train_le)
+
+    path = save_model_bundle(nb_model, vectorizer, tf_transformer, metrics, data_fp, bundle_dir,
+                             source_fingerprint=fingerprint)
+    return load_model_bundle(int(os.path.basename(path)[1:]), bundle_dir)
+
+
+class BackgroundTrainer:
+    """
+    Runs train_bundle in a daemon thread, at most one job at a time.
+
+    One instance is meant to be shared by all dashboard sessions (e.g. via
+    st.cache_resource); sessions poll status/error on rerun.
+    """
+
+    def __init__(self, bundle_dir: Optional[str] = None):
+        self.bundle_dir = bundle_dir
+        self.fingerprint = None
+        self.status = 'idle'  # 'idle', 'running', 'done' or 'failed'
+        self.error = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self, data_path: str, fingerprint: str) -> bool:
+        """
+        Start training for fingerprint unless a job is running or this
+        fingerprint already failed (see retry).
+
+        Returns:
+            True if a new job was started
+        """
+        with self._lock:
+            if self.status == 'running' or (self.fingerprint == fingerprint and self.status == 'failed'):
+                return False
+            self.fingerprint = fingerprint
+            self.status = 'running'
+            self.error = None
+            self._thread = threading.Thread(target=self._run, args=(data_path,),
+                                            name='model-trainer', daemon=True)
+            self._thread.start()
+            return True
+
+    def retry(self, data_path: str, fingerprint: str) -> bool:
+        """Start training again after a failed job."""
+        with self._lock:
+            if self.status == 'failed':
+                self.status = 'idle'
+        return self.start(data_path, fingerprint)
+
+    def _run(self, data_path: str):
+        try:
+            train_bundle(data_path, self.bundle_dir)
+        except Exception as e:
+            traceback.print_exc()
+            with self._lock:
+                self.status = 'failed'
+                self.error = f"{type(e).__name__}: {e}"
+        else:
+            with self._lock:
+                self.status = 'done'
+
+    @property
+    def running(self) -> bool:
+        return self.status == 'running'
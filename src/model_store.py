@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+Model store module
+Save and load versioned Naive Bayes model bundles
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from . import config
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer, TfidfTransformer
+    from sklearn.naive_bayes import MultinomialNB
+
+# Bump whenever the on-disk layout of a bundle changes
+BUNDLE_FORMAT_VERSION = 1
+
+# Fitted arrays, stored as .npy so they can be memory-mapped on load
+_NB_ARRAYS = ('classes_', 'class_count_', 'feature_count_', 'class_log_prior_', 'feature_log_prob_')
+
+
+class ModelBundle(NamedTuple):
+    """A trained pipeline together with its metadata."""
+    model: 'MultinomialNB'
+    vectorizer: Union['CountVectorizer', 'HashingVectorizer']
+    tf_transformer: 'TfidfTransformer'
+    metrics: Dict
+    fingerprint: str
+    version: int
+    path: str
+
+
+def data_fingerprint(texts, labels) -> str:
+    """SHA-256 over the training texts and labels, in order."""
+    h = hashlib.sha256()
+    for text in texts:
+        h.update(str(text).encode('utf-8', 'surrogatepass'))
+        h.update(b'\x00')
+    h.update(np.ascontiguousarray(np.asarray(labels, dtype=np.int64)).tobytes())
+    return h.hexdigest()
+
+
+def _version_dir(bundle_dir: str, version: int) -> str:
+    return os.path.join(bundle_dir, f'v{version:04d}')
+
+
+def list_versions(bundle_dir: Optional[str] = None) -> List[int]:
+    """Versions of all complete bundles in bundle_dir (default: MODEL_BUNDLE_DIR), ascending."""
+    bundle_dir = bundle_dir or config.MODEL_BUNDLE_DIR
+    if not os.path.isdir(bundle_dir):
+        return []
+    versions = []
+    for name in os.listdir(bundle_dir):
+        if (name.startswith('v') and name[1:].isdigit()
+                and os.path.isfile(os.path.join(bundle_dir, name, 'manifest.json'))):
+            versions.append(int(name[1:]))
+    return sorted(versions)
+
+
+def latest_version(bundle_dir: Optional[str] = None) -> Optional[int]:
+    """Most recent bundle version, or None if there is none."""
+    versions = list_versions(bundle_dir)
+    return versions[-1] if versions else None
+
+
+def _reserve_version(bundle_dir: str) -> Tuple[int, str]:
+    """
+    Claim the next free version directory.
+
+    os.mkdir either creates the directory or fails, so concurrent writers
+    (e.g. the dashboard's BackgroundTrainer and main.py) never get the same
+    version; a writer that loses the race moves on to the next number.
+
+    Returns:
+        tuple: (version, path of the new, empty version directory)
+    """
+    os.makedirs(bundle_dir, exist_ok=True)
+    version = (latest_version(bundle_dir) or 0) + 1
+    while True:
+        path = _version_dir(bundle_dir, version)
+        try:
+            os.mkdir(path)
+            return version, path
+        except FileExistsError:
+            version += 1
+
+
+def save_model_bundle(model: 'MultinomialNB', vectorizer: Union['CountVectorizer', 'HashingVectorizer'],
+                      tf_transformer: 'TfidfTransformer', metrics: Dict, fingerprint: str,
+                      bundle_dir: Optional[str] = None,
+                      parent_version: Optional[int] = None,
+                      source_fingerprint: Optional[str] = None) -> str:
+    """
+    Save a trained pipeline as the next bundle version.
+
+    The bundle directory holds manifest.json (format version, estimator
+    parameters, metrics, data fingerprint), vocabulary.json (terms ordered by
+    feature index) and one .npy file per fitted array. parent_version records
+    the bundle an incremental update started from (None for a full training);
+    source_fingerprint optionally records the source data and settings the
+    bundle was trained from (see model_cache.source_fingerprint).
+
+    Returns:
+        Path of the new bundle directory
+    """
+    import sklearn
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    version, path = _reserve_version(bundle_dir or config.MODEL_BUNDLE_DIR)
+
+    for name in _NB_ARRAYS:
+        np.save(os.path.join(path, f'nb_{name}.npy'), getattr(model, name))
+    np.save(os.path.join(path, 'tfidf_idf_.npy'), tf_transformer.idf_)
+
+    # Hashed features have no vocabulary to store
+    hashing = isinstance(vectorizer, HashingVectorizer)
+    if not hashing:
+        terms = [None] * len(vectorizer.vocabulary_)
+        for term, index in vectorizer.vocabulary_.items():
+            terms[index] = term
+        with open(os.path.join(path, 'vocabulary.json'), 'w', encoding='utf-8') as f:
+            json.dump(terms, f, ensure_ascii=False)
+
+    manifest = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'version': version,
+        'vectorizer_type': 'hashing' if hashing else 'count',
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'sklearn_version': sklearn.__version__,
+        'fingerprint': fingerprint,
+        'parent_version': parent_version,
+        'source_fingerprint': source_fingerprint,
+        'params': {
+            'vectorizer': _json_params(vectorizer),
+            'tf_transformer': _json_params(tf_transformer),
+            'model': _json_params(model),
+        },
+        'metrics': metrics,
+    }
+    # The manifest appears last and atomically: list_versions only sees complete bundles
+    manifest_path = os.path.join(path, 'manifest.json')
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, default=float)
+    os.replace(manifest_path + '.tmp', manifest_path)
+    print(f"Model bundle saved: {path}")
+    return path
+
+
+def _json_params(estimator) -> Dict:
+    """Estimator parameters that can be stored as JSON (others are left at defaults)."""
+    params = {}
+    for key, value in estimator.get_params().items():
+        if value is None or isinstance(value, (bool, int, float, str)):
+            params[key] = value
+        elif isinstance(value, (list, tuple)) and all(isinstance(v, (int, float, str)) for v in value):
+            params[key] = list(value)
+    return params
+
+
+def read_manifest(version: int, bundle_dir: Optional[str] = None) -> Dict:
+    """manifest.json of a bundle version, without loading any arrays."""
+    with open(os.path.join(_version_dir(bundle_dir or config.MODEL_BUNDLE_DIR, version), 'manifest.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_model_bundle(version: Optional[int] = None, bundle_dir: Optional[str] = None,
+                      mmap: bool = True) -> ModelBundle:
+    """
+    Load a bundle without refitting anything.
+
+    Args:
+        version: Bundle version (default: latest)
+        bundle_dir: Directory holding the bundle versions (default: MODEL_BUNDLE_DIR)
+        mmap: Memory-map the fitted arrays (read-only) instead of reading them
+
+    Returns:
+        ModelBundle
+    """
+    from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer, TfidfTransformer
+    from sklearn.naive_bayes import MultinomialNB
+
+    bundle_dir = bundle_dir or config.MODEL_BUNDLE_DIR
+    if version is None:
+        version = latest_version(bundle_dir)
+        if version is None:
+            raise FileNotFoundError(f"No model bundle found in {bundle_dir}")
+    path = _version_dir(bundle_dir, version)
+
+    manifest = read_manifest(version, bundle_dir)
+    if manifest['format_version'] != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle format {manifest['format_version']} in {path}")
+    params = manifest['params']
+    mmap_mode = 'r' if mmap else None
+
+    def _params(kind, estimator_class):
+        # Tuples (e.g. ngram_range) come back from JSON as lists
+        valid = estimator_class().get_params()
+        return {key: tuple(value) if isinstance(valid.get(key), tuple) else value
+                for key, value in params[kind].items() if key in valid}
+
+    if manifest.get('vectorizer_type', 'count') == 'hashing':
+        vectorizer = HashingVectorizer(**_params('vectorizer', HashingVectorizer))
+    else:
+        with open(os.path.join(path, 'vocabulary.json'), encoding='utf-8') as f:
+            terms = json.load(f)
+        vectorizer = CountVectorizer(**_params('vectorizer', CountVectorizer))
+        vectorizer.vocabulary_ = {term: index for index, term in enumerate(terms)}
+        vectorizer.fixed_vocabulary_ = False
+
+    tf_transformer = TfidfTransformer(**_params('tf_transformer', TfidfTransformer))
+    tf_transformer.idf_ = np.load(os.path.join(path, 'tfidf_idf_.npy'), mmap_mode=mmap_mode)
+    n_features = len(tf_transformer.idf_)
+    tf_transformer.n_features_in_ = n_features
+
+    model = MultinomialNB(**_params('model', MultinomialNB))
+    for name in _NB_ARRAYS:
+        setattr(model, name, np.load(os.path.join(path, f'nb_{name}.npy'), mmap_mode=mmap_mode))
+    model.n_features_in_ = n_features
+
+    return ModelBundle(model, vectorizer, tf_transformer, manifest['metrics'],
+                       manifest['fingerprint'], version, path)
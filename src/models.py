@@ -4,19 +4,30 @@ Models module
 Contains functions for training and evaluating machine learning models
 """
 
-from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.metrics import (
-    classification_report,
-    accuracy_score,
-    precision_score,
-    recall_score,
-    f1_score,
-    confusion_matrix
-)
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Tuple
 
+import numpy as np
+import pandas as pd
+
+from . import config
 from .config import SENTIMENT_LABELS
-from .visualization import plot_confusion_matrix
+from .metrics import confusion_matrix_counts, metrics_from_confusion_matrix, format_classification_report
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+
+
+def vectorize_unique(vectorize: Callable, texts):
+    """
+    Apply vectorize (e.g. CountVectorizer.fit_transform) to each distinct text once.
+
+    Rows for repeated texts, such as the duplicates added by oversampling,
+    are produced by sparse row indexing. The result equals vectorize(texts)
+    for vectorizers that do not prune terms by document frequency
+    (min_df, max_df, max_features at their defaults).
+    """
+    codes, uniques = pd.factorize(np.asarray(texts, dtype=object))
+    return vectorize(uniques)[codes]
 
 
 def train_naive_bayes(X_train, y_train_le, X_test, y_test_le):
@@ -27,14 +38,17 @@ def train_naive_bayes(X_train, y_train_le, X_test, y_test_le):
         tuple: (model, vectorizer, tf_transformer, metrics_dict)
         metrics_dict contains: accuracy, precision, recall, f1, classification_report, confusion_matrix
     """
+    from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+    from sklearn.naive_bayes import MultinomialNB
+
     print("\n" + "="*60)
     print("TRAINING NAIVE BAYES CLASSIFIER")
     print("="*60)
     
-    # Vectorize
+    # Vectorize (oversampled duplicates are tokenized only once)
     print("\n1. Vectorizing text data...")
     clf = CountVectorizer()
-    X_train_cv = clf.fit_transform(X_train)
+    X_train_cv = vectorize_unique(clf.fit_transform, X_train)
     X_test_cv = clf.transform(X_test)
     print(f"   ✓ Training features: {X_train_cv.shape}")
     print(f"   ✓ Test features: {X_test_cv.shape}")
@@ -59,36 +73,200 @@ def train_naive_bayes(X_train, y_train_le, X_test, y_test_le):
 
     # Calculate metrics
     print("\n5. Calculating evaluation metrics...")
-    accuracy = accuracy_score(y_test_le, nb_pred)
-    precision = precision_score(y_test_le, nb_pred, average=None, zero_division=0)
-    recall = recall_score(y_test_le, nb_pred, average=None, zero_division=0)
-    f1 = f1_score(y_test_le, nb_pred, average=None, zero_division=0)
-    cm = confusion_matrix(y_test_le, nb_pred)
+    metrics = evaluate_predictions(y_test_le, nb_pred)
     
-    # Macro averages
-    precision_macro = precision_score(y_test_le, nb_pred, average='macro', zero_division=0)
-    recall_macro = recall_score(y_test_le, nb_pred, average='macro', zero_division=0)
-    f1_macro = f1_score(y_test_le, nb_pred, average='macro', zero_division=0)
-    
-    # Weighted averages
-    precision_weighted = precision_score(y_test_le, nb_pred, average='weighted', zero_division=0)
-    recall_weighted = recall_score(y_test_le, nb_pred, average='weighted', zero_division=0)
-    f1_weighted = f1_score(y_test_le, nb_pred, average='weighted', zero_division=0)
-
-    # Classification report
-    report = classification_report(
-        y_test_le,
-        nb_pred,
-        target_names=SENTIMENT_LABELS,
-        output_dict=True
+    print("\n" + "="*60)
+    print("TRAINING COMPLETED SUCCESSFULLY!")
+    print("="*60)
+
+    return nb_clf, clf, tf_transformer, metrics
+
+
+def make_hashing_vectorizer(n_features: Optional[int] = None) -> 'HashingVectorizer':
+    """HashingVectorizer producing raw, non-negative term counts (as MultinomialNB needs)."""
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    if n_features is None:
+        n_features = config.HASHING_N_FEATURES
+    return HashingVectorizer(n_features=n_features, alternate_sign=False, norm=None)
+
+
+def document_frequencies(X) -> np.ndarray:
+    """Number of documents (rows) containing each feature of a sparse count matrix."""
+    X = X.tocsr()
+    X.sum_duplicates()
+    return np.bincount(X.indices, minlength=X.shape[1])
+
+
+def tfidf_from_document_frequencies(df: np.ndarray, n_samples: int,
+                                    smooth_idf: bool = True) -> 'TfidfTransformer':
+    """
+    Build a fitted TfidfTransformer from document frequency counts.
+
+    Gives the same idf_ as TfidfTransformer(smooth_idf=smooth_idf).fit(X)
+    for the matrix X the counts came from, without needing X in memory.
+    """
+    from sklearn.feature_extraction.text import TfidfTransformer
+
+    df = np.asarray(df, dtype=np.float64) + int(smooth_idf)
+    n_samples = n_samples + int(smooth_idf)
+    tf_transformer = TfidfTransformer(use_idf=True, smooth_idf=smooth_idf)
+    tf_transformer.idf_ = np.log(n_samples / df) + 1
+    tf_transformer.n_features_in_ = len(df)
+    return tf_transformer
+
+
+def iter_array_chunks(X, y, chunksize: int) -> Iterable[Tuple]:
+    """Split in-memory texts and labels into (texts, labels) chunks."""
+    for start in range(0, len(X), chunksize):
+        yield X[start:start + chunksize], y[start:start + chunksize]
+
+
+def train_naive_bayes_hashed(chunk_source: Callable[[], Iterable[Tuple]],
+                             test_source: Callable[[], Iterable[Tuple]],
+                             n_features: Optional[int] = None, balance_classes: bool = False):
+    """
+    Train and evaluate Naive Bayes on hashed features, out of core.
+
+    Args:
+        chunk_source: Callable returning a fresh iterable of (texts, labels)
+            training chunks; it is called twice (document frequencies, then
+            partial_fit)
+        test_source: Callable returning an iterable of (texts, labels) test chunks
+        n_features: Number of hashed features, fixes the model size
+            (default: HASHING_N_FEATURES)
+        balance_classes: Weight every class as if it were randomly
+            oversampled to the size of the largest class (for chunks that
+            were not oversampled up front, see prepare_data_for_training)
+
+    Returns:
+        tuple: (model, vectorizer, tf_transformer, metrics_dict), as train_naive_bayes
+    """
+    from sklearn.naive_bayes import MultinomialNB
+
+    if n_features is None:
+        n_features = config.HASHING_N_FEATURES
+    print("\n" + "="*60)
+    print("TRAINING NAIVE BAYES CLASSIFIER (HASHING)")
+    print("="*60)
+
+    vectorizer = make_hashing_vectorizer(n_features)
+    n_classes = len(SENTIMENT_LABELS)
+
+    # Pass 1: document frequencies for TF-IDF, per class so they can be weighted
+    print(f"\n1. Counting document frequencies ({n_features} hashed features)...")
+    df = np.zeros((n_classes, n_features), dtype=np.int64)
+    class_counts = np.zeros(n_classes, dtype=np.int64)
+    for texts, labels in chunk_source():
+        X_chunk = vectorize_unique(vectorizer.transform, texts)
+        labels = np.asarray(labels, dtype=np.int64)
+        for label in np.unique(labels):
+            df[label] += document_frequencies(X_chunk[labels == label])
+        class_counts += np.bincount(labels, minlength=n_classes)
+    if balance_classes:
+        class_weights = class_counts.max() / np.maximum(class_counts, 1)
+    else:
+        class_weights = np.ones(n_classes)
+    tf_transformer = tfidf_from_document_frequencies(class_weights @ df, class_weights @ class_counts)
+    print(f"   ✓ {class_counts.sum()} training documents")
+
+    # Pass 2: incremental training
+    print("\n2. Training Naive Bayes model with partial_fit...")
+    nb_clf = MultinomialNB()
+    classes = np.arange(n_classes)
+    n_chunks = 0
+    for texts, labels in chunk_source():
+        X_chunk = vectorize_unique(vectorizer.transform, texts)
+        labels = np.asarray(labels, dtype=np.int64)
+        sample_weight = class_weights[labels] if balance_classes else None
+        nb_clf.partial_fit(tf_transformer.transform(X_chunk), labels, classes=classes,
+                           sample_weight=sample_weight)
+        n_chunks += 1
+    print(f"   ✓ Model trained on {n_chunks} chunks")
+
+    # Predict, one chunk at a time
+    print("\n3. Making predictions on test set...")
+    cm = np.zeros((n_classes, n_classes), dtype=np.int64)
+    for texts, labels in test_source():
+        nb_pred = nb_clf.predict(tf_transformer.transform(vectorizer.transform(texts)))
+        cm += confusion_matrix_counts(labels, nb_pred, n_classes)
+    print(f"   ✓ Predicted {cm.sum()} samples")
+
+    # Calculate metrics
+    print("\n4. Calculating evaluation metrics...")
+    metrics = evaluate_confusion_matrix(cm)
+
+    print("\n" + "="*60)
+    print("TRAINING COMPLETED SUCCESSFULLY!")
+    print("="*60)
+
+    return nb_clf, vectorizer, tf_transformer, metrics
+
+
+def train_naive_bayes_streaming(data_path: str, chunksize: Optional[int] = None,
+                                n_features: Optional[int] = None):
+    """
+    Train and evaluate hashed Naive Bayes straight from the CSV, never loading it whole.
+
+    The train and test chunks come from data_processing.iter_training_chunks,
+    which re-reads the file on every pass; class imbalance is handled with
+    sample weights instead of oversampling rows. chunksize and n_features
+    default to DATA_CHUNKSIZE and HASHING_N_FEATURES.
+
+    Returns:
+        tuple: (model, vectorizer, tf_transformer, metrics_dict, fingerprint),
+        fingerprint being the SHA-256 over the data_fingerprint of each
+        training chunk, in order
+    """
+    import hashlib
+
+    from .data_processing import iter_training_chunks
+    from .model_store import data_fingerprint
+    from .tokenizer_registry import get_tokenizer
+
+    tokenizer = get_tokenizer()
+    chunk_digests = []
+
+    def train_chunks():
+        chunk_digests.clear()
+        for texts, labels in iter_training_chunks(data_path, 'train', chunksize, tokenizer=tokenizer):
+            chunk_digests.append(data_fingerprint(texts, labels))
+            yield texts, labels
+
+    nb_clf, vectorizer, tf_transformer, metrics = train_naive_bayes_hashed(
+        train_chunks,
+        lambda: iter_training_chunks(data_path, 'test', chunksize, tokenizer=tokenizer),
+        n_features, balance_classes=True
     )
+    fingerprint = hashlib.sha256(''.join(chunk_digests).encode('ascii')).hexdigest()
+    return nb_clf, vectorizer, tf_transformer, metrics, fingerprint
+
+
+def evaluate_predictions(y_test_le, nb_pred):
+    """
+    Compute and display evaluation metrics for test predictions.
+
+    The confusion matrix is built once; every other metric is derived from it.
+    Nothing is plotted here: pass metrics['confusion_matrix'] to
+    visualization.plot_confusion_matrix when a figure is wanted.
+    
+    Returns:
+        dict: accuracy, precision, recall, f1_score, confusion_matrix, classification_report
+    """
+    return evaluate_confusion_matrix(confusion_matrix_counts(y_test_le, nb_pred))
+
+
+def evaluate_confusion_matrix(cm: np.ndarray):
+    """Compute and display evaluation metrics from a test confusion matrix (see evaluate_predictions)."""
+    metrics = metrics_from_confusion_matrix(cm)
+    precision, recall, f1 = metrics['precision'], metrics['recall'], metrics['f1_score']
 
     # Display results
     print("\n" + "="*60)
     print("MODEL EVALUATION RESULTS")
     print("="*60)
     
-    print(f"\n📊 OVERALL ACCURACY: {accuracy*100:.2f}%")
+    print(f"\n📊 OVERALL ACCURACY: {metrics['accuracy']*100:.2f}%")
     
     print("\n📈 METRICS PER CLASS:")
     print("-" * 60)
@@ -96,49 +274,15 @@ def train_naive_bayes(X_train, y_train_le, X_test, y_test_le):
     print("-" * 60)
     for i, label in enumerate(SENTIMENT_LABELS):
         support = cm[i].sum()
-        print(f"{label:<12} {precision[i]*100:>10.2f}% {recall[i]*100:>10.2f}% {f1[i]*100:>10.2f}% {support:>10}")
+        print(f"{label:<12} {precision['per_class'][label]*100:>10.2f}% "
+              f"{recall['per_class'][label]*100:>10.2f}% {f1['per_class'][label]*100:>10.2f}% {support:>10}")
     
     print("-" * 60)
-    print(f"{'Macro Avg':<12} {precision_macro*100:>10.2f}% {recall_macro*100:>10.2f}% {f1_macro*100:>10.2f}%")
-    print(f"{'Weighted Avg':<12} {precision_weighted*100:>10.2f}% {recall_weighted*100:>10.2f}% {f1_weighted*100:>10.2f}%")
+    print(f"{'Macro Avg':<12} {precision['macro']*100:>10.2f}% {recall['macro']*100:>10.2f}% {f1['macro']*100:>10.2f}%")
+    print(f"{'Weighted Avg':<12} {precision['weighted']*100:>10.2f}% {recall['weighted']*100:>10.2f}% {f1['weighted']*100:>10.2f}%")
     
     print("\n📋 DETAILED CLASSIFICATION REPORT:")
     print("-" * 60)
-    print(classification_report(
-        y_test_le,
-        nb_pred,
-        target_names=SENTIMENT_LABELS
-    ))
-
-    # Plot confusion matrix
-    print("\n📊 Generating confusion matrix visualization...")
-    plot_confusion_matrix(y_test_le, nb_pred, "Naive Bayes Confusion Matrix")
-    
-    # Compile metrics dictionary
-    metrics = {
-        'accuracy': accuracy,
-        'precision': {
-            'per_class': {label: float(precision[i]) for i, label in enumerate(SENTIMENT_LABELS)},
-            'macro': float(precision_macro),
-            'weighted': float(precision_weighted)
-        },
-        'recall': {
-            'per_class': {label: float(recall[i]) for i, label in enumerate(SENTIMENT_LABELS)},
-            'macro': float(recall_macro),
-            'weighted': float(recall_weighted)
-        },
-        'f1_score': {
-            'per_class': {label: float(f1[i]) for i, label in enumerate(SENTIMENT_LABELS)},
-            'macro': float(f1_macro),
-            'weighted': float(f1_weighted)
-        },
-        'confusion_matrix': cm.tolist(),
-        'classification_report': report
-    }
-    
-    print("\n" + "="*60)
-    print("TRAINING COMPLETED SUCCESSFULLY!")
-    print("="*60)
-
-    return nb_clf, clf, tf_transformer, metrics
+    print(format_classification_report(metrics['classification_report']))
 
+    return metrics
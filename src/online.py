@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Online update module
+Update a saved Naive Bayes bundle with new labelled tweets without retraining
+"""
+
+import hashlib
+import os
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from . import config
+from .config import SENTIMENT_MAP
+from .cache import clean_texts_cached
+from .data_processing import compute_token_lengths
+from .models import document_frequencies, evaluate_predictions, tfidf_from_document_frequencies
+from .model_store import ModelBundle, data_fingerprint, load_model_bundle, save_model_bundle
+from .text_cleaning import clean_texts
+from .tokenizer_registry import get_tokenizer
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import CountVectorizer
+    from sklearn.naive_bayes import MultinomialNB
+
+
+def preprocess_new_rows(new_df: pd.DataFrame, use_cache: Optional[bool] = None,
+                        max_token_length: Optional[int] = None) -> pd.DataFrame:
+    """
+    Clean and filter a batch of new labelled tweets the way the training data is.
+
+    Only the new rows are cleaned. Sentiment may be given as labels
+    ('Negative', ...) or already encoded; rows with unknown labels are dropped.
+    use_cache and max_token_length default to USE_CLEAN_CACHE and
+    MAX_TOKEN_LENGTH; set max_token_length to 0 to skip the tokenizer-based
+    length filter.
+    """
+    if use_cache is None:
+        use_cache = config.USE_CLEAN_CACHE
+    if max_token_length is None:
+        max_token_length = config.MAX_TOKEN_LENGTH
+    df = new_df[['Text', 'Sentiment']].drop_duplicates(subset='Text').copy()
+    if not pd.api.types.is_numeric_dtype(df['Sentiment']):
+        df['Sentiment'] = df['Sentiment'].map(SENTIMENT_MAP)
+    df = df.dropna(subset=['Sentiment'])
+    df['Sentiment'] = df['Sentiment'].astype(np.int64)
+
+    clean = clean_texts_cached if use_cache else clean_texts
+    df['text_clean'] = clean(df['Text'].tolist())
+    df['text_len'] = df['text_clean'].str.split().str.len()
+    df = df[df['text_len'] > config.MIN_TEXT_LENGTH]
+
+    if max_token_length and len(df):
+        token_lens = compute_token_lengths(get_tokenizer(), df['text_clean'].values)
+        df = df[token_lens <= max_token_length]
+
+    return df.reset_index(drop=True)
+
+
+def bundle_document_frequencies(bundle: ModelBundle) -> np.ndarray:
+    """
+    Document frequencies the bundle's TF-IDF step was fitted on.
+
+    Recovered by inverting idf = ln((n + s) / (df + s)) + 1, where n is the
+    number of training samples (the sum of the Naive Bayes class counts) and
+    s is 1 with smooth_idf, so bundles need not store them separately.
+    """
+    smooth = int(bundle.tf_transformer.smooth_idf)
+    n_samples = float(np.asarray(bundle.model.class_count_).sum())
+    idf = np.asarray(bundle.tf_transformer.idf_, dtype=np.float64)
+    return np.rint((n_samples + smooth) * np.exp(1.0 - idf) - smooth).astype(np.int64)
+
+
+def _extend_vocabulary(vectorizer: 'CountVectorizer', texts: List[str]) -> 'CountVectorizer':
+    """Copy of a fitted CountVectorizer with unseen terms of texts appended to its vocabulary."""
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    vocabulary = dict(vectorizer.vocabulary_)
+    analyzer = vectorizer.build_analyzer()
+    new_terms = {term for text in texts for term in analyzer(text)} - vocabulary.keys()
+    for term in sorted(new_terms):
+        vocabulary[term] = len(vocabulary)
+
+    extended = CountVectorizer(**vectorizer.get_params())
+    extended.vocabulary_ = vocabulary
+    extended.fixed_vocabulary_ = False
+    return extended
+
+
+def _writable_model(model: 'MultinomialNB', n_features: int) -> 'MultinomialNB':
+    """In-memory copy of a (possibly memory-mapped) model, with zero counts for new features."""
+    from sklearn.naive_bayes import MultinomialNB
+
+    updated = MultinomialNB(**model.get_params())
+    updated.classes_ = np.array(model.classes_)
+    updated.class_count_ = np.array(model.class_count_, dtype=np.float64)
+    feature_count = np.array(model.feature_count_, dtype=np.float64)
+    n_new = n_features - feature_count.shape[1]
+    updated.feature_count_ = np.pad(feature_count, ((0, 0), (0, n_new)))
+    updated.class_log_prior_ = np.array(model.class_log_prior_)
+    updated.feature_log_prob_ = np.pad(np.array(model.feature_log_prob_), ((0, 0), (0, n_new)))
+    updated.n_features_in_ = n_features
+    return updated
+
+
+def update(model_bundle: ModelBundle, new_df: pd.DataFrame, X_test=None, y_test_le=None,
+           bundle_dir: Optional[str] = None, use_cache: Optional[bool] = None,
+           max_token_length: Optional[int] = None) -> ModelBundle:
+    """
+    Update a model bundle with new labelled tweets and save it as a new version.
+
+    Cleans only the new rows, adds their terms to the document frequencies
+    (refreshing the IDF) and their TF-IDF weighted counts to the Naive Bayes
+    class/feature counts with partial_fit. Earlier training data is not
+    touched, so rows seen before keep the IDF weighting they were counted
+    with; run main.py for an exact full retrain. Unlike main.py, the new rows
+    are not oversampled.
+
+    Args:
+        model_bundle: Bundle to start from (left unchanged on disk)
+        new_df: New tweets with 'Text' and 'Sentiment' columns
+        X_test: Cleaned test texts to evaluate the updated model on (optional)
+        y_test_le: Label encoded test labels (optional)
+        bundle_dir: Directory to save the new version in (default: MODEL_BUNDLE_DIR)
+        use_cache: Clean through the on-disk cleaning cache (default: USE_CLEAN_CACHE)
+        max_token_length: Drop rows with more tokens (default: MAX_TOKEN_LENGTH, 0 to skip)
+
+    Returns:
+        ModelBundle of the new version
+    """
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    start = time.perf_counter()
+    print(f"Updating model bundle v{model_bundle.version} with {len(new_df)} new rows...")
+    rows = preprocess_new_rows(new_df, use_cache, max_token_length)
+    texts = rows['text_clean'].tolist()
+    labels = rows['Sentiment'].values
+    print(f"   ✓ {len(rows)} rows after cleaning and filtering")
+    if not len(rows):
+        raise ValueError("No usable rows in new_df after preprocessing")
+
+    # Vectorize; CountVectorizer vocabularies grow, hashed features are fixed
+    vectorizer = model_bundle.vectorizer
+    if not isinstance(vectorizer, HashingVectorizer):
+        vectorizer = _extend_vocabulary(vectorizer, texts)
+        n_features = len(vectorizer.vocabulary_)
+        print(f"   ✓ {n_features - len(model_bundle.vectorizer.vocabulary_)} new terms")
+    else:
+        n_features = vectorizer.n_features
+    X_new = vectorizer.transform(texts)
+
+    # Refresh the IDF from old + new document frequencies
+    old_tf = model_bundle.tf_transformer
+    df = bundle_document_frequencies(model_bundle)
+    df = np.pad(df, (0, n_features - len(df))) + document_frequencies(X_new)
+    n_samples = int(np.asarray(model_bundle.model.class_count_).sum()) + X_new.shape[0]
+    tf_transformer = tfidf_from_document_frequencies(df, n_samples, old_tf.smooth_idf)
+    tf_transformer.set_params(norm=old_tf.norm, sublinear_tf=old_tf.sublinear_tf)
+
+    # Add the new counts to the Naive Bayes model
+    model = _writable_model(model_bundle.model, n_features)
+    model.partial_fit(tf_transformer.transform(X_new), labels)
+
+    if X_test is not None and y_test_le is not None:
+        nb_pred = model.predict(tf_transformer.transform(vectorizer.transform(X_test)))
+        metrics = evaluate_predictions(y_test_le, nb_pred)
+    else:
+        metrics = model_bundle.metrics
+
+    fingerprint = hashlib.sha256(
+        (model_bundle.fingerprint + data_fingerprint(texts, labels)).encode('ascii')
+    ).hexdigest()
+    path = save_model_bundle(model, vectorizer, tf_transformer, metrics, fingerprint,
+                             bundle_dir, parent_version=model_bundle.version)
+    elapsed = time.perf_counter() - start
+    print(f"   ✓ Update took {elapsed:.2f}s")
+
+    return load_model_bundle(int(os.path.basename(path)[1:]), bundle_dir)
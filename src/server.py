@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Server module
+Asyncio HTTP scoring service that micro-batches single-tweet requests
+
+Endpoints:
+    POST /predict   {"text": "..."} or {"texts": ["...", ...]}
+    GET  /metrics   latency percentiles, queue depth, batch sizes
+    GET  /health
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from . import config
+from .inference import SentimentPredictor, get_predictor
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error'}
+_MAX_BODY_BYTES = 1 << 20
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent prediction requests into batches.
+
+    A batch is flushed when it reaches max_batch_size or when its first
+    request has waited max_wait_ms. Prediction runs on a single worker thread
+    so the event loop keeps accepting requests while a batch is scored.
+    """
+
+    def __init__(self, predictor: SentimentPredictor, max_batch_size: Optional[int] = None,
+                 max_wait_ms: Optional[float] = None, latency_window: int = 10000):
+        if max_batch_size is None:
+            max_batch_size = config.SERVE_MAX_BATCH_SIZE
+        if max_wait_ms is None:
+            max_wait_ms = config.SERVE_MAX_WAIT_MS
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._task = None
+        self._latencies = deque(maxlen=latency_window)
+        self._batch_sizes = deque(maxlen=latency_window)
+        self.requests = 0
+        self.batches = 0
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False)
+
+    async def submit(self, text: str) -> Tuple[str, List[float]]:
+        """Queue one text and wait for its (label, probabilities)."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future, time.perf_counter()))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _, _ in batch]
+            try:
+                proba = await loop.run_in_executor(self._executor, self.predictor.predict_proba, texts)
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            labels = self.predictor.labels
+            now = time.perf_counter()
+            for (_, future, submitted), row in zip(batch, proba):
+                if not future.done():
+                    future.set_result((labels[int(row.argmax())], row.tolist()))
+                self._latencies.append(now - submitted)
+            self.requests += len(batch)
+            self.batches += 1
+            self._batch_sizes.append(len(batch))
+
+    def metrics(self) -> Dict[str, float]:
+        """Latency percentiles (ms, over the recent window), queue depth and batch stats."""
+        latencies = np.array(self._latencies) * 1000
+        has_data = len(latencies) > 0
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'queue_depth': self._queue.qsize(),
+            'mean_batch_size': float(np.mean(self._batch_sizes)) if self._batch_sizes else 0.0,
+            'latency_ms_p50': float(np.percentile(latencies, 50)) if has_data else 0.0,
+            'latency_ms_p99': float(np.percentile(latencies, 99)) if has_data else 0.0,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+        }
+
+
+class ScoringServer:
+    """Minimal HTTP/1.1 server (keep-alive, JSON bodies) on asyncio streams."""
+
+    def __init__(self, batcher: MicroBatcher):
+        self.batcher = batcher
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'malformed request line'}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {'error': 'invalid Content-Length'}, False)
+                    break
+                if length > _MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {'error': 'body too large'}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version == 'HTTP/1.1')
+                status, payload = await self._dispatch(method, path, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+        if path == '/health':
+            return 200, {'status': 'ok', 'model_version': self.batcher.predictor.bundle.version}
+        if path == '/metrics':
+            return 200, self.batcher.metrics()
+        if path != '/predict':
+            return 404, {'error': f'unknown path {path}'}
+        if method != 'POST':
+            return 405, {'error': 'use POST'}
+
+        try:
+            request = json.loads(body or b'{}')
+            texts = request['texts'] if 'texts' in request else [request['text']]
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise TypeError
+        except (ValueError, KeyError, TypeError):
+            return 400, {'error': 'expected JSON {"text": str} or {"texts": [str, ...]}'}
+
+        try:
+            results = await asyncio.gather(*(self.batcher.submit(text) for text in texts))
+        except Exception as e:
+            return 500, {'error': str(e)}
+        predictions = [{'label': label, 'proba': dict(zip(self.batcher.predictor.labels, proba))}
+                       for label, proba in results]
+        if 'texts' in request:
+            return 200, {'predictions': predictions}
+        return 200, predictions[0]
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Dict, keep_alive: bool):
+        body = json.dumps(payload).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(host: Optional[str] = None, port: Optional[int] = None,
+                max_batch_size: Optional[int] = None, max_wait_ms: Optional[float] = None,
+                version: Optional[int] = None):
+    """Load the model bundle and serve until cancelled (defaults: SERVE_* settings)."""
+    host = host or config.SERVE_HOST
+    port = config.SERVE_PORT if port is None else port
+    predictor = get_predictor(version)
+    batcher = MicroBatcher(predictor, max_batch_size, max_wait_ms)
+    max_batch_size, max_wait_ms = batcher.max_batch_size, batcher.max_wait * 1000
+    batcher.start()
+    server = await asyncio.start_server(ScoringServer(batcher).handle_connection, host, port)
+    print(f"Serving model bundle v{predictor.bundle.version} on http://{host}:{port} "
+          f"(max batch {max_batch_size}, max wait {max_wait_ms} ms)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
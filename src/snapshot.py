@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Snapshot module
+Columnar (Arrow IPC) snapshot of the preprocessed dataset, so entry points
+can load it instead of re-running cleaning and tokenization
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from . import config
+from .text_cleaning import CLEANING_VERSION
+
+# Bump whenever the set of tables or their columns change
+SNAPSHOT_SCHEMA_VERSION = 1
+
+# train_raw/test_raw: split_data output
+# train/test: preprocess_data + encode_sentiments output with 'token_lens'
+#   (before token-length filtering; see data_processing.filter_token_lengths)
+SNAPSHOT_TABLES = ('train_raw', 'test_raw', 'train', 'test')
+
+
+def file_hash(path: str, block_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _file_hash_at(path: str, mtime_ns: int, size: int) -> str:
+    return file_hash(path)
+
+
+def source_file_hash(path: str) -> str:
+    """file_hash, only recomputed when the file's modification time or size changes."""
+    stat = os.stat(path)
+    return _file_hash_at(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def pipeline_settings() -> Dict[str, object]:
+    """Settings that change the snapshot contents besides the source data."""
+    return {
+        'seed': config.SEED,
+        'data_test_size': config.DATA_TEST_SIZE,
+        'min_text_length': config.MIN_TEXT_LENGTH,
+        'cleaning_version': CLEANING_VERSION,
+        'tokenizer': config.TOKENIZER_NAME,
+    }
+
+
+def _snapshot_metadata(source_hash: str, source_stat: Optional[os.stat_result]) -> Dict[bytes, bytes]:
+    """Metadata stored in every table's Arrow schema."""
+    metadata = {
+        b'schema_version': str(SNAPSHOT_SCHEMA_VERSION).encode(),
+        b'source_hash': source_hash.encode(),
+        b'pipeline': json.dumps(pipeline_settings(), sort_keys=True).encode(),
+    }
+    if source_stat is not None:
+        metadata[b'source_size'] = str(source_stat.st_size).encode()
+        metadata[b'source_mtime_ns'] = str(source_stat.st_mtime_ns).encode()
+    return metadata
+
+
+def _table_path(snapshot_dir: str, name: str) -> str:
+    return os.path.join(snapshot_dir, f'{name}.arrow')
+
+
+def write_snapshot(frames: Dict[str, pd.DataFrame], source_hash: str,
+                   snapshot_dir: Optional[str] = None, source_stat: Optional[os.stat_result] = None):
+    """
+    Write frames to uncompressed Arrow IPC files.
+
+    Args:
+        frames: DataFrames keyed by SNAPSHOT_TABLES names
+        source_hash: file_hash of the source CSV
+        snapshot_dir: Output directory (default: SNAPSHOT_DIR)
+        source_stat: os.stat of the source CSV taken before it was hashed; lets
+            load_snapshot skip re-hashing an unchanged file
+    """
+    import pyarrow as pa
+
+    snapshot_dir = snapshot_dir or config.SNAPSHOT_DIR
+    os.makedirs(snapshot_dir, exist_ok=True)
+    metadata = _snapshot_metadata(source_hash, source_stat)
+
+    for name in SNAPSHOT_TABLES:
+        table = pa.Table.from_pandas(frames[name], preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+        path = _table_path(snapshot_dir, name)
+        tmp_path = path + '.tmp'
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+
+def read_snapshot_metadata(snapshot_dir: Optional[str] = None) -> Optional[Dict[str, object]]:
+    """Read schema version, source hash/size/mtime and pipeline settings without loading data."""
+    import pyarrow as pa
+
+    path = _table_path(snapshot_dir or config.SNAPSHOT_DIR, SNAPSHOT_TABLES[0])
+    if not os.path.isfile(path):
+        return None
+    with pa.memory_map(path) as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+    if b'schema_version' not in metadata:
+        return None
+    return {
+        'schema_version': int(metadata[b'schema_version']),
+        'source_hash': metadata[b'source_hash'].decode(),
+        'pipeline': json.loads(metadata[b'pipeline']),
+        'source_size': int(metadata[b'source_size']) if b'source_size' in metadata else None,
+        'source_mtime_ns': int(metadata[b'source_mtime_ns']) if b'source_mtime_ns' in metadata else None,
+    }
+
+
+def _source_unchanged(metadata: Dict[str, object], data_path: str) -> bool:
+    """Same size and mtime as when the snapshot was written, else compare the content hash."""
+    stat = os.stat(data_path)
+    if (metadata['source_size'], metadata['source_mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+        return True
+    return metadata['source_hash'] == source_file_hash(data_path)
+
+
+def load_snapshot(data_path: str, snapshot_dir: Optional[str] = None) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Load the snapshot if it is up to date with data_path and the settings.
+
+    The source CSV is only re-hashed when its size or modification time differ
+    from when the snapshot was written. The tables are read from a memory map
+    but converted to ordinary pandas columns, so the frames live in memory.
+
+    Returns:
+        Dict of DataFrames keyed by SNAPSHOT_TABLES names, or None when there
+        is no snapshot or it is stale (different schema, data or settings)
+    """
+    snapshot_dir = snapshot_dir or config.SNAPSHOT_DIR
+    metadata = read_snapshot_metadata(snapshot_dir)
+    if metadata is None:
+        return None
+    if (metadata['schema_version'] != SNAPSHOT_SCHEMA_VERSION
+            or metadata['pipeline'] != pipeline_settings()
+            or not _source_unchanged(metadata, data_path)):
+        print("Snapshot is stale, ignoring it")
+        return None
+
+    import pyarrow as pa
+    frames = {}
+    for name in SNAPSHOT_TABLES:
+        with pa.memory_map(_table_path(snapshot_dir, name)) as source:
+            frames[name] = pa.ipc.open_file(source).read_all().to_pandas()
+    print(f"Loaded preprocessed snapshot from {snapshot_dir}")
+    return frames
+
+
+def build_snapshot(data_path: str, snapshot_dir: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+    """Run loading, splitting, preprocessing and tokenization once and snapshot the result."""
+    from .data_processing import (
+        load_data, split_data, preprocess_data, encode_sentiments, compute_token_lengths
+    )
+    from .tokenizer_registry import get_tokenizer
+
+    snapshot_dir = snapshot_dir or config.SNAPSHOT_DIR
+    source_stat = os.stat(data_path)
+    source_hash = file_hash(data_path)
+    df = load_data(data_path)
+    df_train, df_test = split_data(df, test_size=config.DATA_TEST_SIZE)
+    df_processed, df_test_processed = preprocess_data(df_train.copy(), df_test.copy())
+    df_processed, df_test_processed = encode_sentiments(df_processed, df_test_processed)
+
+    print("Computing token lengths...")
+    tokenizer = get_tokenizer()
+    df_processed['token_lens'] = compute_token_lengths(tokenizer, df_processed['text_clean'].values)
+    df_test_processed['token_lens'] = compute_token_lengths(tokenizer, df_test_processed['text_clean'].values)
+
+    frames = {
+        'train_raw': df_train,
+        'test_raw': df_test,
+        'train': df_processed,
+        'test': df_test_processed,
+    }
+    write_snapshot(frames, source_hash, snapshot_dir, source_stat)
+    print(f"Snapshot written to {snapshot_dir}")
+    return frames
+
+
+def load_training_frames(data_path: str, snapshot_dir: Optional[str] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Preprocessed, encoded and token-length filtered train/test frames.
+
+    Uses the snapshot when it is up to date, otherwise runs the pipeline
+    (without writing a snapshot).
+    """
+    from .data_processing import (
+        load_data, split_data, preprocess_data, process_token_lengths,
+        filter_token_lengths, encode_sentiments
+    )
+
+    frames = load_snapshot(data_path, snapshot_dir)
+    if frames is not None:
+        return filter_token_lengths(frames['train'], frames['test'])
+    df_train, df_test = split_data(load_data(data_path), test_size=config.DATA_TEST_SIZE)
+    df_train, df_test = preprocess_data(df_train, df_test)
+    df_train, df_test = process_token_lengths(df_train, df_test)
+    return encode_sentiments(df_train, df_test)
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Token index module
+Per-sentiment word and word-pair frequencies of cleaned texts, built once and
+updated incrementally, so word clouds never re-tokenize the corpus
+"""
+
+import re
+from collections import Counter, defaultdict
+from math import log
+from operator import itemgetter
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import SENTIMENT_LABELS
+
+# WordCloud.process_text's default word pattern (min_word_length <= 1)
+_WORD_PATTERN = re.compile(r"\w[\w']*")
+
+# WordCloud defaults used by WordCloud.generate
+COLLOCATION_THRESHOLD = 30
+NORMALIZE_PLURALS = True
+
+# Sentiment value of the counts of all texts joined (to_table)
+ALL_SENTIMENTS = -1
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Words of a text as WordCloud.process_text splits them with its default
+    settings: regex words, trailing 's removed, numbers dropped.
+    """
+    words = (word[:-2] if word.lower().endswith("'s") else word
+             for word in _WORD_PATTERN.findall(text))
+    return [word for word in words if not word.isdigit()]
+
+
+def _pairs(words: List[str]) -> Iterator[str]:
+    return map(' '.join, zip(words, words[1:]))
+
+
+class TokenFrequencyIndex:
+    """
+    Word and adjacent word-pair counts per encoded sentiment, and of all texts
+    (key None).
+
+    Words come from tokenize (WordCloud's tokenization) and pairs from the
+    texts of a sentiment joined in order, the text WordCloud.generate used to
+    receive. Counters keep the order of first occurrence, as WordCloud does for
+    ties. word_cloud_frequencies then applies stopwords, plural merging and
+    collocations from the counts alone.
+    """
+
+    def __init__(self, n_classes: int = len(SENTIMENT_LABELS)):
+        keys = [*range(n_classes), None]
+        self.counts: Dict[Optional[int], Counter] = {key: Counter() for key in keys}
+        self.pair_counts: Dict[Optional[int], Counter] = {key: Counter() for key in keys}
+        # Last word counted per pair sequence, so added texts continue the joined text
+        self._last_word: Dict[Optional[int], str] = {}
+        self._ranked: Dict[Tuple[Optional[int], frozenset], List[Tuple[str, int]]] = {}
+
+    def add(self, texts: Iterable[str], sentiments: Iterable[int]) -> 'TokenFrequencyIndex':
+        """Count the words of new cleaned texts, in order (only these texts are tokenized)."""
+        for text, sentiment in zip(texts, sentiments):
+            words = tokenize(text)
+            if not words:
+                continue
+            for key in (int(sentiment), None):
+                self.counts[key].update(words)
+                last_word = self._last_word.get(key)
+                self.pair_counts[key].update(_pairs(words if last_word is None else [last_word, *words]))
+                self._last_word[key] = words[-1]
+        self._ranked.clear()
+        return self
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, text_column: str = 'text_clean',
+                   sentiment_column: str = 'Sentiment') -> 'TokenFrequencyIndex':
+        """Index of an encoded, cleaned DataFrame."""
+        return cls().add(df[text_column].values, df[sentiment_column].values)
+
+    def to_table(self) -> pd.DataFrame:
+        """
+        Sentiment, token, count rows in order of first occurrence; a token with
+        a space is a word pair, and the counts of all texts have Sentiment
+        ALL_SENTIMENTS.
+        """
+        frames = []
+        for key, counter in self.counts.items():
+            items = [*counter.items(), *self.pair_counts[key].items()]
+            frames.append(pd.DataFrame({
+                'Sentiment': np.full(len(items), ALL_SENTIMENTS if key is None else key, dtype=np.int64),
+                'token': [token for token, _ in items],
+                'count': np.array([count for _, count in items], dtype=np.int64),
+            }))
+        return pd.concat(frames, ignore_index=True)
+
+    @classmethod
+    def from_table(cls, table: pd.DataFrame, n_classes: int = len(SENTIMENT_LABELS)) -> 'TokenFrequencyIndex':
+        """Inverse of to_table (texts added afterwards start a new joined text)."""
+        index = cls(n_classes)
+        for sentiment, group in table.groupby('Sentiment', sort=True):
+            tokens, counts = group['token'].values, group['count'].values
+            is_pair = group['token'].str.contains(' ', regex=False).values
+            key = None if sentiment == ALL_SENTIMENTS else sentiment
+            index.counts[key] = Counter(dict(zip(tokens[~is_pair].tolist(), counts[~is_pair].tolist())))
+            index.pair_counts[key] = Counter(dict(zip(tokens[is_pair].tolist(), counts[is_pair].tolist())))
+        return index
+
+    def frequencies(self, sentiment: Optional[int] = None) -> Counter:
+        """Word counts of one sentiment, or of all texts (None)."""
+        return self.counts[sentiment]
+
+    def pair_frequencies(self, sentiment: Optional[int] = None) -> Counter:
+        """Adjacent word-pair counts ('word1 word2') of one sentiment's joined texts, or of all texts (None)."""
+        return self.pair_counts[sentiment]
+
+    def ranked(self, sentiment: Optional[int] = None,
+               stopwords: Collection[str] = ()) -> Iterator[Tuple[str, int]]:
+        """
+        (word or collocation, count) pairs as WordCloud.process_text would count
+        them, most frequent first; computed once per sentiment and stopword set.
+        """
+        key = (sentiment, frozenset(stopwords))
+        if key not in self._ranked:
+            word_counts = _word_cloud_counts(self.frequencies(sentiment), self.pair_frequencies(sentiment),
+                                             key[1])
+            self._ranked[key] = sorted(word_counts.items(), key=itemgetter(1), reverse=True)
+        return iter(self._ranked[key])
+
+
+def _process_tokens(counts: Dict[str, int]) -> Tuple[Dict[str, int], Dict[str, str]]:
+    """wordcloud.tokenization.process_tokens on {word: count} instead of a word list."""
+    cases = defaultdict(dict)
+    for word, count in counts.items():
+        case_dict = cases[word.lower()]
+        case_dict[word] = case_dict.get(word, 0) + count
+    merged_plurals = {}
+    if NORMALIZE_PLURALS:
+        # Merge plurals into the singular count (simple cases only)
+        for key in list(cases):
+            if key.endswith('s') and not key.endswith('ss') and key[:-1] in cases:
+                singular_cases = cases[key[:-1]]
+                for word, count in cases.pop(key).items():
+                    singular_cases[word[:-1]] = singular_cases.get(word[:-1], 0) + count
+                merged_plurals[key] = key[:-1]
+    fused_cases = {}
+    standard_cases = {}
+    for word_lower, case_dict in cases.items():
+        # The most common case
+        first = max(case_dict.items(), key=itemgetter(1))[0]
+        fused_cases[first] = sum(case_dict.values())
+        standard_cases[word_lower] = first
+    for plural, singular in merged_plurals.items():
+        standard_cases[plural] = standard_cases[singular.lower()]
+    return fused_cases, standard_cases
+
+
+def _log_likelihood(k: float, n: float, x: float) -> float:
+    return log(max(x, 1e-10)) * k + log(max(1 - x, 1e-10)) * (n - k)
+
+
+def _collocation_score(count_pair: int, count1: int, count2: int, n_words: int) -> float:
+    """Dunning's likelihood ratio of a word pair (wordcloud.tokenization.score)."""
+    if n_words <= count1 or n_words <= count2:
+        # Only one word appears in the whole corpus
+        return 0
+    p = count2 / n_words
+    p1 = count_pair / count1
+    p2 = (count2 - count_pair) / (n_words - count1)
+    score = (_log_likelihood(count_pair, count1, p) + _log_likelihood(count2 - count_pair, n_words - count1, p)
+             - _log_likelihood(count_pair, count1, p1) - _log_likelihood(count2 - count_pair, n_words - count1, p2))
+    return -2 * score
+
+
+def _word_cloud_counts(words: Counter, pairs: Counter, stopwords: Collection[str]) -> Dict[str, int]:
+    """wordcloud.tokenization.unigrams_and_bigrams on word and pair counts."""
+    stopwords = {word.lower() for word in stopwords}
+    words = {word: count for word, count in words.items() if word.lower() not in stopwords}
+    pairs = {pair: count for pair, count in pairs.items()
+             if not any(word.lower() in stopwords for word in pair.split(' '))}
+    n_words = sum(words.values())
+    word_counts, standard_form = _process_tokens(words)
+    pair_counts, _ = _process_tokens(pairs)
+    original_counts = word_counts.copy()
+
+    # Pairs that are collocations replace part of their words' counts
+    for pair, count in pair_counts.items():
+        word1, word2 = (standard_form[word.lower()] for word in pair.split(' '))
+        if _collocation_score(count, original_counts[word1], original_counts[word2], n_words) > COLLOCATION_THRESHOLD:
+            word_counts[word1] -= count
+            word_counts[word2] -= count
+            word_counts[pair] = count
+    return {word: count for word, count in word_counts.items() if count > 0}
+
+
+def word_cloud_frequencies(index: TokenFrequencyIndex, sentiment: Optional[int] = None,
+                           max_words: int = 100, stopwords: Collection[str] = ()) -> Dict[str, int]:
+    """
+    The max_words most frequent words for WordCloud.generate_from_frequencies.
+
+    Matches WordCloud.generate with default settings on the joined texts:
+    same tokenization, stopwords, plural merging and collocations.
+    """
+    return dict(word_count for word_count, _ in zip(index.ranked(sentiment, stopwords), range(max_words)))
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Tokenizer registry module
+Process-wide, lazily loaded tokenizers with an offline local cache
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from . import config
+
+_tokenizers = {}
+_metrics = {}
+_lock = threading.Lock()
+
+
+def _has_local_files(local_dir: Optional[str]) -> bool:
+    """Check whether local_dir holds a saved tokenizer."""
+    return bool(local_dir) and os.path.isfile(os.path.join(local_dir, 'tokenizer_config.json'))
+
+
+def _load_tokenizer(name: str, local_dir: Optional[str]):
+    """Load a tokenizer from local_dir, falling back to the hub (then saving it locally)."""
+    from transformers import BertTokenizerFast
+
+    if _has_local_files(local_dir):
+        return BertTokenizerFast.from_pretrained(local_dir, local_files_only=True), 'local'
+
+    tokenizer = BertTokenizerFast.from_pretrained(name)
+    if local_dir:
+        os.makedirs(local_dir, exist_ok=True)
+        tokenizer.save_pretrained(local_dir)
+    return tokenizer, 'hub'
+
+
+def get_tokenizer(name: Optional[str] = None, local_dir: Optional[str] = None):
+    """
+    Get the shared tokenizer instance, loading it on first use.
+
+    The instance lives for the whole process, so repeated calls (and Streamlit
+    reruns) reuse it instead of calling from_pretrained again.
+
+    Args:
+        name: Hugging Face model name (default: TOKENIZER_NAME)
+        local_dir: Directory to load from / save to for offline use
+            (default: TOKENIZER_DIR, '' = hub only)
+
+    Returns:
+        BertTokenizerFast instance
+    """
+    if name is None:
+        name = config.TOKENIZER_NAME
+    if local_dir is None:
+        local_dir = config.TOKENIZER_DIR
+    key = (name, local_dir)
+    tokenizer = _tokenizers.get(key)
+    if tokenizer is None:
+        with _lock:
+            tokenizer = _tokenizers.get(key)
+            if tokenizer is None:
+                start = time.perf_counter()
+                tokenizer, source = _load_tokenizer(name, local_dir)
+                _metrics[key] = {
+                    'name': name,
+                    'source': source,
+                    'path': local_dir if source == 'local' else name,
+                    'load_seconds': time.perf_counter() - start,
+                    'loaded_at': time.time(),
+                    'requests': 0,
+                }
+                _tokenizers[key] = tokenizer
+                print(f"Loaded tokenizer '{name}' from {source} "
+                      f"in {_metrics[key]['load_seconds']:.2f}s")
+    _metrics[key]['requests'] += 1
+    return tokenizer
+
+
+def tokenizer_metrics() -> Dict[str, dict]:
+    """Return load-time metrics of every loaded tokenizer, keyed by name."""
+    return {metrics['name']: dict(metrics) for metrics in _metrics.values()}
+
+
+def clear_tokenizers():
+    """Drop all loaded tokenizers (the next get_tokenizer call reloads)."""
+    with _lock:
+        _tokenizers.clear()
+        _metrics.clear()
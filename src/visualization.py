@@ -4,18 +4,102 @@ Visualization module
 Contains functions for plotting and data visualization
 """
 
+import functools
+import os
+import re
+from typing import Optional
+
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.metrics import confusion_matrix
+
+from . import config
+from .data_processing import daily_counts
+from .metrics import confusion_matrix_counts
+
+PLOT_MODES = ('off', 'save', 'interactive')
+
+# Resolved from PLOT_MODE (and validated) on first use, see get_plot_mode
+_plot_mode = None
+
+
+def setup_plot_style(plt, sns):
+    """Configure matplotlib and seaborn styles."""
+    sns.set_style("whitegrid")
+    plt.rc("figure", autolayout=True)
+    plt.rc("axes", labelweight="bold", labelsize="large", titleweight="bold", titlepad=10)
+
+
+@functools.lru_cache(maxsize=None)
+def _plotting():
+    """Import matplotlib.pyplot and seaborn on first use and apply the plot style."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    setup_plot_style(plt, sns)
+    return plt, sns
+
+
+def set_plot_mode(mode: str):
+    """Switch the rendering mode for all plot_* functions ('off', 'save' or 'interactive')."""
+    global _plot_mode
+    if mode not in PLOT_MODES:
+        raise ValueError(f"Unknown plot mode {mode!r}, expected one of {PLOT_MODES}")
+    _plot_mode = mode
+
+
+def get_plot_mode() -> str:
+    """Current rendering mode; raises ValueError if PLOT_MODE is not one of PLOT_MODES."""
+    if _plot_mode is None:
+        set_plot_mode(config.PLOT_MODE)
+    return _plot_mode
+
+
+def _figure_path(fig) -> str:
+    """PNG path in PLOT_DIR named after the figure's title."""
+    title = fig.axes[0].get_title() if fig.axes else ''
+    name = re.sub(r'[^a-z0-9]+', '_', title.lower()).strip('_') or 'figure'
+    return os.path.join(config.PLOT_DIR, f'{name}.png')
+
+
+def rendered(plot):
+    """
+    Render a plot_* function according to the plot mode.
+
+    The wrapped function only builds the figure and returns it. In 'off'
+    mode it is not called at all; in 'save' mode the figure is written to
+    PLOT_DIR and closed; in 'interactive' mode it is shown.
+    """
+    @functools.wraps(plot)
+    def wrapper(*args, **kwargs):
+        mode = get_plot_mode()
+        if mode == 'off':
+            return None
+        fig = plot(*args, **kwargs)
+        plt, _ = _plotting()
+        if mode == 'save':
+            os.makedirs(config.PLOT_DIR, exist_ok=True)
+            path = _figure_path(fig)
+            fig.savefig(path)
+            plt.close(fig)
+            print(f"Saved figure: {path}")
+        else:
+            plt.show()
+        return fig
+    return wrapper
 
 
-def plot_confusion_matrix(y_true, y_pred, title: str = "Confusion Matrix"):
-    """Plot confusion matrix."""
+@rendered
+def plot_confusion_matrix(y_true=None, y_pred=None, title: str = "Confusion Matrix",
+                          cm: Optional[np.ndarray] = None):
+    """Plot confusion matrix (pass cm to reuse an already computed one)."""
+    if cm is None:
+        cm = confusion_matrix_counts(y_true, y_pred)
+    cm = np.asarray(cm)
+    plt, sns = _plotting()
     fig, ax = plt.subplots(figsize=(5, 5))
     labels = ['Negative', 'Neutral', 'Positive']
     ax = sns.heatmap(
-        confusion_matrix(y_true, y_pred),
+        cm,
         annot=True,
         cmap="Blues",
         fmt='g',
@@ -27,16 +111,16 @@ def plot_confusion_matrix(y_true, y_pred, title: str = "Confusion Matrix"):
     ax.yaxis.set_ticklabels(labels, fontsize=17)
     ax.set_ylabel('Test', fontsize=20)
     ax.set_xlabel('Predicted', fontsize=20)
-    plt.show()
+    return fig
 
 
+@rendered
 def plot_tweets_by_date(df: pd.DataFrame):
     """Plot tweets count by date."""
-    df['Date'] = pd.to_datetime(df['Date'])
-    tweets_per_date = df['Date'].dt.strftime('%Y-%m-%d').value_counts().sort_index().reset_index()
-    tweets_per_date.columns = ['Date', 'counts']
+    tweets_per_date = daily_counts(df)
+    plt, sns = _plotting()
 
-    plt.figure(figsize=(20, 5))
+    fig = plt.figure(figsize=(20, 5))
     ax = sns.barplot(
         x='Date',
         y='counts',
@@ -51,12 +135,14 @@ def plot_tweets_by_date(df: pd.DataFrame):
     plt.ylabel('Count')
     plt.xlabel('Date')
     plt.xticks(rotation=90)
-    plt.show()
+    return fig
 
 
+@rendered
 def plot_text_length_distribution(df: pd.DataFrame, title: str = "Text Length Distribution"):
     """Plot distribution of text lengths less than 10 words."""
-    plt.figure(figsize=(7, 5))
+    plt, sns = _plotting()
+    fig = plt.figure(figsize=(7, 5))
     ax = sns.countplot(
         x='text_len',
         data=df[df['text_len'] < 10],
@@ -67,5 +153,5 @@ def plot_text_length_distribution(df: pd.DataFrame, title: str = "Text Length Di
     ax.bar_label(ax.containers[0])
     plt.ylabel('count')
     plt.xlabel('')
-    plt.show()
+    return fig
 
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for reading a subset of the aggregate tables of src/aggregates
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src.aggregates import AGGREGATE_TABLES, load_aggregates, read_aggregates, write_aggregates
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def aggregates_dir(tmp_path):
+    tables = {name: pd.DataFrame({'name': [name], 'count': [1]}) for name in AGGREGATE_TABLES}
+    path = str(tmp_path / 'aggregates')
+    write_aggregates(tables, 'v1', path)
+    return path
+
+
+def test_read_aggregates_reads_only_requested_tables(aggregates_dir):
+    tables = read_aggregates('v1', aggregates_dir, tables=('summary', 'daily_counts'))
+    assert sorted(tables) == ['daily_counts', 'summary']
+    assert tables['summary']['name'].tolist() == ['summary']
+    assert sorted(read_aggregates('v1', aggregates_dir)) == sorted(AGGREGATE_TABLES)
+
+
+def test_read_aggregates_needs_every_table(aggregates_dir):
+    os.remove(os.path.join(aggregates_dir, 'v1', 'token_counts.arrow'))
+    assert read_aggregates('v1', aggregates_dir, tables=('summary',)) is None
+
+
+def test_load_aggregates_builds_all_tables_but_returns_the_subset(tmp_path, monkeypatch):
+    built = {name: pd.DataFrame({'name': [name]}) for name in AGGREGATE_TABLES}
+    monkeypatch.setattr('src.aggregates.dataset_version', lambda data_path: 'v1')
+    monkeypatch.setattr('src.aggregates.build_aggregates', lambda frames: built)
+    path = str(tmp_path / 'aggregates')
+
+    tables = load_aggregates('data.csv', dict, path, tables=('token_counts',))
+    assert list(tables) == ['token_counts']
+    assert sorted(read_aggregates('v1', path)) == sorted(AGGREGATE_TABLES)
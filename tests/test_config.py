@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the lazy settings of src/config: overrides made after the modules
+are imported must reach the functions that use them
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src import config
+from src.cache import CleanCache
+from src.data_processing import preprocess_data
+from src.model_store import list_versions
+from src.snapshot import pipeline_settings
+
+
+@pytest.fixture
+def override(monkeypatch):
+    """Set SENTIMEN_<NAME> environment variables and re-resolve the settings."""
+    def set_env(**values):
+        for name, value in values.items():
+            monkeypatch.setenv(config.ENV_PREFIX + name, str(value))
+        config.settings.reset()
+    yield set_env
+    monkeypatch.undo()
+    config.settings.reset()
+
+
+def test_derived_paths_follow_cache_and_models_dir(override, tmp_path):
+    override(CACHE_DIR=tmp_path / 'cache', MODELS_DIR=tmp_path / 'models')
+    with CleanCache() as cache:
+        assert cache.path == os.path.join(str(tmp_path / 'cache'), 'clean_cache.sqlite')
+    assert config.TOKENIZER_DIR == os.path.join(str(tmp_path / 'models'), config.TOKENIZER_NAME)
+    assert list_versions() == []
+
+
+def test_pipeline_reads_settings_when_called(override):
+    df = pd.DataFrame({'Text': ['satu dua tiga empat lima enam', 'satu dua tiga'],
+                       'Sentiment': ['Positive', 'Negative']})
+    override(USE_CLEAN_CACHE='false', MIN_TEXT_LENGTH=2, SEED=7)
+    train, _ = preprocess_data(df, df)
+    assert train['Text'].tolist() == df['Text'].tolist()
+    assert pipeline_settings()['seed'] == 7
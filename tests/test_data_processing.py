@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the streaming (chunked) data path of src/data_processing
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config import TOKENIZER_DIR
+from src.data_processing import (
+    compute_token_lengths, concat_chunks, in_test_split, iter_data, iter_training_chunks
+)
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'data', 'Sentiment1.csv')
+
+pytestmark = pytest.mark.skipif(not os.path.isfile(DATA_PATH), reason=f"{DATA_PATH} not found")
+
+
+def test_concat_chunks_keeps_categoricals():
+    df = concat_chunks(iter_data(DATA_PATH, chunksize=200, usecols=None))
+    full = pd.read_csv(DATA_PATH, encoding='ISO-8859-1')
+    assert isinstance(df['Username'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['Sentiment'].dtype, pd.CategoricalDtype)
+    assert df['Username'].astype(object).equals(full['Username'].astype(object))
+    assert df['Text'].equals(full['Text'])
+
+
+def test_in_test_split_does_not_depend_on_chunking():
+    texts = pd.read_csv(DATA_PATH, encoding='ISO-8859-1', usecols=['Text'])['Text'].tolist()
+    mask = in_test_split(texts, 0.2)
+    assert np.array_equal(mask, np.concatenate([in_test_split(texts[i:i + 100], 0.2)
+                                                for i in range(0, len(texts), 100)]))
+    assert 0.1 < mask.mean() < 0.3
+
+
+def test_training_chunks_are_disjoint_and_chunk_size_independent():
+    train = list(iter_training_chunks(DATA_PATH, 'train', chunksize=300))
+    test = list(iter_training_chunks(DATA_PATH, 'test', chunksize=300))
+    train_texts = np.concatenate([texts for texts, _ in train])
+    test_texts = np.concatenate([texts for texts, _ in test])
+    assert not set(train_texts) & set(test_texts)
+
+    (whole_texts, whole_labels), = iter_training_chunks(DATA_PATH, 'train', chunksize=10 ** 6)
+    assert np.array_equal(train_texts, whole_texts)
+    assert np.array_equal(np.concatenate([labels for _, labels in train]), whole_labels)
+
+
+@pytest.fixture
+def tokenizer():
+    """A private copy of the local tokenizer, so its settings can be changed freely."""
+    if not os.path.isfile(os.path.join(TOKENIZER_DIR, 'tokenizer_config.json')):
+        pytest.skip(f"no local tokenizer in {TOKENIZER_DIR}")
+    transformers = pytest.importorskip('transformers')
+    return transformers.BertTokenizerFast.from_pretrained(TOKENIZER_DIR, local_files_only=True)
+
+
+@pytest.mark.parametrize('settings', [
+    {'truncation': True, 'max_length': 5},
+    {'padding': 'max_length', 'max_length': 64},
+])
+def test_token_lengths_ignore_settings_left_on_the_tokenizer(tokenizer, settings):
+    texts = pd.read_csv(DATA_PATH, encoding='ISO-8859-1', usecols=['Text'])['Text'].tolist()[:300]
+    expected = [len(tokenizer.encode(text, max_length=512, truncation=True)) for text in texts]
+
+    # Leaves truncation / padding enabled on the shared Rust tokenizer
+    tokenizer(texts[:2], **settings)
+    assert compute_token_lengths(tokenizer, texts, batch_size=64).tolist() == expected
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for src/metrics against sklearn.metrics
+"""
+
+import numpy as np
+import pytest
+
+from src.metrics import confusion_matrix_counts, metrics_from_confusion_matrix
+
+sklearn_metrics = pytest.importorskip('sklearn.metrics')
+
+
+def _check(y_true, y_pred):
+    metrics = metrics_from_confusion_matrix(confusion_matrix_counts(y_true, y_pred))
+    assert metrics['accuracy'] == pytest.approx(sklearn_metrics.accuracy_score(y_true, y_pred))
+    for average in ('macro', 'weighted'):
+        precision, recall, f1, _ = sklearn_metrics.precision_recall_fscore_support(
+            y_true, y_pred, average=average, zero_division=0)
+        assert metrics['precision'][average] == pytest.approx(precision)
+        assert metrics['recall'][average] == pytest.approx(recall)
+        assert metrics['f1_score'][average] == pytest.approx(f1)
+
+
+def test_macro_average_skips_absent_classes():
+    _check([0, 0, 2], [0, 2, 2])
+
+
+def test_matches_sklearn_on_random_labels():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        n = rng.integers(1, 10)
+        labels = rng.choice(3, size=rng.integers(1, 4), replace=False)
+        _check(rng.choice(labels, n), rng.choice(labels, n))
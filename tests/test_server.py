@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for request validation of the scoring service (src/server)
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.server import ScoringServer
+
+LABELS = ['Negative', 'Neutral', 'Positive']
+
+
+class StubBatcher:
+    """Scores every text as Positive, without a model bundle."""
+
+    predictor = SimpleNamespace(labels=LABELS)
+
+    async def submit(self, text):
+        return 'Positive', [0.1, 0.2, 0.7]
+
+
+def predict(payload):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return asyncio.run(ScoringServer(StubBatcher())._dispatch('POST', '/predict', body))
+
+
+def test_predict_batch():
+    status, payload = predict({'texts': ['halo', 'dunia']})
+    assert status == 200
+    assert [p['label'] for p in payload['predictions']] == ['Positive', 'Positive']
+
+
+def test_predict_single():
+    status, payload = predict({'text': 'halo'})
+    assert status == 200 and payload['label'] == 'Positive'
+
+
+@pytest.mark.parametrize('payload', [
+    {'texts': 'abc'},
+    {'texts': {'a': 'b'}},
+    {'texts': ['halo', 1]},
+    {'text': 5},
+    {'foo': 'bar'},
+    ['halo'],
+    b'not json',
+])
+def test_malformed_payload_is_rejected(payload):
+    status, body = predict(payload)
+    assert status == 400 and 'error' in body
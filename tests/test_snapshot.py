@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the freshness check of src/snapshot
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src import snapshot
+from src.snapshot import SNAPSHOT_TABLES, file_hash, load_snapshot, write_snapshot
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('Text,Sentiment\nhalo dunia,Positive\n', encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, source):
+    frames = {name: pd.DataFrame({'Text': ['halo dunia'], 'Sentiment': [2]}) for name in SNAPSHOT_TABLES}
+    path = str(tmp_path / 'snapshot')
+    write_snapshot(frames, file_hash(source), path, os.stat(source))
+    return path
+
+
+def test_unchanged_source_is_not_rehashed(source, snapshot_dir, monkeypatch):
+    monkeypatch.setattr(snapshot, 'file_hash', pytest.fail)
+    frames = load_snapshot(source, snapshot_dir)
+    assert frames['train']['Text'].tolist() == ['halo dunia']
+
+
+def test_touched_source_with_same_content_is_accepted(source, snapshot_dir):
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert load_snapshot(source, snapshot_dir) is not None
+
+
+def test_modified_source_makes_snapshot_stale(source, snapshot_dir):
+    with open(source, 'a', encoding='utf-8') as f:
+        f.write('lagi,Negative\n')
+    assert load_snapshot(source, snapshot_dir) is None
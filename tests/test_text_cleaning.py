@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Golden-output tests for the single-pass TextCleaner
+clean_text must reproduce the output of the original cleaning chain
+(strip_emoji -> strip_all_entities -> clean_hashtags -> filter_chars ->
+remove_mult_spaces). fixtures/clean_text_golden.json holds [input, expected]
+pairs generated once with the baseline implementation: every distinct tweet of
+data/Sentiment1.csv plus a few edge cases
+"""
+
+import json
+import os
+
+import pytest
+
+from src import config
+from src.text_cleaning import clean_text, clean_texts
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'fixtures', 'clean_text_golden.json')
+
+
+@pytest.fixture(scope='module')
+def golden():
+    with open(GOLDEN_PATH, encoding='utf-8') as f:
+        return [tuple(pair) for pair in json.load(f)]
+
+
+def test_clean_text_matches_baseline_output(golden):
+    mismatches = [(text, expected, clean_text(text)) for text, expected in golden
+                  if clean_text(text) != expected]
+    assert not mismatches, f"{len(mismatches)} of {len(golden)} texts differ, first: {mismatches[:3]}"
+
+
+def test_clean_texts_keeps_order(golden):
+    texts = [text for text, _ in golden]
+    assert clean_texts(texts, n_jobs=1) == [expected for _, expected in golden]
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('', ''),
+    ('Halo @user cek https://t.co/abc #Pemilu2024 #AMIN', 'halo cek pemilu2024 amin'),
+    ('harga naik $100 & turun\r\nlagi', 'harga naik 100 turun lagi'),
+    ('Ã±ã¼â»§ karakter aneh', 'karakter aneh'),
+])
+def test_clean_text_edge_cases(text, expected):
+    assert clean_text(text) == expected
+
+
+def test_clean_texts_parallel_keeps_order(golden, monkeypatch):
+    # Force the process pool, also on single-core machines
+    monkeypatch.setattr(config.settings, 'CLEAN_PARALLEL_MIN_TEXTS', 0)
+    monkeypatch.setattr('src.text_cleaning.os.cpu_count', lambda: 2)
+    texts = [text for text, _ in golden]
+    assert clean_texts(texts, n_jobs=2, chunksize=50) == [expected for _, expected in golden]
+
+
+@pytest.mark.parametrize('chunksize', [0, -5])
+def test_clean_texts_rejects_non_positive_chunksize(chunksize):
+    with pytest.raises(ValueError, match='chunksize'):
+        clean_texts(['halo dunia'], n_jobs=1, chunksize=chunksize)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the word cloud index of src/token_index: the frequencies must match
+what WordCloud.generate computed from the joined texts
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.token_index import TokenFrequencyIndex, tokenize, word_cloud_frequencies
+
+wordcloud = pytest.importorskip('wordcloud')
+
+WORDS = ['prabowo', 'anies', 'ganjar', 'menang', 'debat', 'rakyat', 'cats', 'cat', 'the', 'and',
+         'dunia', "gibran's", '2024', 'x', 'pilpres', 'desa', 'balad']
+
+
+@pytest.fixture(scope='module')
+def frame():
+    rng = np.random.default_rng(0)
+    texts = []
+    for i in range(400):
+        words = list(rng.choice(WORDS, rng.integers(0, 8)))
+        if i % 3 == 0:
+            # A phrase frequent enough to become a collocation
+            words[len(words) // 2:len(words) // 2] = ['amin', 'menang']
+        texts.append(' '.join(words))
+    return pd.DataFrame({'text_clean': texts, 'Sentiment': rng.integers(0, 3, len(texts))})
+
+
+def wordcloud_frequencies(texts, max_words, stopwords):
+    """What the dashboard used to pass to WordCloud: generate on the joined texts."""
+    cloud = wordcloud.WordCloud(max_words=max_words, stopwords=stopwords)
+    counts = cloud.process_text(' '.join(texts))
+    return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True)[:max_words])
+
+
+def test_tokenize_matches_wordcloud():
+    text = "halo dunia's 2024 x1 a b don't"
+    cloud = wordcloud.WordCloud(stopwords=set(), collocations=False, normalize_plurals=False)
+    assert sorted(tokenize(text)) == sorted(cloud.process_text(text))
+
+
+@pytest.mark.parametrize('sentiment', [None, 0, 1, 2])
+@pytest.mark.parametrize('stopwords', [set(), wordcloud.STOPWORDS])
+def test_frequencies_match_wordcloud_generate(frame, sentiment, stopwords):
+    texts = frame if sentiment is None else frame[frame['Sentiment'] == sentiment]
+    index = TokenFrequencyIndex.from_frame(frame)
+    expected = wordcloud_frequencies(texts['text_clean'], 10, stopwords)
+    assert list(word_cloud_frequencies(index, sentiment, 10, stopwords).items()) == list(expected.items())
+    assert 'amin menang' in expected
+
+
+def test_incremental_add_and_table_round_trip(frame):
+    full = TokenFrequencyIndex.from_frame(frame)
+    chunked = TokenFrequencyIndex()
+    for start in range(0, len(frame), 150):
+        chunk = frame.iloc[start:start + 150]
+        chunked.add(chunk['text_clean'].values, chunk['Sentiment'].values)
+    restored = TokenFrequencyIndex.from_table(chunked.to_table())
+    for sentiment in [None, 0, 1, 2]:
+        assert restored.frequencies(sentiment) == full.frequencies(sentiment)
+        assert restored.pair_frequencies(sentiment) == full.pair_frequencies(sentiment)
+        assert list(restored.ranked(sentiment)) == list(full.ranked(sentiment))